@@ -143,7 +143,8 @@ async def streaming_with_tools_demo():
         print("🤖 Assistant: ", end="", flush=True)
         
         # This will stream the response while calling tools
-        await client.process_query("Give me a real-time analysis of Tesla's stock performance today")
+        async for chunk in client.process_query_stream("Give me a real-time analysis of Tesla's stock performance today"):
+            print(chunk, end="", flush=True)
         
         print("\n✅ Streaming with tools demo completed!")
         
@@ -213,7 +213,10 @@ class LLMService:
             "provider": self.provider_name,
             "initialized": self.is_initialized,
             "supported_providers": LLMClientFactory.get_supported_providers(),
-            "provider_detection_patterns": LLMClientFactory.get_provider_info()
+            "provider_detection_patterns": {
+                name: dict(provider_info)
+                for name, provider_info in LLMClientFactory.get_provider_info().items()
+            }
         }
         
         if self.client:
@@ -1,16 +1,38 @@
+from typing import TYPE_CHECKING
+
 from .clients import (
-    AnthropicClient, PersistentAnthropicClient, 
-    GeminiClient, PersistentGeminiClient, 
-    OpenAiClient, PersistentOpenAiClient,
     BaseLLMClient, BasePersistentLLMClient,
-    LLMClientFactory, LLMProvider
+    LLMClientFactory, LLMProvider,
+    BatchProcessor
 )
 
+if TYPE_CHECKING:
+    from .clients import (
+        AnthropicClient, PersistentAnthropicClient, 
+        GeminiClient, PersistentGeminiClient, 
+        OpenAiClient, PersistentOpenAiClient
+    )
+
 __version__ = "1.0.0-pre14"
 __all__ = [
     "AnthropicClient", "PersistentAnthropicClient", 
     "GeminiClient", "PersistentGeminiClient", 
     "OpenAiClient", "PersistentOpenAiClient",
     "BaseLLMClient", "BasePersistentLLMClient",
-    "LLMClientFactory", "LLMProvider"
+    "LLMClientFactory", "LLMProvider",
+    "BatchProcessor"
 ]
+
+
+def __getattr__(name):
+    # Provider client classes are resolved lazily by the clients package
+    if name in __all__:
+        from . import clients
+        value = getattr(clients, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
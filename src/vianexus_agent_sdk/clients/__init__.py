@@ -1,13 +1,43 @@
-from .anthropic_client import AnthropicClient, PersistentAnthropicClient
-from .gemini_client import GeminiClient, PersistentGeminiClient
-from .openai_client import OpenAiClient, PersistentOpenAiClient
+import importlib
+from typing import TYPE_CHECKING
+
 from .base_llm_client import BaseLLMClient, BasePersistentLLMClient
 from .llm_client_factory import LLMClientFactory, LLMProvider
+from .batch_processor import BatchProcessor
+
+if TYPE_CHECKING:
+    from .anthropic_client import AnthropicClient, PersistentAnthropicClient
+    from .gemini_client import GeminiClient, PersistentGeminiClient
+    from .openai_client import OpenAiClient, PersistentOpenAiClient
+
+# Provider clients import their vendor SDKs, so they are loaded on first access
+_LAZY_CLIENTS = {
+    "AnthropicClient": ".anthropic_client",
+    "PersistentAnthropicClient": ".anthropic_client",
+    "GeminiClient": ".gemini_client",
+    "PersistentGeminiClient": ".gemini_client",
+    "OpenAiClient": ".openai_client",
+    "PersistentOpenAiClient": ".openai_client",
+}
 
 __all__ = [
     "AnthropicClient", "PersistentAnthropicClient", 
     "GeminiClient", "PersistentGeminiClient", 
     "OpenAiClient", "PersistentOpenAiClient",
     "BaseLLMClient", "BasePersistentLLMClient",
-    "LLMClientFactory", "LLMProvider"
+    "LLMClientFactory", "LLMProvider",
+    "BatchProcessor"
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_CLIENTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,12 @@
 """
 AnthropicClient implementation with universal memory management support.
 """
+import asyncio
 import logging
 import json
 import re
 import ast
+import time
 from contextlib import AsyncExitStack
 from typing import Optional
 
@@ -16,7 +18,7 @@ except ImportError:
 from vianexus_agent_sdk.mcp_client.enhanced_mcp_client import EnhancedMCPClient
 from vianexus_agent_sdk.memory import ConversationMemoryMixin, BaseMemoryStore
 from vianexus_agent_sdk.memory.stores.memory_memory import InMemoryStore
-from .base_llm_client import BaseLLMClient, BasePersistentLLMClient
+from .base_llm_client import BaseLLMClient, BasePersistentLLMClient, _is_task_boundary_error
 
 from anthropic import AsyncAnthropic
 from anthropic.types.tool_use_block import ToolUseBlock
@@ -878,6 +880,13 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
         self._mcp_session_id = None
         self._connection_task_group = None
         self._connection_task = None
+        # Monotonic time of the last successful health check; checks within
+        # the TTL reuse that result instead of probing the server again
+        self._last_health_check: float = 0.0
+        self._health_ttl: float = config.get("health_check_ttl", 5.0)
+        # Serializes establish_persistent_connection so concurrent callers
+        # share one reconnect instead of each opening a connection
+        self._reconnect_lock = asyncio.Lock()
         
         # For persistent clients, we can eagerly initialize the memory session
         # since they're typically used for longer-running conversations
@@ -909,7 +918,7 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
         return self.memory_session_id
     
     async def _verify_connection_health(self) -> bool:
-        """Verify that the persistent connection is still healthy."""
+        """Probe the persistent connection with a round-trip to the server."""
         if not self._connection_active or not self._mcp_session_id:
             logging.debug("Connection not active or no MCP session ID")
             return False
@@ -919,77 +928,94 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
             return False
         
         try:
-            # Try to list tools as a health check
-            await self.session.list_tools()
+            # Ping is the cheapest liveness probe; fall back to listing tools
+            if hasattr(self.session, 'send_ping'):
+                await self.session.send_ping()
+            else:
+                await self.session.list_tools()
+            self._last_health_check = time.monotonic()
             logging.debug("Connection health check passed")
             return True
         except Exception as e:
             logging.warning(f"Connection health check failed: {e}")
             # Mark connection as inactive
             self._connection_active = False
+            self._last_health_check = 0.0
             return False
     
+    async def _verify_connection_health_cached(self) -> bool:
+        """Verify the persistent connection, skipping the probe if it passed within health_check_ttl seconds."""
+        if (
+            self._connection_active
+            and self._mcp_session_id
+            and self.session
+            and time.monotonic() - self._last_health_check < self._health_ttl
+        ):
+            return True
+        return await self._verify_connection_health()
+    
     async def establish_persistent_connection(self) -> str:
         """Establish and maintain a persistent MCP connection."""
-        # First check if existing connection is still healthy
-        if self._connection_active and self._mcp_session_id:
-            if await self._verify_connection_health():
-                logging.debug(f"Reusing healthy persistent connection: {self._mcp_session_id}")
-                return self._mcp_session_id
-            else:
-                logging.info("Existing connection unhealthy, re-establishing...")
-                await self.close_persistent_connection()
-            
-        try:
-            # Ensure auth layer is set up first
-            if not await self.setup_connection():
-                raise RuntimeError("Failed to setup connection")
-            
-            # Set up the connection context that will stay open
-            self._connection_context = await self._persistent_exit_stack.enter_async_context(
-                self.connection_manager.connection_context()
-            )
-            
-            readstream, writestream, get_session_id = self._connection_context
-            
-            # Set the streams on the client
-            self.readstream = readstream
-            self.writestream = writestream
-            
-            # Connect to the MCP server
-            if not await self.connect_to_server():
-                raise RuntimeError("Failed to initialize MCP session")
-            
-            # Get the session ID from the connection
+        # Callers that waited for the lock find the connection another caller
+        # just established and reuse it through the health check below
+        async with self._reconnect_lock:
+            # First check if existing connection is still healthy
+            if self._connection_active and self._mcp_session_id:
+                if await self._verify_connection_health_cached():
+                    logging.debug("Reusing healthy persistent connection: %s", self._mcp_session_id)
+                    return self._mcp_session_id
+                else:
+                    logging.info("Existing connection unhealthy, re-establishing...")
+                    await self.close_persistent_connection()
+                
             try:
+                # Ensure auth layer is set up first
+                if not await self.setup_connection():
+                    raise RuntimeError("Failed to setup connection")
+                
+                # Set up the connection context that will stay open
+                self._connection_context = await self._persistent_exit_stack.enter_async_context(
+                    self.connection_manager.connection_context()
+                )
+                
+                readstream, writestream, get_session_id = self._connection_context
+                
+                # Set the streams on the client
+                self.readstream = readstream
+                self.writestream = writestream
+                
+                # Connect to the MCP server
+                if not await self.connect_to_server():
+                    raise RuntimeError("Failed to initialize MCP session")
+                
+                # Get the session ID from the connection
                 mcp_session_id = get_session_id() if get_session_id else None
                 if not mcp_session_id:
                     raise RuntimeError("Failed to get MCP session ID")
                 
                 self._mcp_session_id = str(mcp_session_id)
                 self._connection_active = True
-                logging.info(f"Established persistent MCP connection: {self._mcp_session_id}")
+                logging.info("Established persistent MCP connection: %s", self._mcp_session_id)
                 
                 return self._mcp_session_id
                 
             except Exception as e:
-                raise RuntimeError(f"Failed to get MCP session ID: {e}")
-                
-        except Exception as e:
-            logging.error(f"Error establishing persistent MCP connection: {e}")
-            await self.close_persistent_connection()
-            raise RuntimeError(f"Failed to establish persistent MCP connection: {e}")
+                logging.error(f"Error establishing persistent MCP connection: {e}")
+                await self.close_persistent_connection()
+                raise RuntimeError(f"Failed to establish persistent MCP connection: {e}")
     
     async def close_persistent_connection(self):
         """Close the persistent MCP connection."""
         try:
             if self._persistent_exit_stack:
                 # Try to close the exit stack gracefully
+                closed = False
                 try:
                     await self._persistent_exit_stack.aclose()
+                    closed = True
                     logging.debug("Successfully closed persistent exit stack")
                 except RuntimeError as e:
-                    if "different task" in str(e) or "cancel scope" in str(e):
+                    if _is_task_boundary_error(e):
                         # This is expected when closing across task boundaries
                         # The resources are likely already cleaned up by the connection context manager
                         logging.debug(f"Exit stack cleanup skipped due to task boundary: {e}")
@@ -998,8 +1024,10 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
                 except Exception as e:
                     logging.warning(f"Error closing exit stack: {e}")
                 
-                # Always create a fresh exit stack for future connections
-                self._persistent_exit_stack = AsyncExitStack()
+                # A cleanly closed stack is empty and can be reused for the next
+                # connection; only a failed close may leave callbacks behind
+                if not closed:
+                    self._persistent_exit_stack = AsyncExitStack()
             
             # Reset connection state
             self._connection_active = False
@@ -1007,14 +1035,10 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
             self._connection_context = None
             self._connection_task_group = None
             self._connection_task = None
+            self._last_health_check = 0.0
             
-            # Force cleanup of any remaining session resources
-            if hasattr(self, 'session') and self.session:
-                try:
-                    # The session should be cleaned up by the exit stack, but just in case
-                    self.session = None
-                except Exception as e:
-                    logging.debug(f"Error clearing session reference: {e}")
+            # The session is cleaned up with the connection; drop the stale reference
+            self.session = None
             
             logging.info("Closed persistent MCP connection")
         except Exception as e:
@@ -1028,9 +1052,7 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
     @property
     def is_connected(self) -> bool:
         """Check if the persistent connection is active."""
-        is_active = self._connection_active and self._mcp_session_id is not None
-        logging.debug(f"Connection status check: active={self._connection_active}, mcp_session_id={self._mcp_session_id}, result={is_active}")
-        return is_active
+        return self._connection_active and self._mcp_session_id is not None
     
     async def ask_with_persistent_session(
         self, 
@@ -1051,17 +1073,14 @@ class PersistentAnthropicClient(BasePersistentLLMClient, AnthropicClient):
         Returns:
             The response as a string
         """
-        # Check connection health and auto-establish if needed
+        # establish_persistent_connection checks health itself and reuses a healthy connection
         if auto_establish_connection:
-            if not self.is_connected or not await self._verify_connection_health():
-                try:
-                    mcp_session_id = await self.establish_persistent_connection()
-                    logging.info(f"Established persistent MCP connection: {mcp_session_id}")
-                except Exception as e:
-                    logging.error(f"Failed to establish MCP connection: {e}")
-                    raise RuntimeError(f"Could not establish persistent MCP connection: {e}")
-        
-        if not self.is_connected:
+            try:
+                await self.establish_persistent_connection()
+            except Exception as e:
+                logging.error(f"Failed to establish MCP connection: {e}")
+                raise RuntimeError(f"Could not establish persistent MCP connection: {e}")
+        elif not self.is_connected:
             raise RuntimeError("No persistent MCP connection available. Call establish_persistent_connection() first or set auto_establish_connection=True")
         
         if not self.session:
@@ -7,6 +7,24 @@ from typing import Optional, Dict, Any
 from vianexus_agent_sdk.memory import BaseMemoryStore
 import logging
 
+# Fragments of the RuntimeError anyio raises when a connection's cancel scope is
+# exited from a different task than the one that entered it
+_TASK_BOUNDARY_MARKERS = ("different task", "cancel scope")
+
+
+def _is_task_boundary_error(error: RuntimeError) -> bool:
+    """
+    Check whether a connection close failed only because it crossed task boundaries.
+    
+    Args:
+        error: RuntimeError raised while closing the connection
+        
+    Returns:
+        True if the error is the expected cross-task cancel scope error
+    """
+    message = str(error)
+    return any(marker in message for marker in _TASK_BOUNDARY_MARKERS)
+
 
 class BaseLLMClient(ABC):
     """
@@ -0,0 +1,149 @@
+"""
+Concurrent batch execution of independent questions against a single LLM client.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Union
+
+from .base_llm_client import BasePersistentLLMClient
+
+# A batch task is either an instruction prepended to every input, or a coroutine
+# function that receives the client and one input and returns the answer
+BatchTask = Union[str, Callable[[BasePersistentLLMClient, Any], Awaitable[Any]]]
+
+
+class BatchProcessor:
+    """
+    Run many independent questions through one persistent client.
+
+    All inputs share a single MCP connection and are submitted up front, then
+    gathered; a semaphore caps how many are in flight and an optional rate
+    limit spaces out request starts. Each input is answered with
+    ask_single_question, so no conversation history is shared between inputs.
+
+    Per-question client state is not supported: inputs run concurrently on the
+    same client instance, so state such as PersistentAnthropicClient's
+    last_artifacts is cleared and appended to by every in-flight input and
+    does not belong to any single result. Only the value returned for an
+    input is specific to it.
+
+    Provider batch endpoints (OpenAI batches, Anthropic message batches, Gemini
+    batch prediction) are not used: they cannot call back into MCP tools, which
+    every question answered by these clients may need.
+
+    Usage:
+        processor = LLMClientFactory.create_batch_processor(config, max_concurrency=5)
+        async with processor:
+            results = await processor.run_batch("Classify the sentiment of:", headlines)
+    """
+
+    def __init__(
+        self,
+        client: BasePersistentLLMClient,
+        max_concurrency: int = 10,
+        rate_limit: Optional[float] = None
+    ):
+        """
+        Initialize the batch processor.
+
+        Args:
+            client: Persistent LLM client used for every input
+            max_concurrency: Maximum number of inputs processed at the same time
+            rate_limit: Maximum number of inputs started per minute (None for no limit)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self._min_interval = 60.0 / rate_limit if rate_limit else 0.0
+        self._next_start = 0.0
+        self._rate_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "BatchProcessor":
+        await self.client.establish_persistent_connection()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.client.close_persistent_connection()
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Delay the caller until the next request start is allowed by the rate limit."""
+        if not self._min_interval:
+            return
+
+        async with self._rate_lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _run_one(self, task: BatchTask, item: Any) -> Any:
+        """Answer a single input with the batch task."""
+        if isinstance(task, str):
+            return await self.client.ask_single_question(f"{task}\n\n{item}")
+        return await task(self.client, item)
+
+    async def run_batch(
+        self,
+        task: BatchTask,
+        inputs: Sequence[Any],
+        on_progress: Optional[Callable[[int, int], Any]] = None
+    ) -> List[Any]:
+        """
+        Process every input concurrently and return the results in input order.
+
+        The persistent connection is established for the duration of the call
+        if it is not already open.
+
+        Args:
+            task: Instruction prepended to each input, or a coroutine function
+                called as task(client, item)
+            inputs: Independent inputs to process
+            on_progress: Optional callback invoked as on_progress(completed, total)
+                after each input finishes
+
+        Returns:
+            One result per input; an input that failed holds its exception instead
+        """
+        total = len(inputs)
+        if not total:
+            return []
+
+        opened_connection = not self.client.is_connected
+        if opened_connection:
+            await self.client.establish_persistent_connection()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+
+        async def run(item: Any) -> Any:
+            nonlocal completed
+            async with semaphore:
+                await self._wait_for_rate_limit()
+                try:
+                    return await self._run_one(task, item)
+                finally:
+                    completed += 1
+                    if on_progress is not None:
+                        try:
+                            on_progress(completed, total)
+                        except Exception as e:
+                            logging.warning("Batch progress callback failed: %s", e)
+
+        try:
+            results = await asyncio.gather(*[run(item) for item in inputs], return_exceptions=True)
+        finally:
+            if opened_connection:
+                await self.client.close_persistent_connection()
+
+        failures = sum(isinstance(result, BaseException) for result in results)
+        if failures:
+            logging.warning("Batch finished with %d of %d inputs failed", failures, total)
+        return results
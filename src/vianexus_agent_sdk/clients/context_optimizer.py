@@ -0,0 +1,184 @@
+"""
+Context window optimizers for Gemini conversation history.
+
+An optimizer shrinks the history sent with each generate_content call once its
+estimated size passes a token budget. Function-call turns and the function
+responses that answer them are treated as one unit, so a strategy never sends
+a response without its call, or a call without the user turn that prompted it
+(both of which the Gemini API rejects).
+
+Optimizers never modify the history they are given; they return the list of
+Content objects to send and a dict of statistics.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+# Rough characters-per-token ratio used for budget estimates
+CHARS_PER_TOKEN = 4
+
+
+def _parts(message: Any) -> list:
+    return getattr(message, "parts", None) or []
+
+
+def _has_function_response(message: Any) -> bool:
+    return any(getattr(part, "function_response", None) for part in _parts(message))
+
+
+def _is_user_turn(message: Any) -> bool:
+    """Whether a message is a plain user turn (not a function response)."""
+    return getattr(message, "role", None) == "user" and not _has_function_response(message)
+
+
+def estimate_tokens(messages: List[Any]) -> int:
+    """
+    Estimate the prompt tokens used by a list of Gemini Content objects.
+
+    Args:
+        messages: Conversation history
+
+    Returns:
+        Approximate token count (characters / CHARS_PER_TOKEN)
+    """
+    chars = 0
+    for message in messages:
+        for part in _parts(message):
+            text = getattr(part, "text", None)
+            if text:
+                chars += len(text)
+                continue
+            function_call = getattr(part, "function_call", None)
+            if function_call:
+                chars += len(str(function_call.args or ""))
+                continue
+            function_response = getattr(part, "function_response", None)
+            if function_response:
+                chars += len(str(function_response.response or ""))
+    return chars // CHARS_PER_TOKEN
+
+
+def _stats(strategy: str, original: List[Any], optimized: List[Any], original_tokens: int) -> Dict[str, Any]:
+    return {
+        "strategy": strategy,
+        "optimized": optimized is not original,
+        "original_messages": len(original),
+        "kept_messages": len(optimized),
+        "original_tokens": original_tokens,
+        "estimated_tokens": estimate_tokens(optimized) if optimized is not original else original_tokens,
+    }
+
+
+class SlidingWindowOptimizer:
+    """Send only the most recent messages once the history exceeds the token budget."""
+
+    def __init__(self, keep_recent: int = 8):
+        """
+        Initialize the optimizer.
+
+        Args:
+            keep_recent: Number of most recent messages to keep (extended backwards
+                when needed so the window opens on a plain user turn)
+        """
+        self.keep_recent = keep_recent
+
+    def optimize(
+        self,
+        messages: List[Any],
+        target_tokens: Optional[int] = None
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Window the history if it is over budget.
+
+        Args:
+            messages: Conversation history
+            target_tokens: Token budget; None applies the window unconditionally
+
+        Returns:
+            Tuple of (messages to send, statistics)
+        """
+        original_tokens = estimate_tokens(messages)
+        if (target_tokens is not None and original_tokens <= target_tokens) or len(messages) <= self.keep_recent:
+            return messages, _stats("sliding_window", messages, messages, original_tokens)
+
+        start = len(messages) - self.keep_recent
+        # Open the window on a plain user turn: starting on a function response
+        # cuts off its call, and starting on a model function call cuts off the
+        # user turn it follows
+        while start > 0 and not _is_user_turn(messages[start]):
+            start -= 1
+
+        optimized = messages[start:]
+        return optimized, _stats("sliding_window", messages, optimized, original_tokens)
+
+
+class PruneToolsOptimizer:
+    """Truncate large function responses outside the most recent messages."""
+
+    def __init__(self, protect_recent: int = 5, max_output_tokens: int = 500):
+        """
+        Initialize the optimizer.
+
+        Args:
+            protect_recent: Number of most recent messages whose tool output is left intact
+            max_output_tokens: Size older function responses are cut down to
+        """
+        self.protect_recent = protect_recent
+        self.max_output_tokens = max_output_tokens
+
+    def optimize(
+        self,
+        messages: List[Any],
+        target_tokens: Optional[int] = None
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Prune old tool output if the history is over budget.
+
+        Calls and responses are kept in place (only their payloads shrink),
+        so call/response pairing is always preserved.
+
+        Args:
+            messages: Conversation history
+            target_tokens: Token budget; None prunes unconditionally
+
+        Returns:
+            Tuple of (messages to send, statistics)
+        """
+        original_tokens = estimate_tokens(messages)
+        if target_tokens is not None and original_tokens <= target_tokens:
+            return messages, _stats("prune_tools", messages, messages, original_tokens)
+
+        max_chars = self.max_output_tokens * CHARS_PER_TOKEN
+        cutoff = max(0, len(messages) - self.protect_recent)
+        optimized = list(messages)
+        pruned = False
+
+        for index in range(cutoff):
+            message = messages[index]
+            if not _has_function_response(message):
+                continue
+
+            new_parts = []
+            changed = False
+            for part in _parts(message):
+                function_response = getattr(part, "function_response", None)
+                payload = str(function_response.response or "") if function_response else ""
+                if len(payload) > max_chars:
+                    pruned_response = function_response.model_copy(
+                        update={"response": {"result": payload[:max_chars] + "... [truncated]"}}
+                    )
+                    part = part.model_copy(update={"function_response": pruned_response})
+                    changed = True
+                new_parts.append(part)
+            if changed:
+                optimized[index] = message.model_copy(update={"parts": new_parts})
+                pruned = True
+
+        if not pruned:
+            return messages, _stats("prune_tools", messages, messages, original_tokens)
+        return optimized, _stats("prune_tools", messages, optimized, original_tokens)
+
+
+# Strategies selectable by name through the `context_optimizer` client config option
+OPTIMIZERS = {
+    "sliding_window": SlidingWindowOptimizer,
+    "prune_tools": PruneToolsOptimizer,
+}
@@ -2,25 +2,143 @@
 Gemini Client implementation with universal memory management support.
 """
 import asyncio
+import hashlib
 import json
 import logging
-import base64
-from contextlib import AsyncExitStack
-from google import genai
-from typing import Any, Dict, List, Optional
+import time
+import weakref
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
 try:
     import jwt as jwt_lib
 except ImportError:
     jwt_lib = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from vianexus_agent_sdk.mcp_client.enhanced_mcp_client import EnhancedMCPClient
 from vianexus_agent_sdk.memory import ConversationMemoryMixin, BaseMemoryStore
 from vianexus_agent_sdk.memory.stores.memory_memory import InMemoryStore
-from .base_llm_client import BaseLLMClient, BasePersistentLLMClient
+from .base_llm_client import BaseLLMClient, BasePersistentLLMClient, _is_task_boundary_error
+from .response_cache import InMemoryResponseCache
+from .context_optimizer import OPTIMIZERS
+
+if TYPE_CHECKING:
+    from google import genai
+else:
+    # google.genai is heavy to import; it is loaded when the first GeminiClient is created
+    genai = None
 
 # Default financial system prompt constant (matching other clients)
 DEFAULT_FINANCIAL_SYSTEM_PROMPT = """You are a skilled Financial Analyst. You will use the tools provided to you to answer the question. You will only use the tools provided to you and not any other tools that are not provided to you. Use the `search` tool to find the appropriate dataset for the question. Use the `fetch` tool to fetch the data from the dataset."""
 
 
+# Supported fields in Gemini's function declaration schema
+_GEMINI_SCHEMA_KEYS = frozenset({'type', 'description', 'required', 'properties', 'items', 'enum'})
+
+
+def _queue_schema_properties(value: Any, worklist: list) -> Any:
+    """Queue nested property schemas for conversion, returning their placeholder dicts."""
+    if not isinstance(value, dict):
+        return value
+    properties = {}
+    for prop_name, prop_schema in value.items():
+        if isinstance(prop_schema, dict):
+            properties[prop_name] = converted = {}
+            worklist.append((prop_schema, converted))
+        else:
+            properties[prop_name] = {"type": "object", "properties": {}, "required": []}
+    return properties
+
+
+def _queue_schema_items(value: Any, worklist: list) -> Any:
+    """Queue the array items schema for conversion, returning its placeholder dict."""
+    if not isinstance(value, dict):
+        return value
+    converted = {}
+    worklist.append((value, converted))
+    return converted
+
+
+def _normalize_schema_required(value: Any, worklist: list) -> Any:
+    """Ensure required is a list of strings."""
+    if not isinstance(value, list):
+        return value
+    return [str(item) for item in value]
+
+
+# Keys whose values need more than a plain copy when converting schemas for Gemini
+_GEMINI_SCHEMA_KEY_HANDLERS = {
+    'properties': _queue_schema_properties,
+    'items': _queue_schema_items,
+    'required': _normalize_schema_required,
+}
+
+
+def _load_genai():
+    """Import google.genai on first use and bind it to the module-level `genai` name."""
+    global genai
+    if genai is None:
+        from google import genai as genai_module
+        genai = genai_module
+    return genai
+
+
+def _build_http_options(http_pool: dict) -> 'genai.types.HttpOptions':
+    """
+    Build genai HttpOptions from the `http_pool` client config option.
+    
+    Args:
+        http_pool: Dict with optional `max_connections` (default 100),
+            `max_keepalive_connections` (default 50) and `timeout` (seconds)
+            
+    Returns:
+        HttpOptions whose async httpx client keeps a bounded pool of connections alive
+    """
+    import httpx
+    
+    limits = httpx.Limits(
+        max_connections=http_pool.get("max_connections", 100),
+        max_keepalive_connections=http_pool.get("max_keepalive_connections", 50)
+    )
+    timeout = http_pool.get("timeout")
+    return genai.types.HttpOptions(
+        # HttpOptions takes the timeout in milliseconds
+        timeout=int(timeout * 1000) if timeout is not None else None,
+        async_client_args={"limits": limits}
+    )
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to JSON, using orjson when installed (the optional `fast` extra)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+def _extract_tool_text(payload: Any) -> str:
+    """
+    Flatten an MCP tool result payload into the text sent back to Gemini.
+    
+    Args:
+        payload: The `content` of a CallToolResult - normally a list of content blocks
+        
+    Returns:
+        The joined text of all text blocks, the payload itself for strings, or a JSON
+        rendering for anything else
+    """
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, list):
+        if not payload:
+            return "No content returned"
+        text = ''.join(p.text for p in payload if hasattr(p, 'text'))
+        # Non-text blocks only (e.g. images): fall back to describing the first one
+        return text or str(payload[0])
+    return _dumps(payload)
+
+
 class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
     """
     Gemini Client with universal memory management support.
@@ -53,6 +171,63 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
     - Tool calls use function_call format in parts
     """
     
+    # genai.Client instances shared by GeminiClients with the same API key and pool
+    # settings, per event loop: each loop gets its own LRU of at most
+    # _CLIENT_CACHE_SIZE clients, dropped when the loop is garbage collected
+    _CLIENT_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict]" = weakref.WeakKeyDictionary()
+    _CLIENT_CACHE_SIZE = 8
+    
+    @classmethod
+    def _get_genai_client(cls, api_key: Optional[str], http_pool: Optional[dict] = None) -> 'genai.Client':
+        """
+        Return the shared genai.Client for an API key, creating it on first use.
+        
+        Credentials live on each genai.Client (there is no process-global
+        configure step), so clients with the same key can safely share one
+        instance and its HTTP connection pool. The async pool is bound to the
+        loop that first uses it, so clients are only shared within the running
+        event loop; a client created outside a loop gets its own genai.Client.
+        Keys hold a hash of the API key, not the key itself. Creation never
+        awaits, so two coroutines cannot race to build the same client.
+        
+        Args:
+            api_key: The Gemini API key (None lets the SDK read it from the environment)
+            http_pool: Optional connection pool settings, see _build_http_options()
+            
+        Returns:
+            The cached genai.Client for this key, pool configuration and event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return cls._create_genai_client(api_key, http_pool)
+        
+        key = (
+            hashlib.sha256(api_key.encode()).digest() if api_key else None,
+            tuple(sorted((http_pool or {}).items())),
+        )
+        loop_clients = GeminiClient._CLIENT_CACHE.get(loop)
+        if loop_clients is None:
+            loop_clients = GeminiClient._CLIENT_CACHE[loop] = OrderedDict()
+        
+        client = loop_clients.get(key)
+        if client is None:
+            client = cls._create_genai_client(api_key, http_pool)
+            loop_clients[key] = client
+            while len(loop_clients) > GeminiClient._CLIENT_CACHE_SIZE:
+                loop_clients.popitem(last=False)
+        else:
+            loop_clients.move_to_end(key)
+        return client
+    
+    @staticmethod
+    def _create_genai_client(api_key: Optional[str], http_pool: Optional[dict] = None) -> 'genai.Client':
+        """Create a genai.Client, applying the connection pool settings if given."""
+        genai_module = _load_genai()
+        if not http_pool:
+            return genai_module.Client(api_key=api_key)
+        return genai_module.Client(api_key=api_key, http_options=_build_http_options(http_pool))
+    
     @staticmethod
     def _extract_system_prompt_from_jwt(jwt_token: str, verify_signature: bool = False) -> Optional[str]:
         """
@@ -76,6 +251,7 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         if jwt_lib is None:
             logging.warning("PyJWT library not available, falling back to basic parsing")
             # Fallback to basic parsing if PyJWT is not available
+            import base64
             try:
                 parts = jwt_token.split('.')
                 if len(parts) != 3:
@@ -83,11 +259,10 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                     return None
                 
                 payload_b64 = parts[1]
-                padding = '=' * (4 - len(payload_b64) % 4)
-                payload_b64 += padding
+                payload_b64 += '=' * (-len(payload_b64) % 4)
                 
-                payload_bytes = base64.urlsafe_b64decode(payload_b64)
-                payload = json.loads(payload_bytes.decode('utf-8'))
+                # json.loads accepts the decoded UTF-8 bytes directly
+                payload = json.loads(base64.urlsafe_b64decode(payload_b64))
             except (ValueError, json.JSONDecodeError, KeyError, IndexError) as e:
                 logging.warning(f"Could not parse JWT with fallback method: {e}")
                 return None
@@ -313,11 +488,38 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             self._exit_stack = AsyncExitStack()
         
         # Gemini-specific configuration
-        self.client = genai.Client(api_key=config.get("LLM_API_KEY"))
+        _load_genai()
+        if config.get("share_genai_client", True):
+            self.client = self._get_genai_client(config.get("LLM_API_KEY"), config.get("http_pool"))
+        else:
+            self.client = self._create_genai_client(config.get("LLM_API_KEY"), config.get("http_pool"))
         self._model_name = config.get("LLM_MODEL", "gemini-2.5-flash")
         self.max_tokens = config.get("max_tokens", 1000)
-        self.messages = []  # Local message cache
+        self.temperature = config.get("temperature", 0.7)
         self.max_history_length = config.get("max_history_length", 50)
+        # Local message cache; the bounded deque drops the oldest turns as new ones arrive
+        self.messages = deque(maxlen=self.max_history_length)
+        # Run the function calls of a single model turn concurrently
+        self.run_tools_concurrently = config.get("run_tools_concurrently", True)
+        # Optional cache of final answers, only consulted when sampling is deterministic
+        self._response_cache = self._resolve_response_cache(config)
+        self.response_cache_stats = {"hits": 0, "misses": 0}
+        # Gemini explicit context caching of the tool declarations and system instruction
+        self.context_cache_enabled = config.get("context_cache", False)
+        self.context_cache_ttl = config.get("context_cache_ttl", 300)
+        self._context_cache_name = None
+        self._context_cache_key = None
+        self._context_cache_expires = 0.0
+        # Optional context window optimizer applied to the history before each request
+        self.optimizer = self._resolve_context_optimizer(config.get("context_optimizer"))
+        self.context_target_tokens = config.get("context_target_tokens", 32000)
+        # Gemini Tool built from the MCP tool listing, reused for tools_ttl seconds or until invalidated
+        self._cached_tools = None
+        self._tools_cache_ts = 0.0
+        self.tools_ttl = config.get("tools_cache_ttl", 300)
+        # GenerateContentConfig reused while tools, max_tokens and system prompt are unchanged
+        self._generation_config = None
+        self._generation_config_key = None
         
         # Determine system prompt priority: config > JWT > default
         self.system_prompt = config.get("system_prompt")
@@ -336,54 +538,341 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             self.system_prompt = DEFAULT_FINANCIAL_SYSTEM_PROMPT
             logging.debug("Using default financial system prompt")
     
-    async def _get_available_tools(self) -> Optional[genai.types.Tool]:
-        """Get list of available MCP tools formatted for Gemini API."""
+    async def _get_available_tools(self) -> Optional['genai.types.Tool']:
+        """
+        Get list of available MCP tools formatted for Gemini API.
+        
+        The converted Tool (including the sanitized schemas) is cached for
+        tools_ttl seconds (`tools_cache_ttl` config, default 300) so repeated
+        queries skip both the list_tools() round-trip and the schema conversion;
+        call invalidate_tools_cache() to force a refresh, e.g. after the MCP
+        server reloads its tools.
+        """
         if not self.session:
             return None
         
+        if self._cached_tools is not None and time.monotonic() - self._tools_cache_ts < self.tools_ttl:
+            return self._cached_tools
+        
         try:
             tool_list = await self.session.list_tools()
-            if not tool_list.tools:
-                return None
+            self._store_tools_cache(tool_list)
+            return self._cached_tools
             
-            logging.debug(f"Retrieved {len(tool_list.tools)} tools from MCP server")
-            formatted_tools = []
-            for tool in tool_list.tools:
-                # Convert MCP tool schema to Gemini format
-                schema = getattr(tool, "inputSchema", None)
-                if schema:
-                    gemini_schema = self._convert_schema_for_gemini(schema)
-                else:
-                    # Fallback schema for tools without proper schema
-                    gemini_schema = {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                
-                formatted_tool = {
-                    "name": tool.name,
-                    "description": tool.description or f"Tool: {tool.name}",
-                    "parameters": gemini_schema
+        except Exception as e:
+            logging.error(f"Error listing tools: {e}")
+            return None
+    
+    def _build_gemini_tool(self, tool_list) -> Optional['genai.types.Tool']:
+        """
+        Convert an MCP list_tools() result into a Gemini Tool.
+        
+        Args:
+            tool_list: The result of session.list_tools()
+            
+        Returns:
+            A Tool holding one FunctionDeclaration per MCP tool, or None if the server has no tools
+        """
+        if not tool_list.tools:
+            return None
+        
+        logging.debug(f"Retrieved {len(tool_list.tools)} tools from MCP server")
+        function_declarations = []
+        for tool in tool_list.tools:
+            # Convert MCP tool schema to Gemini format
+            schema = getattr(tool, "inputSchema", None)
+            if schema:
+                gemini_schema = self._convert_schema_for_gemini(schema)
+            else:
+                # Fallback schema for tools without proper schema
+                gemini_schema = {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
                 }
-                formatted_tools.append(formatted_tool)
             
-            return genai.types.Tool(function_declarations=formatted_tools)
+            function_declarations.append(genai.types.FunctionDeclaration(
+                name=tool.name,
+                description=tool.description or f"Tool: {tool.name}",
+                parameters=gemini_schema
+            ))
+        
+        return genai.types.Tool(function_declarations=function_declarations)
+    
+    def _get_generation_config(
+        self,
+        tools: Optional['genai.types.Tool'],
+        cached_content: Optional[str] = None
+    ) -> 'genai.types.GenerateContentConfig':
+        """
+        Return the GenerateContentConfig for a request, building it only when its inputs change.
+        
+        Args:
+            tools: The Gemini Tool to offer the model, or None
+            cached_content: Name of a Gemini context cache holding the tools and
+                system instruction; when given they are not sent inline
+            
+        Returns:
+            A config shared by all requests with the same tools, max_tokens, system prompt,
+            temperature and context cache
+        """
+        key = (tools, self.max_tokens, self.system_prompt, self.temperature, cached_content)
+        if self._generation_config is None or self._generation_config_key != key:
+            if cached_content:
+                self._generation_config = genai.types.GenerateContentConfig(
+                    temperature=self.temperature,
+                    max_output_tokens=self.max_tokens,
+                    cached_content=cached_content
+                )
+            else:
+                self._generation_config = genai.types.GenerateContentConfig(
+                    temperature=self.temperature,
+                    max_output_tokens=self.max_tokens,
+                    system_instruction=self.system_prompt,
+                    tools=[tools] if tools else None
+                )
+            self._generation_config_key = key
+        return self._generation_config
+    
+    async def _prepare_generation_config(self, tools: Optional['genai.types.Tool']) -> 'genai.types.GenerateContentConfig':
+        """
+        Return the GenerateContentConfig for a request, using the context cache when enabled.
+        
+        Args:
+            tools: The Gemini Tool to offer the model, or None
             
+        Returns:
+            The generation config for the next generate_content call
+        """
+        cached_content = None
+        if self.context_cache_enabled:
+            cached_content = await self._ensure_context_cache(tools)
+        return self._get_generation_config(tools, cached_content)
+    
+    async def _ensure_context_cache(self, tools: Optional['genai.types.Tool']) -> Optional[str]:
+        """
+        Create or refresh the Gemini context cache holding tools and system instruction.
+        
+        The cache is recreated when the tools or system prompt change, or shortly
+        before its TTL runs out. If the API refuses to create it (for example
+        because the prefix is below the model's minimum cacheable size) context
+        caching is switched off for this client and requests send tools inline.
+        
+        Args:
+            tools: The Gemini Tool to cache, or None
+            
+        Returns:
+            The cache resource name, or None if context caching is unavailable
+        """
+        key = (tools, self.system_prompt)
+        now = time.monotonic()
+        # Refresh a little before expiry so a request never references a dead cache
+        if (self._context_cache_name and self._context_cache_key == key
+                and now < self._context_cache_expires - min(30.0, self.context_cache_ttl / 2)):
+            return self._context_cache_name
+        
+        previous_name = self._context_cache_name if self._context_cache_key != key else None
+        try:
+            cache = await self.client.aio.caches.create(
+                model=self._model_name,
+                config=genai.types.CreateCachedContentConfig(
+                    system_instruction=self.system_prompt,
+                    tools=[tools] if tools else None,
+                    ttl=f"{int(self.context_cache_ttl)}s"
+                )
+            )
         except Exception as e:
-            logging.error(f"Error listing tools: {e}")
+            logging.warning(f"Gemini context caching unavailable, sending tools inline: {e}")
+            self.context_cache_enabled = False
+            self._context_cache_name = None
+            return None
+        
+        self._context_cache_name = cache.name
+        self._context_cache_key = key
+        self._context_cache_expires = now + self.context_cache_ttl
+        logging.debug("Created Gemini context cache %s", cache.name)
+        
+        if previous_name:
+            await self._delete_context_cache(previous_name)
+        return self._context_cache_name
+    
+    async def _delete_context_cache(self, name: str) -> None:
+        """Delete a Gemini context cache, ignoring failures (it expires on its own)."""
+        try:
+            await self.client.aio.caches.delete(name=name)
+        except Exception as e:
+            logging.debug("Could not delete Gemini context cache %s: %s", name, e)
+    
+    @staticmethod
+    def _resolve_context_optimizer(optimizer: Any):
+        """
+        Resolve the `context_optimizer` config option.
+        
+        Args:
+            optimizer: None, a strategy name ("sliding_window" or "prune_tools"),
+                or an object with an optimize(messages, target_tokens) method
+                
+        Returns:
+            The optimizer instance, or None if history is sent unchanged
+        """
+        if optimizer is None or hasattr(optimizer, "optimize"):
+            return optimizer
+        
+        optimizer_class = OPTIMIZERS.get(optimizer)
+        if optimizer_class is None:
+            logging.warning(f"Unknown context optimizer: {optimizer}, sending full history")
+            return None
+        return optimizer_class()
+    
+    def _optimize_context(self, messages) -> list:
+        """
+        Return the history to send for the next request.
+        
+        Args:
+            messages: The conversation history
+            
+        Returns:
+            The history as a list, shrunk by the configured optimizer when it is
+            over context_target_tokens
+        """
+        contents = list(messages)
+        if self.optimizer is None:
+            return contents
+        
+        contents, stats = self.optimizer.optimize(contents, target_tokens=self.context_target_tokens)
+        if stats.get("optimized"):
+            logging.debug("Optimized Gemini context: %s", stats)
+        return contents
+    
+    def _resolve_response_cache(self, config: dict):
+        """
+        Resolve the response cache from the `response_cache` config option.
+        
+        Args:
+            config: Client configuration; `response_cache` may be True (use an
+                InMemoryResponseCache sized by `response_cache_size` and
+                `response_cache_ttl`) or any object with async get/set methods
+                
+        Returns:
+            The cache backend, or None if caching is disabled
+        """
+        cache = config.get("response_cache")
+        # Compare against the disabled values explicitly: a backend object may be
+        # falsy while empty (InMemoryResponseCache defines __len__)
+        if cache is None or cache is False:
+            return None
+        
+        if self.temperature != 0:
+            # Sampled responses differ between calls, so replaying one would change behavior
+            logging.warning("response_cache requires temperature=0; responses will not be cached")
+            return None
+        
+        if cache is True:
+            return InMemoryResponseCache(
+                max_entries=config.get("response_cache_size", 1024),
+                ttl_seconds=config.get("response_cache_ttl", 3600)
+            )
+        return cache
+    
+    def _response_cache_key(self, contents: list, tools: Optional['genai.types.Tool']) -> Optional[str]:
+        """
+        Build the response cache key for a request.
+        
+        Args:
+            contents: The conversation that will be sent to the model
+            tools: The Gemini Tool offered to the model, or None
+            
+        Returns:
+            A hex digest covering model, system prompt, temperature, tool names and
+            messages, or None when the response cache is disabled
+        """
+        if self._response_cache is None:
+            return None
+        
+        payload = {
+            "model": self._model_name,
+            "system": self.system_prompt,
+            "temperature": self.temperature,
+            "tools": sorted(fd.name for fd in (tools.function_declarations or [])) if tools else [],
+            "messages": [
+                c.model_dump(mode="json", exclude_none=True) if hasattr(c, "model_dump") else c
+                for c in contents
+            ],
+        }
+        if orjson is not None:
+            key_bytes = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            key_bytes = json.dumps(payload, sort_keys=True, default=str).encode()
+        # A 16-byte BLAKE2b digest is ample for a cache key and cheaper than SHA-256
+        return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+    
+    async def _get_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return the cached final answer for a key, counting hits and misses."""
+        if cache_key is None:
             return None
+        
+        try:
+            cached = await self._response_cache.get(cache_key)
+        except Exception as e:
+            logging.warning(f"Response cache lookup failed: {e}")
+            return None
+        
+        self.response_cache_stats["hits" if cached is not None else "misses"] += 1
+        return cached
+    
+    async def _store_cached_response(self, cache_key: Optional[str], text: str) -> None:
+        """Store a final answer in the response cache."""
+        if cache_key is None or not text:
+            return
+        
+        try:
+            await self._response_cache.set(cache_key, text)
+        except Exception as e:
+            logging.warning(f"Response cache store failed: {e}")
+    
+    def _store_tools_cache(self, tool_list) -> None:
+        """Convert an MCP tool listing and cache it with a fresh timestamp."""
+        self._cached_tools = self._build_gemini_tool(tool_list)
+        self._tools_cache_ts = time.monotonic()
+    
+    def invalidate_tools_cache(self) -> None:
+        """Drop the cached Gemini tools so the next query re-lists them from the MCP server."""
+        self._cached_tools = None
+        self._tools_cache_ts = 0.0
 
     async def process_query(self, query: str) -> str:
         """
-        Process query with streaming output (implements abstract method).
+        Process query with conversation history (implements abstract method).
         Maintains conversation history like other clients.
         Works with both persistent connections and creates temporary connections as needed.
+        
+        Returns:
+            The model's text response. Unlike the other clients nothing is written
+            to stdout; callers such as chat_loop print the returned text. Use
+            process_query_stream() to receive the text as it is generated.
+        """
+        return "".join([chunk async for chunk in self.process_query_stream(query)])
+    
+    async def process_query_stream(self, query: str) -> AsyncIterator[str]:
+        """
+        Process query with conversation history, yielding response text as it arrives.
+        
+        Uses Gemini's streaming API so callers see the first tokens without waiting
+        for the whole answer. Tool calls requested by the model are executed between
+        streamed turns and the history is updated exactly as in process_query.
+        Works with both persistent connections and creates temporary connections as needed.
+        
+        Args:
+            query: The query to process
+            
+        Yields:
+            Chunks of response text (error messages are yielded as text as well)
         """
         # Check if we have a persistent connection
         if hasattr(self, '_connection_active') and self._connection_active and self.session:
             # Use existing persistent connection
-            return await self._process_query_with_session(query)
+            async for chunk in self._stream_query_with_session(query):
+                yield chunk
         else:
             # Create temporary connection for this request
             async with self.connection_manager.connection_context() as (readstream, writestream, get_session_id):
@@ -391,10 +880,12 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                 self.writestream = writestream
                 
                 if not await self.connect_to_server():
-                    return "Error: Failed to establish MCP connection."
+                    yield "Error: Failed to establish MCP connection."
+                    return
                 
                 try:
-                    return await self._process_query_with_session(query)
+                    async for chunk in self._stream_query_with_session(query):
+                        yield chunk
                 finally:
                     # Clean up temporary session
                     if hasattr(self, '_exit_stack') and self._exit_stack:
@@ -402,108 +893,156 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                             await self._exit_stack.aclose()
                             self.session = None
                         except Exception as e:
-                            logging.debug(f"Error closing temporary session: {e}")
+                            logging.debug("Error closing temporary session: %s", e)
     
     async def _process_query_with_session(self, query: str) -> str:
         """Helper method that assumes session is already established."""
+        return "".join([chunk async for chunk in self._stream_query_with_session(query)])
+    
+    async def _stream_query_with_session(self, query: str) -> AsyncIterator[str]:
+        """Streaming helper that assumes session is already established."""
         tools = await self._get_available_tools()
         self.messages.append(genai.types.Content(role="user", parts=[genai.types.Part.from_text(text=query)]))
-
+        generation_config = await self._prepare_generation_config(tools)
+        
+        cache_key = self._response_cache_key(self.messages, tools)
+        cached = await self._get_cached_response(cache_key)
+        if cached is not None:
+            self.messages.append(genai.types.Content(
+                role="model",
+                parts=[genai.types.Part.from_text(text=cached)]
+            ))
+            yield cached
+            return
+        
+        answer_parts = []
+        used_tools = False
         while True:
+            text_parts = []
+            call_parts = []
+            received_content = False
+            finish_reason = None
+            usage_metadata = None
+            
             try:
-                response = await self.client.aio.models.generate_content(
+                stream = await self.client.aio.models.generate_content_stream(
                     model=self._model_name,
-                    contents=self.messages,
-                    config=genai.types.GenerateContentConfig(
-                        temperature=0.7,
-                        max_output_tokens=self.max_tokens,
-                        system_instruction=self.system_prompt,
-                        tools=[tools] if tools else None
-                    )
+                    contents=self._optimize_context(self.messages),
+                    config=generation_config
                 )
-
-                # Check for a text response first
-                logging.info(f"Usage Metadata: {response.usage_metadata}")
-                if response.text:
-                    print(response.text, end="", flush=True)
-                    self.messages.append(genai.types.Content(
-                        role="model", 
-                        parts=[genai.types.Part.from_text(text=response.text)]
-                    ))
-                    print()  # Add newline
-                    self._trim_history()
-                    return ""
-
-                # Check if the response contains content, to prevent NoneType error
-                if response.candidates and response.candidates[0].content:
-                    # Check if the model is calling a tool
-                    content_parts = response.candidates[0].content.parts or []
-                    tool_calls = [p.function_call for p in content_parts if hasattr(p, 'function_call') and p.function_call]
-
-                    if tool_calls:
-                        # Add the model's response to the history (preserving function calls for context)
-                        assistant_content = self._extract_text_only_content(response.candidates[0].content)
-                        if assistant_content:
-                            self.messages.append(assistant_content)
-
-                        # Execute tools
-                        tool_results = await self._execute_tool_calls(tool_calls)
-                        self.messages.append(genai.types.Content(role="user", parts=tool_results))
-                    else:
-                        # Handle cases where there is content, but it's not a text or tool call
-                        logging.warning("Unexpected content format in Gemini response")
-                        self._trim_history()
-                        return "No valid response content received from Gemini API"
-                else:
-                    # Handle the 'None' content case
-                    finish_reason = response.candidates[0].finish_reason if response.candidates else "unknown"
-                    logging.warning(f"Model response has no content. Finish reason: {finish_reason}")
-                    self._trim_history()
-                    return f"No response content available. Finish reason: {finish_reason}"
+                async for chunk in stream:
+                    usage_metadata = chunk.usage_metadata or usage_metadata
+                    if chunk.candidates:
+                        finish_reason = chunk.candidates[0].finish_reason or finish_reason
                     
+                    content, text, tool_calls = self._parse_response(chunk)
+                    if content is None:
+                        continue
+                    received_content = True
+                    if tool_calls:
+                        # Keep the original parts so any thought signatures go back to the model
+                        call_parts.extend(p for p in content.parts if getattr(p, 'function_call', None))
+                    if text:
+                        text_parts.append(text)
+                        yield text
             except Exception as e:
-                logging.error(f"Error in process_query: {e}")
-                return f"Error processing query: {e}"
+                logging.error("Error in process_query: %s", e)
+                yield f"Error processing query: {e}"
+                return
+            
+            logging.info("Usage Metadata: %s", usage_metadata)
+            text = "".join(text_parts)
+            answer_parts.append(text)
+            
+            if call_parts:
+                # Add the model's turn to the history (preserving function calls for context)
+                history_parts = [genai.types.Part.from_text(text=text)] if text else []
+                self.messages.append(genai.types.Content(role="model", parts=history_parts + call_parts))
+                
+                # Execute tools and let the model continue with their results
+                used_tools = True
+                tool_results = await self._execute_tool_calls([p.function_call for p in call_parts])
+                self.messages.append(genai.types.Content(role="user", parts=tool_results))
+                continue
+            
+            if text:
+                logging.debug("Gemini response: %s", text)
+                self.messages.append(genai.types.Content(
+                    role="model", 
+                    parts=[genai.types.Part.from_text(text=text)]
+                ))
+                # Answers built from tool results reflect live data, so only
+                # answers the model gave without calling tools are cached
+                if not used_tools:
+                    await self._store_cached_response(cache_key, "".join(answer_parts))
+                return
+            
+            if received_content:
+                # Handle cases where there is content, but it's not a text or tool call
+                logging.warning("Unexpected content format in Gemini response")
+                yield "No valid response content received from Gemini API"
+            else:
+                # Handle the 'None' content case
+                logging.warning("Model response has no content. Finish reason: %s", finish_reason or 'unknown')
+                yield f"No response content available. Finish reason: {finish_reason or 'unknown'}"
+            return
     
     async def _execute_tool_calls(self, tool_calls: list) -> list:
-        """Execute MCP tool calls and return results formatted for Gemini."""
+        """
+        Execute MCP tool calls and return results formatted for Gemini.
+
+        Gemini can request several function calls in a single turn; unless
+        run_tools_concurrently is disabled in the config they are dispatched
+        concurrently, so the turn costs as long as the slowest tool rather than
+        the sum of all of them. Results keep the order of the calls and one
+        failing tool never discards the results of the others.
+        """
         tool_results = []
-        
-        for tool_call in tool_calls:
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for tool_call in tool_calls:
+                logging.debug("Executing tool: %s", tool_call.name)
+
+        if self.run_tools_concurrently:
+            results = await asyncio.gather(
+                *[self._call_tool(tc) for tc in tool_calls],
+                return_exceptions=True
+            )
+        else:
+            results = []
+            for tc in tool_calls:
+                try:
+                    results.append(await self._call_tool(tc))
+                except Exception as e:
+                    results.append(e)
+
+        for tool_call, result in zip(tool_calls, results):
             name = tool_call.name
-            args = dict(tool_call.args) if tool_call.args else {}
-            
+
             try:
-                logging.debug(f"Executing tool: {name}")
-                result = await self.session.call_tool(name, args)
-                
+                if isinstance(result, BaseException):
+                    raise result
+
                 # Handle different payload types safely
-                text_payload = ""
-                if hasattr(result, 'content') and result.content:
-                    payload = result.content
-                    if isinstance(payload, list):
-                        if len(payload) > 0 and hasattr(payload[0], 'text'):
-                            text_payload = payload[0].text
-                        elif len(payload) > 0:
-                            text_payload = str(payload[0])
-                        else:
-                            text_payload = "No content returned"
-                    elif isinstance(payload, dict):
-                        text_payload = payload.get('text', payload.get('content', str(payload)))
-                    else:
-                        text_payload = str(payload)
+                payload = getattr(result, 'content', None)
+                text_payload = _extract_tool_text(payload) if payload else str(result)
+                
+                if getattr(result, 'isError', False):
+                    # The tool ran but reported a failure; pass its message back as an error
+                    logging.warning("Tool '%s' returned an error: %.200s", name, text_payload)
+                    response = {"error": text_payload[:1_000_000]}
                 else:
-                    text_payload = str(result)
+                    response = {"result": text_payload[:1_000_000]}  # Truncate large responses (consistent with other clients)
                 
                 # Create Gemini-formatted tool response
                 tool_response_part = genai.types.Part.from_function_response(
                     name=name,
-                    response={"result": text_payload[:1_000_000]}  # Truncate large responses (consistent with other clients)
+                    response=response
                 )
                 tool_results.append(tool_response_part)
                 
             except Exception as e:
-                logging.error(f"Tool '{name}' failed: {e}")
+                logging.error("Tool '%s' failed: %s", name, e)
                 # Create error response
                 error_response_part = genai.types.Part.from_function_response(
                     name=name,
@@ -513,6 +1052,10 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         
         return tool_results
     
+    async def _call_tool(self, tool_call):
+        """Call a single MCP tool for a Gemini function call."""
+        return await self.session.call_tool(tool_call.name, dict(tool_call.args) if tool_call.args else {})
+    
 
     async def ask_single_question(self, question: str) -> str:
         """
@@ -541,7 +1084,7 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                             await self._exit_stack.aclose()
                             self.session = None
                         except Exception as e:
-                            logging.debug(f"Error closing temporary session: {e}")
+                            logging.debug("Error closing temporary session: %s", e)
     
     async def _ask_single_question_with_session(self, question: str) -> str:
         """Helper method that assumes session is already established."""
@@ -551,45 +1094,47 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         # Create temporary message list for this single question
         temp_messages = [genai.types.Content(role="user", parts=[genai.types.Part.from_text(text=question)])]
         response_content = ""
+        generation_config = await self._prepare_generation_config(tools)
+        
+        cache_key = self._response_cache_key(temp_messages, tools)
+        cached = await self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
         
+        used_tools = False
         while True:
             try:
                 response = await self.client.aio.models.generate_content(
                     model=self._model_name,
                     contents=temp_messages,
-                    config=genai.types.GenerateContentConfig(
-                        temperature=0.7,
-                        max_output_tokens=self.max_tokens,
-                        system_instruction=self.system_prompt,
-                        tools=[tools] if tools else None
-                    )
+                    config=generation_config
                 )
                 # Extract text content
-                logging.info(f"Usage Metadata: {response.usage_metadata}")
-                if response.text:
-                    response_content += response.text
+                logging.info("Usage Metadata: %s", response.usage_metadata)
+                content, text, tool_calls = self._parse_response(response)
+                if text:
+                    response_content += text
                 
                 # Check for tool calls
-                if response.candidates and response.candidates[0].content:
-                    content_parts = response.candidates[0].content.parts or []
-                    tool_calls = [p.function_call for p in content_parts if hasattr(p, 'function_call') and p.function_call]
-                    if not tool_calls:
-                        break
-                    
-                    # Add model response to temp conversation (only if content exists)
-                    if response.candidates[0].content:
-                        temp_messages.append(response.candidates[0].content)
-                    # Execute tools
-                    tool_results = await self._execute_tool_calls(tool_calls)
-                    temp_messages.append(genai.types.Content(role="user", parts=tool_results))
-                else:
+                if not tool_calls:
                     break
+                
+                # Add model response to temp conversation
+                temp_messages.append(content)
+                # Execute tools
+                used_tools = True
+                tool_results = await self._execute_tool_calls(tool_calls)
+                temp_messages.append(genai.types.Content(role="user", parts=tool_results))
                     
             except Exception as e:
-                logging.error(f"Error in ask_single_question: {e}")
+                logging.error("Error in ask_single_question: %s", e)
                 return f"Error: {e}"
         
-        return response_content.strip()
+        response_content = response_content.strip()
+        # Answers built from tool results reflect live data and are never cached
+        if not used_tools:
+            await self._store_cached_response(cache_key, response_content)
+        return response_content
     
     async def ask_question(
         self, 
@@ -615,8 +1160,11 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             memory_messages = await self.memory_load_history()
             if memory_messages:
                 # Convert memory messages to Gemini format
-                self.messages = self._convert_memory_to_gemini_messages(memory_messages)
-                logging.debug(f"Loaded {len(memory_messages)} messages from memory")
+                self.messages = deque(
+                    self._convert_memory_to_gemini_messages(memory_messages),
+                    maxlen=self.max_history_length
+                )
+                logging.debug("Loaded %d messages from memory", len(memory_messages))
         
         # Save user question to memory
         if use_memory:
@@ -628,28 +1176,25 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             
             tools = await self._get_available_tools()
             response_content = ""
+            generation_config = await self._prepare_generation_config(tools)
             
             while True:
                 try:
                     response = await self.client.aio.models.generate_content(
                         model=self._model_name,
-                        contents=self.messages,
-                        config=genai.types.GenerateContentConfig(
-                            temperature=0.7,
-                            max_output_tokens=self.max_tokens,
-                            system_instruction=self.system_prompt,
-                            tools=[tools] if tools else None
-                        )
+                        contents=self._optimize_context(self.messages),
+                        config=generation_config
                     )
                     # Log usage metadata
-                    logging.info(f"Usage Metadata: {response.usage_metadata}")
+                    logging.info("Usage Metadata: %s", response.usage_metadata)
                     # Extract text content
-                    if response.text:
-                        response_content += response.text
+                    content, text, tool_calls = self._parse_response(response)
+                    if text:
+                        response_content += text
 
                     # Add model response to conversation (preserving function calls for context)
-                    if response.candidates and response.candidates[0].content:
-                        model_content = self._extract_text_only_content(response.candidates[0].content)
+                    if content is not None:
+                        model_content = self._extract_text_only_content(content)
                         if model_content:
                             self.messages.append(model_content)
                         
@@ -658,8 +1203,6 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                             await self.memory_save_message("model", response_content)
                         
                         # Check for tool calls
-                        content_parts = response.candidates[0].content.parts or []
-                        tool_calls = [p.function_call for p in content_parts if hasattr(p, 'function_call') and p.function_call]
                         if not tool_calls:
                             break
                         
@@ -676,10 +1219,9 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                         break
                         
                 except Exception as e:
-                    logging.error(f"Error in ask_question: {e}")
+                    logging.error("Error in ask_question: %s", e)
                     return f"Error: {e}"
             
-            self._trim_history()
             return response_content.strip()
         else:
             # Use single question method (no persistent history)
@@ -692,30 +1234,64 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             
             return result
     
+    @staticmethod
+    def _parse_response(response) -> tuple:
+        """
+        Pull the first candidate's content, text and function calls out of a Gemini response.
+        
+        Text is gathered in the same pass as the function calls instead of going
+        through response.text, which re-walks the parts on every access.
+        
+        Args:
+            response: A GenerateContentResponse
+            
+        Returns:
+            Tuple of (content, text, tool_calls); content is None when the response
+            carries no candidate content, text is the concatenated non-thought text
+            parts (empty string if none) and tool_calls lists function calls in part order
+        """
+        try:
+            content = response.candidates[0].content
+            parts = content.parts or []
+        except (AttributeError, IndexError, TypeError):
+            return None, "", []
+        
+        text_parts = []
+        tool_calls = []
+        for part in parts:
+            if function_call := getattr(part, 'function_call', None):
+                tool_calls.append(function_call)
+            elif (text := getattr(part, 'text', None)) and not getattr(part, 'thought', None):
+                text_parts.append(text)
+        return content, "".join(text_parts), tool_calls
+    
     def _extract_text_only_content(self, response_content: 'genai.types.Content') -> Optional['genai.types.Content']:
         """
         Extract text and function call parts from a Gemini response content.
         Preserves function calls to maintain conversation context for multi-turn tool interactions.
         
+        The response's own Part objects are reused rather than rebuilt, and the
+        content itself is returned when every part is kept, so no pydantic
+        models are constructed for the common case.
+        
         Args:
             response_content: The original response content from Gemini API
             
         Returns:
-            A new Content object with text and function call parts, or None if no relevant parts found
+            A Content object with text and function call parts, or None if no relevant parts found
         """
-        relevant_parts = []
         content_parts = response_content.parts or []
-        for part in content_parts:
-            # Include text parts
-            if hasattr(part, 'text') and part.text:
-                relevant_parts.append(genai.types.Part.from_text(text=part.text))
-            # Include function call parts to maintain tool interaction context
-            elif hasattr(part, 'function_call') and part.function_call:
-                relevant_parts.append(part)
-        
-        if relevant_parts:
-            return genai.types.Content(role="model", parts=relevant_parts)
-        return None
+        # Keep text parts and function call parts (the latter maintain tool interaction context)
+        relevant_parts = [
+            part for part in content_parts
+            if getattr(part, 'text', None) or getattr(part, 'function_call', None)
+        ]
+        
+        if not relevant_parts:
+            return None
+        if len(relevant_parts) == len(content_parts) and response_content.role == "model":
+            return response_content
+        return genai.types.Content(role="model", parts=relevant_parts)
     
     def _convert_memory_to_gemini_messages(self, memory_messages: list) -> list:
         """Convert universal memory messages to Gemini format."""
@@ -749,45 +1325,41 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
 
     def _convert_schema_for_gemini(self, schema: dict) -> dict:
         """
-        Recursively sanitizes an MCP tool schema to be compatible with Gemini's API
+        Sanitizes an MCP tool schema to be compatible with Gemini's API
         by keeping only the supported fields and ensuring proper format.
+        
+        Nested `properties` and `items` schemas are converted from an explicit
+        worklist rather than by recursion, so deep schemas cost no extra call frames.
         """
         if not isinstance(schema, dict):
             return {"type": "object", "properties": {}, "required": []}
         
-        # Supported fields in Gemini's function declaration schema
-        supported_keys = {'type', 'description', 'required', 'properties', 'items', 'enum'}
         gemini_schema = {}
+        # (source schema, destination dict) pairs still to be filled
+        worklist = [(schema, gemini_schema)]
         
-        for key, value in schema.items():
-            if key in supported_keys:
-                if key == 'properties' and isinstance(value, dict):
-                    # Recursively convert nested properties
-                    gemini_schema[key] = {
-                        prop_name: self._convert_schema_for_gemini(prop_schema)
-                        for prop_name, prop_schema in value.items()
-                    }
-                elif key == 'items' and isinstance(value, dict):
-                    # Recursively convert array items schema
-                    gemini_schema[key] = self._convert_schema_for_gemini(value)
-                elif key == 'required' and isinstance(value, list):
-                    # Ensure required is a list of strings
-                    gemini_schema[key] = [str(item) for item in value]
-                else:
-                    gemini_schema[key] = value
-        
-        # Ensure required fields exist
-        if 'type' not in gemini_schema:
-            gemini_schema['type'] = 'object'
-        if gemini_schema['type'] == 'object' and 'properties' not in gemini_schema:
-            gemini_schema['properties'] = {}
+        while worklist:
+            source, target = worklist.pop()
+            for key, value in source.items():
+                if key in _GEMINI_SCHEMA_KEYS:
+                    handler = _GEMINI_SCHEMA_KEY_HANDLERS.get(key)
+                    target[key] = handler(value, worklist) if handler else value
+            
+            # Ensure required fields exist
+            if 'type' not in target:
+                target['type'] = 'object'
+            if target['type'] == 'object' and 'properties' not in target:
+                target['properties'] = {}
         
         return gemini_schema
 
     def _trim_history(self):
-        """Keep conversation history within reasonable bounds."""
-        if len(self.messages) > self.max_history_length:
-            self.messages = self.messages[-self.max_history_length:]
+        """
+        Keep conversation history within reasonable bounds.
+        
+        Kept for compatibility: self.messages is a deque bounded by
+        max_history_length, so appends already discard the oldest messages.
+        """
     
     # Abstract method implementations
     async def initialize(self) -> None:
@@ -802,6 +1374,10 @@ class GeminiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
     
     async def cleanup(self) -> None:
         """Clean up resources and close connections."""
+        if self._context_cache_name:
+            await self._delete_context_cache(self._context_cache_name)
+            self._context_cache_name = None
+        
         if hasattr(self, '_exit_stack') and self._exit_stack:
             try:
                 await self._exit_stack.aclose()
@@ -836,10 +1412,17 @@ class PersistentGeminiClient(BasePersistentLLMClient, GeminiClient):
         )
         self._connection_active = False
         self._connection_context = None
-        self._persistent_exit_stack = AsyncExitStack()
+        # Async context manager for the open connection, exited directly on close
+        self._connection_cm = None
         self._mcp_session_id = None
         self._connection_task_group = None
         self._connection_task = None
+        # Health probes within this window reuse the last successful result
+        self._last_health_check: float = 0.0
+        self._health_ttl: float = config.get("health_check_ttl", 5.0)
+        # Serializes establish_persistent_connection so concurrent callers
+        # share one reconnect instead of each opening a connection
+        self._reconnect_lock = asyncio.Lock()
         
         # For persistent clients, we can eagerly initialize the memory session
         # since they're typically used for longer-running conversations
@@ -871,7 +1454,7 @@ class PersistentGeminiClient(BasePersistentLLMClient, GeminiClient):
         return self.memory_session_id
     
     async def _verify_connection_health(self) -> bool:
-        """Verify that the persistent connection is still healthy."""
+        """Probe the persistent connection with a round-trip to the server."""
         if not self._connection_active or not self._mcp_session_id:
             logging.debug("Connection not active or no MCP session ID")
             return False
@@ -881,102 +1464,113 @@ class PersistentGeminiClient(BasePersistentLLMClient, GeminiClient):
             return False
         
         try:
-            # Try to list tools as a health check
-            await self.session.list_tools()
+            # Ping is the cheapest liveness probe; older sessions fall back to
+            # list_tools() and keep the result for the next tools lookup
+            if hasattr(self.session, 'send_ping'):
+                await self.session.send_ping()
+            else:
+                self._store_tools_cache(await self.session.list_tools())
+            self._last_health_check = time.monotonic()
             logging.debug("Connection health check passed")
             return True
         except Exception as e:
             logging.warning(f"Connection health check failed: {e}")
             # Mark connection as inactive
             self._connection_active = False
+            self._last_health_check = 0.0
             return False
     
+    async def _verify_connection_health_cached(self) -> bool:
+        """Verify the persistent connection, skipping the probe if it passed within health_check_ttl seconds."""
+        if (
+            self._connection_active
+            and self._mcp_session_id
+            and self.session
+            and time.monotonic() - self._last_health_check < self._health_ttl
+        ):
+            return True
+        return await self._verify_connection_health()
+    
     async def establish_persistent_connection(self) -> str:
         """Establish and maintain a persistent MCP connection."""
-        # First check if existing connection is still healthy
-        if self._connection_active and self._mcp_session_id:
-            if await self._verify_connection_health():
-                logging.debug(f"Reusing healthy persistent connection: {self._mcp_session_id}")
-                return self._mcp_session_id
-            else:
-                logging.info("Existing connection unhealthy, re-establishing...")
-                await self.close_persistent_connection()
-            
-        try:
-            # Ensure auth layer is set up first
-            if not await self.setup_connection():
-                raise RuntimeError("Failed to setup connection")
-            
-            # Set up the connection context that will stay open
-            self._connection_context = await self._persistent_exit_stack.enter_async_context(
-                self.connection_manager.connection_context()
-            )
-            
-            readstream, writestream, get_session_id = self._connection_context
-            
-            # Set the streams on the client
-            self.readstream = readstream
-            self.writestream = writestream
-            
-            # Connect to the MCP server
-            if not await self.connect_to_server():
-                raise RuntimeError("Failed to initialize MCP session")
-            
-            # Get the session ID from the connection
+        # Callers that waited for the lock find the connection another caller
+        # just established and reuse it through the health check below
+        async with self._reconnect_lock:
+            # First check if existing connection is still healthy
+            if self._connection_active and self._mcp_session_id:
+                if await self._verify_connection_health_cached():
+                    logging.debug("Reusing healthy persistent connection: %s", self._mcp_session_id)
+                    return self._mcp_session_id
+                else:
+                    logging.info("Existing connection unhealthy, re-establishing...")
+                    await self.close_persistent_connection()
+                
             try:
+                # Ensure auth layer is set up first
+                if not await self.setup_connection():
+                    raise RuntimeError("Failed to setup connection")
+                
+                # Set up the connection context that will stay open
+                connection_cm = self.connection_manager.connection_context()
+                self._connection_context = await connection_cm.__aenter__()
+                self._connection_cm = connection_cm
+                
+                readstream, writestream, get_session_id = self._connection_context
+                
+                # Set the streams on the client
+                self.readstream = readstream
+                self.writestream = writestream
+                
+                # Connect to the MCP server
+                if not await self.connect_to_server():
+                    raise RuntimeError("Failed to initialize MCP session")
+                
+                # Get the session ID from the connection
                 mcp_session_id = get_session_id() if get_session_id else None
                 if not mcp_session_id:
                     raise RuntimeError("Failed to get MCP session ID")
                 
                 self._mcp_session_id = str(mcp_session_id)
                 self._connection_active = True
-                logging.info(f"Established persistent MCP connection: {self._mcp_session_id}")
+                logging.info("Established persistent MCP connection: %s", self._mcp_session_id)
                 
                 return self._mcp_session_id
                 
             except Exception as e:
-                raise RuntimeError(f"Failed to get MCP session ID: {e}")
-                
-        except Exception as e:
-            logging.error(f"Error establishing persistent MCP connection: {e}")
-            await self.close_persistent_connection()
-            raise RuntimeError(f"Failed to establish persistent MCP connection: {e}")
+                logging.error(f"Error establishing persistent MCP connection: {e}")
+                await self.close_persistent_connection()
+                raise RuntimeError(f"Failed to establish persistent MCP connection: {e}")
     
     async def close_persistent_connection(self):
         """Close the persistent MCP connection."""
         try:
-            if self._persistent_exit_stack:
-                # Try to close the exit stack gracefully
+            if self._connection_cm is not None:
+                # Detach first so a failed exit is never retried on the next close
+                connection_cm, self._connection_cm = self._connection_cm, None
                 try:
-                    await self._persistent_exit_stack.aclose()
-                    logging.debug("Successfully closed persistent exit stack")
+                    await connection_cm.__aexit__(None, None, None)
+                    logging.debug("Successfully closed persistent connection context")
                 except RuntimeError as e:
-                    if "different task" in str(e) or "cancel scope" in str(e):
+                    if _is_task_boundary_error(e):
                         # This is expected when closing across task boundaries
                         # The resources are likely already cleaned up by the connection context manager
-                        logging.debug(f"Exit stack cleanup skipped due to task boundary: {e}")
+                        logging.debug("Connection context cleanup skipped due to task boundary: %s", e)
                     else:
-                        logging.warning(f"Unexpected error closing exit stack: {e}")
+                        logging.warning(f"Unexpected error closing connection context: {e}")
                 except Exception as e:
-                    logging.warning(f"Error closing exit stack: {e}")
-                
-                # Always create a fresh exit stack for future connections
-                self._persistent_exit_stack = AsyncExitStack()
+                    logging.warning(f"Error closing connection context: {e}")
             
             # Reset connection state
             self._connection_active = False
+            self._last_health_check = 0.0
+            self.invalidate_tools_cache()
             self._mcp_session_id = None
             self._connection_context = None
             self._connection_task_group = None
             self._connection_task = None
             
-            # Force cleanup of any remaining session resources
-            if hasattr(self, 'session') and self.session:
-                try:
-                    # The session should be cleaned up by the exit stack, but just in case
-                    self.session = None
-                except Exception as e:
-                    logging.debug(f"Error clearing session reference: {e}")
+            # The session is cleaned up with the connection; drop the stale reference
+            self.session = None
             
             logging.info("Closed persistent MCP connection")
         except Exception as e:
@@ -990,9 +1584,7 @@ class PersistentGeminiClient(BasePersistentLLMClient, GeminiClient):
     @property
     def is_connected(self) -> bool:
         """Check if the persistent connection is active."""
-        is_active = self._connection_active and self._mcp_session_id is not None
-        logging.debug(f"Connection status check: active={self._connection_active}, mcp_session_id={self._mcp_session_id}, result={is_active}")
-        return is_active
+        return self._connection_active and self._mcp_session_id is not None
     
     async def ask_with_persistent_session(
         self, 
@@ -1013,17 +1605,14 @@ class PersistentGeminiClient(BasePersistentLLMClient, GeminiClient):
         Returns:
             The response as a string
         """
-        # Check connection health and auto-establish if needed
+        # establish_persistent_connection checks health itself and reuses a healthy connection
         if auto_establish_connection:
-            if not self.is_connected or not await self._verify_connection_health():
-                try:
-                    mcp_session_id = await self.establish_persistent_connection()
-                    logging.info(f"Established persistent MCP connection: {mcp_session_id}")
-                except Exception as e:
-                    logging.error(f"Failed to establish MCP connection: {e}")
-                    raise RuntimeError(f"Could not establish persistent MCP connection: {e}")
-        
-        if not self.is_connected:
+            try:
+                await self.establish_persistent_connection()
+            except Exception as e:
+                logging.error(f"Failed to establish MCP connection: {e}")
+                raise RuntimeError(f"Could not establish persistent MCP connection: {e}")
+        elif not self.is_connected:
             raise RuntimeError("No persistent MCP connection available. Call establish_persistent_connection() first or set auto_establish_connection=True")
         
         if not self.session:
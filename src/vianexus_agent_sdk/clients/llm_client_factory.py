@@ -2,14 +2,16 @@
 Unified LLM Client Factory for creating clients based on configuration.
 """
 
+import functools
+import importlib
 import logging
-from typing import Dict, Any, Optional, Type, Union
+from collections.abc import Mapping as MappingABC
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple, Type, Union
 from enum import Enum
+from types import MappingProxyType
 
 from .base_llm_client import BaseLLMClient, BasePersistentLLMClient
-from .anthropic_client import AnthropicClient, PersistentAnthropicClient
-from .openai_client import OpenAiClient, PersistentOpenAiClient
-from .gemini_client import GeminiClient, PersistentGeminiClient
+from .batch_processor import BatchProcessor
 from vianexus_agent_sdk.memory import BaseMemoryStore
 
 
@@ -20,6 +22,57 @@ class LLMProvider(Enum):
     GEMINI = "gemini"
 
 
+# Provider -> (module, client class name, persistent client class name).
+# Client modules pull in their provider SDK, so they are only imported when a
+# client for that provider is first requested.
+_PROVIDER_MODULE_PATHS = MappingProxyType({
+    LLMProvider.ANTHROPIC: ("vianexus_agent_sdk.clients.anthropic_client", "AnthropicClient", "PersistentAnthropicClient"),
+    LLMProvider.OPENAI: ("vianexus_agent_sdk.clients.openai_client", "OpenAiClient", "PersistentOpenAiClient"),
+    LLMProvider.GEMINI: ("vianexus_agent_sdk.clients.gemini_client", "GeminiClient", "PersistentGeminiClient"),
+})
+
+_RESOLVED_CLASSES: Dict[Tuple[LLMProvider, bool], Type[BaseLLMClient]] = {}
+
+
+def _resolve_class(provider: LLMProvider, persistent: bool) -> Type[BaseLLMClient]:
+    """
+    Import the client class for a provider on first use.
+    
+    Args:
+        provider: LLM provider
+        persistent: Whether to return the persistent client variant
+        
+    Returns:
+        The client class
+    """
+    key = (provider, persistent)
+    client_class = _RESOLVED_CLASSES.get(key)
+    if client_class is None:
+        module_path, class_name, persistent_class_name = _PROVIDER_MODULE_PATHS[provider]
+        module = importlib.import_module(module_path)
+        client_class = getattr(module, persistent_class_name if persistent else class_name)
+        _RESOLVED_CLASSES[key] = client_class
+    return client_class
+
+
+class _LazyClientClasses(MappingABC):
+    """Read-only provider -> client class mapping that imports classes on access."""
+
+    def __init__(self, persistent: bool):
+        self._persistent = persistent
+
+    def __getitem__(self, provider: LLMProvider) -> Type[BaseLLMClient]:
+        if provider not in _PROVIDER_MODULE_PATHS:
+            raise KeyError(provider)
+        return _resolve_class(provider, self._persistent)
+
+    def __iter__(self) -> Iterator[LLMProvider]:
+        return iter(_PROVIDER_MODULE_PATHS)
+
+    def __len__(self) -> int:
+        return len(_PROVIDER_MODULE_PATHS)
+
+
 class LLMClientFactory:
     """
     Factory for creating unified LLM clients based on configuration.
@@ -60,82 +113,124 @@ class LLMClientFactory:
     persistent_client = LLMClientFactory.create_persistent_client(config)
     """
     
-    # Provider detection patterns
-    MODEL_PATTERNS = {
-        LLMProvider.OPENAI: ["gpt-", "o1-", "text-davinci", "text-curie", "text-babbage", "text-ada"],
-        LLMProvider.ANTHROPIC: ["claude-", "claude_"],
-        LLMProvider.GEMINI: ["gemini-", "gemini_", "bison", "gecko"]
-    }
+    # Provider detection patterns. Prefixes are stored as lowercase tuples so
+    # detection can use str.startswith(tuple), which checks them all in C.
+    # The mappings are read-only: detect_provider caches its results, and
+    # mutating a pattern table would leave that cache stale.
+    MODEL_PATTERNS = MappingProxyType({
+        provider: tuple(pattern.lower() for pattern in patterns)
+        for provider, patterns in {
+            LLMProvider.OPENAI: ["gpt-", "o1-", "text-davinci", "text-curie", "text-babbage", "text-ada"],
+            LLMProvider.ANTHROPIC: ["claude-", "claude_"],
+            LLMProvider.GEMINI: ["gemini-", "gemini_", "bison", "gecko"]
+        }.items()
+    })
     
-    API_KEY_PATTERNS = {
-        LLMProvider.OPENAI: ["sk-", "sk_"],
-        LLMProvider.ANTHROPIC: ["sk-ant-"],
-        LLMProvider.GEMINI: ["AI"]  # Google API keys often contain "AI"
-    }
+    API_KEY_PATTERNS = MappingProxyType({
+        LLMProvider.OPENAI: ("sk-", "sk_"),
+        LLMProvider.ANTHROPIC: ("sk-ant-",),
+        LLMProvider.GEMINI: ("AI",)  # Google API keys often contain "AI"
+    })
     
-    # Client class mappings
-    CLIENT_CLASSES = {
-        LLMProvider.ANTHROPIC: AnthropicClient,
-        LLMProvider.OPENAI: OpenAiClient,
-        LLMProvider.GEMINI: GeminiClient
-    }
+    # Client class mappings; classes are imported the first time they are looked up
+    CLIENT_CLASSES = _LazyClientClasses(persistent=False)
     
-    PERSISTENT_CLIENT_CLASSES = {
-        LLMProvider.ANTHROPIC: PersistentAnthropicClient,
-        LLMProvider.OPENAI: PersistentOpenAiClient,
-        LLMProvider.GEMINI: PersistentGeminiClient
-    }
+    PERSISTENT_CLIENT_CLASSES = _LazyClientClasses(persistent=True)
     
+    # Provider hint keys checked when neither the model nor the API key match
+    PROVIDER_HINT_KEYS = ("client_type", "llm_provider", "ai_provider", "model_provider")
+
+    # Only this many leading API key characters take part in detection, so the
+    # detection cache never holds full secrets
+    _API_KEY_PREFIX_LENGTH = max(len(p) for patterns in API_KEY_PATTERNS.values() for p in patterns)
+
     @classmethod
     def detect_provider(cls, config: Dict[str, Any]) -> LLMProvider:
         """
         Automatically detect the LLM provider based on configuration.
         
+        The fields used for detection are extracted into a hashable tuple and
+        resolved through an LRU cache, so repeated calls with the same settings
+        are a dictionary lookup. How the provider was detected is logged on
+        every call, cached or not.
+        
         Args:
             config: Configuration dictionary
             
         Returns:
             Detected LLM provider
             
+        Raises:
+            ValueError: If provider cannot be detected
+        """
+        explicit = config["provider"] if "provider" in config else None
+        hints = tuple(
+            (key, str(config[key])) for key in cls.PROVIDER_HINT_KEYS if key in config
+        )
+        provider, reason = cls._detect_from_tuple(
+            config.get("LLM_MODEL") or "",
+            (config.get("LLM_API_KEY") or "")[:cls._API_KEY_PREFIX_LENGTH],
+            explicit,
+            hints
+        )
+        logging.info(reason)
+        return provider
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _detect_from_tuple(
+        cls,
+        model_name: str,
+        api_key_prefix: str,
+        explicit: Optional[str],
+        hints: Tuple[Tuple[str, str], ...]
+    ) -> Tuple[LLMProvider, str]:
+        """
+        Detect the provider from hashable configuration fields.
+        
+        Nothing is logged here, since cached calls would skip it; the reason is
+        returned for detect_provider to log instead.
+        
+        Args:
+            model_name: Configured LLM_MODEL value
+            api_key_prefix: Leading characters of LLM_API_KEY
+            explicit: Explicit 'provider' value, if any
+            hints: (key, value) pairs of the provider hint keys present in config
+            
+        Returns:
+            Tuple of (detected LLM provider, description of how it was detected)
+            
         Raises:
             ValueError: If provider cannot be detected
         """
         # 1. Check explicit provider field
-        if "provider" in config:
-            provider_str = config["provider"].lower()
+        if explicit is not None:
+            provider_str = explicit.lower()
             for provider in LLMProvider:
                 if provider.value == provider_str:
-                    logging.info(f"Provider explicitly specified: {provider.value}")
-                    return provider
+                    return provider, f"Provider explicitly specified: {provider.value}"
             raise ValueError(f"Unknown provider specified: {provider_str}")
         
         # 2. Check model name patterns
-        model_name = config.get("LLM_MODEL", "").lower()
+        model_name = model_name.lower()
         if model_name:
             for provider, patterns in cls.MODEL_PATTERNS.items():
-                if any(model_name.startswith(pattern.lower()) for pattern in patterns):
-                    logging.info(f"Provider detected from model name '{model_name}': {provider.value}")
-                    return provider
+                if model_name.startswith(patterns):
+                    return provider, f"Provider detected from model name '{model_name}': {provider.value}"
         
         # 3. Check API key patterns
-        api_key = config.get("LLM_API_KEY", "")
-        if api_key:
+        if api_key_prefix:
             for provider, patterns in cls.API_KEY_PATTERNS.items():
-                if any(api_key.startswith(pattern) for pattern in patterns):
-                    logging.info(f"Provider detected from API key pattern: {provider.value}")
-                    return provider
+                if api_key_prefix.startswith(patterns):
+                    return provider, f"Provider detected from API key pattern: {provider.value}"
         
         # 4. Fallback - check for provider-specific config keys (targeted approach)
         # Only check specific config keys that are likely to contain provider info
-        provider_hint_keys = ["client_type", "llm_provider", "ai_provider", "model_provider"]
-        
-        for key in provider_hint_keys:
-            if key in config:
-                value = str(config[key]).lower()
-                for provider in LLMProvider:
-                    if provider.value in value:
-                        logging.info(f"Provider detected from config key '{key}': {provider.value}")
-                        return provider
+        for key, value in hints:
+            value = value.lower()
+            for provider in LLMProvider:
+                if provider.value in value:
+                    return provider, f"Provider detected from config key '{key}': {provider.value}"
         
         # Cannot detect provider
         raise ValueError(
@@ -144,18 +239,42 @@ class LLMClientFactory:
             f"Supported providers: {[p.value for p in LLMProvider]}"
         )
     
+    # Memory configuration -> client class constructor used to build the client
+    _MEMORY_DISPATCH = MappingProxyType({
+        "in_memory": "with_in_memory_store",
+        "file": "with_file_memory_store",
+        "none": "without_memory",
+    })
+
+    _MEMORY_DESCRIPTIONS = MappingProxyType({
+        "in_memory": "with InMemoryStore",
+        "file": "with FileMemoryStore",
+        "none": "without memory",
+    })
+
+    # Read-only provider info, built on the first get_provider_info() call
+    _provider_info: Optional[Mapping[str, Mapping[str, Any]]] = None
+
     @classmethod
-    def create_client(
+    def _build(
         cls,
         config: Dict[str, Any],
+        persistent: bool,
+        memory_type: str = "in_memory",
+        memory_store: Optional[BaseMemoryStore] = None,
+        storage_path: str = "conversations",
         provider: Optional[Union[str, LLMProvider]] = None,
         **kwargs
     ) -> BaseLLMClient:
         """
-        Create a standard LLM client based on configuration.
+        Resolve the provider and construct a client with the requested memory setup.
         
         Args:
             config: Configuration dictionary
+            persistent: Whether to build the persistent client variant
+            memory_type: Type of memory store ("in_memory", "file", "none")
+            memory_store: Custom memory store instance (overrides memory_type)
+            storage_path: Path for file-based storage (if memory_type="file")
             provider: Optional explicit provider (overrides auto-detection)
             **kwargs: Additional arguments passed to client constructor
             
@@ -170,12 +289,44 @@ class LLMClientFactory:
         else:
             detected_provider = provider
         
-        # Get client class
-        client_class = cls.CLIENT_CLASSES[detected_provider]
+        client_class = _resolve_class(detected_provider, persistent)
+        kind = "persistent " if persistent else ""
+        
+        if memory_store is not None:
+            logging.info(f"Creating {kind}{detected_provider.value} client with custom memory store")
+            return client_class(config=config, memory_store=memory_store, **kwargs)
+        
+        try:
+            constructor = getattr(client_class, cls._MEMORY_DISPATCH[memory_type])
+        except KeyError:
+            raise ValueError(f"Unknown memory_type: {memory_type}. Supported: 'in_memory', 'file', 'none'") from None
         
-        # Create client with default memory configuration
-        logging.info(f"Creating {detected_provider.value} client with InMemoryStore")
-        return client_class.with_in_memory_store(config, **kwargs)
+        description = cls._MEMORY_DESCRIPTIONS[memory_type]
+        if memory_type == "file":
+            kwargs["storage_path"] = storage_path
+            description = f"{description} at {storage_path}"
+        logging.info(f"Creating {kind}{detected_provider.value} client {description}")
+        return constructor(config, **kwargs)
+    
+    @classmethod
+    def create_client(
+        cls,
+        config: Dict[str, Any],
+        provider: Optional[Union[str, LLMProvider]] = None,
+        **kwargs
+    ) -> BaseLLMClient:
+        """
+        Create a standard LLM client based on configuration.
+        
+        Args:
+            config: Configuration dictionary
+            provider: Optional explicit provider (overrides auto-detection)
+            **kwargs: Additional arguments passed to client constructor
+            
+        Returns:
+            Configured LLM client instance
+        """
+        return cls._build(config, False, provider=provider, **kwargs)
     
     @classmethod
     def create_persistent_client(
@@ -195,20 +346,7 @@ class LLMClientFactory:
         Returns:
             Configured persistent LLM client instance
         """
-        # Resolve provider
-        if provider is None:
-            detected_provider = cls.detect_provider(config)
-        elif isinstance(provider, str):
-            detected_provider = LLMProvider(provider.lower())
-        else:
-            detected_provider = provider
-        
-        # Get persistent client class
-        client_class = cls.PERSISTENT_CLIENT_CLASSES[detected_provider]
-        
-        # Create persistent client with default memory configuration
-        logging.info(f"Creating persistent {detected_provider.value} client with InMemoryStore")
-        return client_class.with_in_memory_store(config, **kwargs)
+        return cls._build(config, True, provider=provider, **kwargs)
     
     @classmethod
     def create_client_with_memory(
@@ -234,32 +372,7 @@ class LLMClientFactory:
         Returns:
             Configured LLM client instance
         """
-        # Resolve provider
-        if provider is None:
-            detected_provider = cls.detect_provider(config)
-        elif isinstance(provider, str):
-            detected_provider = LLMProvider(provider.lower())
-        else:
-            detected_provider = provider
-        
-        # Get client class
-        client_class = cls.CLIENT_CLASSES[detected_provider]
-        
-        # Create client based on memory configuration
-        if memory_store is not None:
-            logging.info(f"Creating {detected_provider.value} client with custom memory store")
-            return client_class(config=config, memory_store=memory_store, **kwargs)
-        elif memory_type == "in_memory":
-            logging.info(f"Creating {detected_provider.value} client with InMemoryStore")
-            return client_class.with_in_memory_store(config, **kwargs)
-        elif memory_type == "file":
-            logging.info(f"Creating {detected_provider.value} client with FileMemoryStore at {storage_path}")
-            return client_class.with_file_memory_store(config, storage_path=storage_path, **kwargs)
-        elif memory_type == "none":
-            logging.info(f"Creating {detected_provider.value} client without memory")
-            return client_class.without_memory(config, **kwargs)
-        else:
-            raise ValueError(f"Unknown memory_type: {memory_type}. Supported: 'in_memory', 'file', 'none'")
+        return cls._build(config, False, memory_type, memory_store, storage_path, provider, **kwargs)
     
     @classmethod
     def create_persistent_client_with_memory(
@@ -285,32 +398,35 @@ class LLMClientFactory:
         Returns:
             Configured persistent LLM client instance
         """
-        # Resolve provider
-        if provider is None:
-            detected_provider = cls.detect_provider(config)
-        elif isinstance(provider, str):
-            detected_provider = LLMProvider(provider.lower())
-        else:
-            detected_provider = provider
+        return cls._build(config, True, memory_type, memory_store, storage_path, provider, **kwargs)
+    
+    @classmethod
+    def create_batch_processor(
+        cls,
+        config: Dict[str, Any],
+        max_concurrency: int = 10,
+        rate_limit: Optional[float] = None,
+        provider: Optional[Union[str, LLMProvider]] = None,
+        **kwargs
+    ) -> BatchProcessor:
+        """
+        Create a batch processor for running many independent questions concurrently.
         
-        # Get persistent client class
-        client_class = cls.PERSISTENT_CLIENT_CLASSES[detected_provider]
+        The processor wraps a persistent client without memory, since batch
+        inputs do not share conversation context.
         
-        # Create persistent client based on memory configuration
-        if memory_store is not None:
-            logging.info(f"Creating persistent {detected_provider.value} client with custom memory store")
-            return client_class(config=config, memory_store=memory_store, **kwargs)
-        elif memory_type == "in_memory":
-            logging.info(f"Creating persistent {detected_provider.value} client with InMemoryStore")
-            return client_class.with_in_memory_store(config, **kwargs)
-        elif memory_type == "file":
-            logging.info(f"Creating persistent {detected_provider.value} client with FileMemoryStore at {storage_path}")
-            return client_class.with_file_memory_store(config, storage_path=storage_path, **kwargs)
-        elif memory_type == "none":
-            logging.info(f"Creating persistent {detected_provider.value} client without memory")
-            return client_class.without_memory(config, **kwargs)
-        else:
-            raise ValueError(f"Unknown memory_type: {memory_type}. Supported: 'in_memory', 'file', 'none'")
+        Args:
+            config: Configuration dictionary
+            max_concurrency: Maximum number of inputs processed at the same time
+            rate_limit: Maximum number of inputs started per minute (None for no limit)
+            provider: Optional explicit provider (overrides auto-detection)
+            **kwargs: Additional arguments passed to client constructor
+            
+        Returns:
+            BatchProcessor backed by a persistent client
+        """
+        client = cls._build(config, True, memory_type="none", provider=provider, **kwargs)
+        return BatchProcessor(client, max_concurrency=max_concurrency, rate_limit=rate_limit)
     
     @classmethod
     def get_supported_providers(cls) -> list[str]:
@@ -318,14 +434,20 @@ class LLMClientFactory:
         return [provider.value for provider in LLMProvider]
     
     @classmethod
-    def get_provider_info(cls) -> Dict[str, Dict[str, Any]]:
-        """Get information about supported providers and their detection patterns."""
-        return {
-            provider.value: {
-                "model_patterns": cls.MODEL_PATTERNS[provider],
-                "api_key_patterns": cls.API_KEY_PATTERNS[provider],
-                "client_class": cls.CLIENT_CLASSES[provider].__name__,
-                "persistent_client_class": cls.PERSISTENT_CLIENT_CLASSES[provider].__name__
-            }
-            for provider in LLMProvider
-        }
+    def get_provider_info(cls) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Get information about supported providers and their detection patterns.
+        
+        The result is computed once and returned as a read-only mapping.
+        """
+        if cls._provider_info is None:
+            cls._provider_info = MappingProxyType({
+                provider.value: MappingProxyType({
+                    "model_patterns": cls.MODEL_PATTERNS[provider],
+                    "api_key_patterns": cls.API_KEY_PATTERNS[provider],
+                    "client_class": _PROVIDER_MODULE_PATHS[provider][1],
+                    "persistent_client_class": _PROVIDER_MODULE_PATHS[provider][2]
+                })
+                for provider in LLMProvider
+            })
+        return cls._provider_info
@@ -2,24 +2,187 @@
 OpenAI Client implementation with universal memory management support.
 """
 import asyncio
+import functools
 import json
 import logging
-import base64
+import sys
+import time
+from collections import deque
+from itertools import islice
 from contextlib import AsyncExitStack
-from openai import AsyncOpenAI
-from typing import Any, Dict, List, Optional
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, RateLimitError
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 try:
     import jwt as jwt_lib
 except ImportError:
     jwt_lib = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from vianexus_agent_sdk.mcp_client.enhanced_mcp_client import EnhancedMCPClient
 from vianexus_agent_sdk.memory import ConversationMemoryMixin, BaseMemoryStore
 from vianexus_agent_sdk.memory.stores.memory_memory import InMemoryStore
-from .base_llm_client import BaseLLMClient, BasePersistentLLMClient
+from .base_llm_client import BaseLLMClient, BasePersistentLLMClient, _is_task_boundary_error
 
 # Default financial system prompt constant (matching Anthropic client)
 DEFAULT_FINANCIAL_SYSTEM_PROMPT = """You are a skilled Financial Analyst. You will use the tools provided to you to answer the question. You will only use the tools provided to you and not any other tools that are not provided to you. Use the `search` tool to find the appropriate dataset for the question. Use the `fetch` tool to fetch the data from the dataset."""
 
+# Number of most recent messages rendered into the responses API input
+CONTEXT_WINDOW_MESSAGES = 10
+
+# Maximum characters of a tool result passed back to the model
+MAX_TOOL_RESULT_CHARS = 100_000
+
+
+def _loads(data: str) -> Any:
+    """Parse JSON, using orjson when installed (the optional `fast` extra)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to JSON, using orjson when installed (the optional `fast` extra)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+def _to_text_limited(payload: Any, limit: int) -> str:
+    """
+    Render an MCP tool result payload as text of at most `limit` characters.
+    
+    Only the part of the payload that is sent to the model is read: the first
+    content block of a list, or the `text`/`content` field of a dict, so large
+    results are never joined or stringified as a whole.
+    
+    Args:
+        payload: The `content` of a CallToolResult, or the result itself
+        limit: Maximum number of characters to return
+        
+    Returns:
+        The payload text, truncated to `limit`
+    """
+    if isinstance(payload, list):
+        if not payload:
+            return "No content returned"
+        first = payload[0]
+        text = getattr(first, 'text', None)
+        if text is not None:
+            return text[:limit]
+        return str(first)[:limit]
+    if isinstance(payload, dict):
+        for key in ('text', 'content'):
+            if key in payload:
+                value = payload[key]
+                return (value if isinstance(value, str) else str(value))[:limit]
+        return _dumps(payload)[:limit]
+    return str(payload)[:limit]
+
+
+def _build_http_client(http_pool: dict) -> DefaultAsyncHttpxClient:
+    """
+    Build the httpx client used by AsyncOpenAI from the `http_pool` client config option.
+    
+    Args:
+        http_pool: Dict with optional `max_connections` (default 100),
+            `max_keepalive_connections` (default 50) and `timeout` (seconds)
+            
+    Returns:
+        An httpx.AsyncClient with the OpenAI SDK defaults and a bounded keep-alive pool
+    """
+    import httpx
+    
+    limits = httpx.Limits(
+        max_connections=http_pool.get("max_connections", 100),
+        max_keepalive_connections=http_pool.get("max_keepalive_connections", 50)
+    )
+    timeout = http_pool.get("timeout")
+    if timeout is None:
+        return DefaultAsyncHttpxClient(limits=limits)
+    return DefaultAsyncHttpxClient(limits=limits, timeout=httpx.Timeout(timeout))
+
+
+@functools.lru_cache(maxsize=128)
+def _decode_jwt_payload(jwt_token: str) -> Any:
+    """
+    Decode the claims of a software_statement JWT.
+    
+    Results are cached per token, so clients created repeatedly from the same
+    config decode the statement only once. Invalid tokens raise and are not
+    cached. The returned payload is shared between callers and must not be
+    modified.
+    
+    Args:
+        jwt_token: The JWT token string
+        
+    Returns:
+        The decoded JWT payload
+    """
+    # PyJWT validates the token format (three segments, padding, JSON payload);
+    # only the claims are needed, so no signature or expiry checks are made
+    return jwt_lib.decode(jwt_token, options={"verify_signature": False, "verify_exp": False})
+
+
+class _RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute throttle built from two token buckets.
+    
+    Both buckets start full and refill continuously; acquire() waits until the
+    request and its estimated tokens fit. Waiters are served in arrival order.
+    """
+    
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rpm: Requests allowed per minute (None for no request limit)
+            tpm: Tokens allowed per minute (None for no token limit)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm) if rpm else 0.0
+        self._tokens = float(tpm) if tpm else 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+    
+    async def acquire(self, est_tokens: int = 0) -> None:
+        """
+        Wait until one request using about `est_tokens` tokens may be sent.
+        
+        Args:
+            est_tokens: Estimated prompt plus completion tokens of the request
+        """
+        async with self._lock:
+            # A request larger than the whole budget only waits for a full bucket
+            if self.tpm:
+                est_tokens = min(est_tokens, self.tpm)
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.rpm and self._requests < 1:
+                    wait = max(wait, (1 - self._requests) * 60.0 / self.rpm)
+                if self.tpm and self._tokens < est_tokens:
+                    wait = max(wait, (est_tokens - self._tokens) * 60.0 / self.tpm)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.rpm:
+                self._requests -= 1
+            if self.tpm:
+                self._tokens -= est_tokens
+
 
 class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
     """
@@ -74,35 +237,26 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             return None
             
         try:
-            # Validate JWT format
-            parts = jwt_token.split('.')
-            if len(parts) != 3:
-                logging.warning("Invalid JWT format: expected 3 parts")
-                return None
-            
-            # Use PyJWT for secure parsing
             if verify_signature:
                 # In production, this should use a proper secret/key
                 # For now, we'll decode without verification but log a warning
                 logging.warning("JWT signature verification is disabled. Enable in production!")
-                payload = jwt_lib.decode(jwt_token, options={"verify_signature": False})
-            else:
-                # Decode without signature verification (current behavior)
-                payload = jwt_lib.decode(jwt_token, options={"verify_signature": False})
+            
+            payload = _decode_jwt_payload(jwt_token)
             
             # Validate payload structure
             if not isinstance(payload, dict):
                 logging.warning("JWT payload is not a valid dictionary")
                 return None
             
-            # Look for system_prompt in various possible locations
-            system_prompt = payload.get('system_prompt') or payload.get('systemPrompt')
-            
-            # Check nested structures if needed
-            if not system_prompt and 'claims' in payload:
-                claims = payload.get('claims', {})
-                if isinstance(claims, dict):
-                    system_prompt = claims.get('system_prompt') or claims.get('systemPrompt')
+            # Look for system_prompt at the top level, then in nested claims
+            claims = payload.get('claims')
+            if not isinstance(claims, dict):
+                claims = {}
+            system_prompt = (
+                payload.get('system_prompt') or payload.get('systemPrompt')
+                or claims.get('system_prompt') or claims.get('systemPrompt')
+            )
             
             # Validate system prompt if found
             if system_prompt and isinstance(system_prompt, str):
@@ -293,16 +447,38 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         EnhancedMCPClient.__init__(self, config["agentServers"]["viaNexus"])
         
         # Ensure _exit_stack is available for resource cleanup
-        if not hasattr(self, '_exit_stack') or self._exit_stack is None:
-            from contextlib import AsyncExitStack
+        if getattr(self, '_exit_stack', None) is None:
             self._exit_stack = AsyncExitStack()
         
+        # Set up front so the per-question checks are plain attribute reads;
+        # PersistentOpenAiClient manages it once a persistent connection exists
+        self._connection_active = False
+        
         # OpenAI-specific configuration
-        self.openai = AsyncOpenAI(api_key=config.get("LLM_API_KEY"))
+        http_pool = config.get("http_pool")
+        self._http_client = _build_http_client(http_pool) if http_pool else None
+        self.openai = AsyncOpenAI(api_key=config.get("LLM_API_KEY"), http_client=self._http_client)
         self.model = config.get("LLM_MODEL", "gpt-4o-mini")
         self.max_tokens = config.get("max_tokens", 1000)
-        self.messages = []  # Local message cache
         self.max_history_length = config.get("max_history_length", 50)
+        # Local message cache; the deque drops the oldest messages beyond max_history_length
+        self.messages = deque(maxlen=self.max_history_length)
+        # Pre-rendered "role: content" lines of the last messages, joined lazily
+        self._context_lines = deque(maxlen=min(CONTEXT_WINDOW_MESSAGES, self.max_history_length))
+        self._context_str: Optional[str] = None
+        # Optional client-side throttle, e.g. {"rpm": 500, "tpm": 200000, "max_retries": 3}
+        rate_limits = config.get("openai_rate_limits")
+        self._limiter = _RateLimiter(rate_limits.get("rpm"), rate_limits.get("tpm")) if rate_limits else None
+        self._rate_limit_retries = rate_limits.get("max_retries", 3) if rate_limits else 0
+        # Streamed text is flushed to stdout once this many characters are buffered
+        self.stream_flush_bytes = config.get("stream_flush_bytes", 512)
+        # Maximum number of MCP tool calls from one turn that run at the same time
+        self.tool_concurrency = config.get("tool_concurrency", 8)
+        
+        # Mapped MCP tools are cached for tools_ttl seconds
+        self._cached_tools: Optional[list] = None
+        self._tools_cache_ts = 0.0
+        self.tools_ttl = config.get("tools_cache_ttl", 300)
         
         # Determine system prompt priority: config > JWT > default
         self.system_prompt = config.get("system_prompt")
@@ -337,23 +513,84 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         }
 
     async def _get_available_tools(self) -> list:
-        """Get list of available MCP tools."""
+        """
+        Get list of available MCP tools.
+        
+        The mapped tool list is cached for tools_ttl seconds (`tools_cache_ttl`
+        config, default 300) so repeated questions skip the list_tools()
+        round-trip; call invalidate_tools_cache() to force a refresh.
+        """
         if not self.session:
             return []
         
+        if self._cached_tools is not None and time.monotonic() - self._tools_cache_ts < self.tools_ttl:
+            return self._cached_tools
+        
         try:
             tool_list = await self.session.list_tools()
-            return [self._map_tool(t) for t in (tool_list.tools or [])]
+            self._store_tools_cache(tool_list)
+            return self._cached_tools
         except Exception as e:
             logging.error("Error listing tools: %s", e)
             return []
+    
+    def _store_tools_cache(self, tool_list) -> None:
+        """
+        Map an MCP tool listing and cache it with a fresh timestamp.
+        
+        The same list object is passed to every responses.create call until the
+        cache expires; the tool names are logged here once per refresh instead
+        of formatting the definitions on every request.
+        """
+        self._cached_tools = [self._map_tool(t) for t in (tool_list.tools or [])]
+        self._tools_cache_ts = time.monotonic()
+        logging.info("Cached %d tools: %s", len(self._cached_tools), [t["name"] for t in self._cached_tools])
+    
+    def invalidate_tools_cache(self) -> None:
+        """Drop the cached tools so the next question re-lists them from the MCP server."""
+        self._cached_tools = None
+        self._tools_cache_ts = 0.0
+
+    async def _create_response(self, **kwargs):
+        """
+        Call the responses API, honouring the `openai_rate_limits` throttle.
+        
+        When rate limits are configured each request first waits for the
+        limiter, and a 429 that survives the SDK's own retries is retried with
+        exponential backoff up to `max_retries` more times.
+        
+        Args:
+            **kwargs: Arguments for openai.responses.create
+            
+        Returns:
+            The response, or the event stream when stream=True
+        """
+        if self._limiter is None:
+            return await self.openai.responses.create(**kwargs)
+        
+        # Rough estimate: 4 characters per token for the prompt, plus the completion budget
+        est_tokens = (len(str(kwargs.get("input", ""))) + len(kwargs.get("instructions") or "")) // 4
+        est_tokens += kwargs.get("max_output_tokens") or 0
+        
+        attempt = 0
+        while True:
+            await self._limiter.acquire(est_tokens)
+            try:
+                return await self.openai.responses.create(**kwargs)
+            except RateLimitError as e:
+                if attempt >= self._rate_limit_retries:
+                    raise
+                delay = 2 ** attempt
+                attempt += 1
+                logging.warning("OpenAI rate limit hit, retrying in %ss (attempt %d): %s", delay, attempt, e)
+                await asyncio.sleep(delay)
 
     async def _stream_assistant(self, input_text, tools, timeout=60):
         """Stream assistant response with tool call handling using responses API"""
         text_out = []
         pending = {}
 
-        stream = await self.openai.responses.create(
+        stream = await self._create_response(
             model=self.model,
             input=input_text,
             instructions=self.system_prompt,
@@ -364,35 +601,55 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             tool_choice="auto",
         )
 
+        text_out_append = text_out.append
+        pending_setdefault = pending.setdefault
+        # Deltas are written to stdout in batches rather than one flush per token
+        stdout_buf = []
+        stdout_chars = 0
+        flush_chars = self.stream_flush_bytes
         async for event in stream:
-            # Handle different event types from responses API
-            if hasattr(event, 'type'):
-                if event.type == 'response.text.delta':
-                    if hasattr(event, 'delta') and event.delta:
-                        print(event.delta, end="", flush=True)
-                        text_out.append(event.delta)
-                elif event.type == 'response.tool_calls.delta':
-                    # Handle tool call deltas from responses API
-                    if hasattr(event, 'tool_calls'):
-                        for tc in event.tool_calls:
-                            idx = getattr(tc, "index", None)
-                            if idx is None:
-                                continue  # ignore until index arrives
-                            slot = pending.setdefault(idx, {"id": None, "name": None, "arguments": ""})
-
-                            if getattr(tc, "id", None):
-                                slot["id"] = tc.id
-
-                            fn = getattr(tc, "function", None)
-                            if fn:
-                                if getattr(fn, "name", None):
-                                    slot["name"] = fn.name
-                                if getattr(fn, "arguments", None):
-                                    slot["arguments"] += fn.arguments
+            # Handle different event types from responses API; each attribute is read once
+            etype = getattr(event, 'type', None)
+            if etype == 'response.text.delta':
+                delta = getattr(event, 'delta', None)
+                if delta:
+                    text_out_append(delta)
+                    stdout_buf.append(delta)
+                    stdout_chars += len(delta)
+                    if stdout_chars >= flush_chars or len(stdout_buf) >= 32:
+                        sys.stdout.write("".join(stdout_buf))
+                        sys.stdout.flush()
+                        stdout_buf.clear()
+                        stdout_chars = 0
+            elif etype == 'response.tool_calls.delta':
+                # Handle tool call deltas from responses API
+                for tc in getattr(event, 'tool_calls', None) or ():
+                    idx = getattr(tc, "index", None)
+                    if idx is None:
+                        continue  # ignore until index arrives
+                    # Argument fragments are collected in a list and joined once at the end
+                    slot = pending_setdefault(idx, {"id": None, "name": None, "arguments": []})
+
+                    tc_id = getattr(tc, "id", None)
+                    if tc_id:
+                        slot["id"] = tc_id
+
+                    fn = getattr(tc, "function", None)
+                    if fn:
+                        fn_name = getattr(fn, "name", None)
+                        if fn_name:
+                            slot["name"] = fn_name
+                        fn_args = getattr(fn, "arguments", None)
+                        if fn_args:
+                            slot["arguments"].append(fn_args)
+
+        if stdout_buf:
+            sys.stdout.write("".join(stdout_buf))
+            sys.stdout.flush()
 
         # Finalize tool_calls: only keep complete ones
         complete_calls = []
-        for idx in sorted(pending.keys()):
+        for idx in sorted(pending):
             call = pending[idx]
             if call["id"] and call["name"]:
                 complete_calls.append({
@@ -400,7 +657,7 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                     "type": "function",
                     "function": {
                         "name": call["name"],
-                        "arguments": call["arguments"] or "{}",
+                        "arguments": "".join(call["arguments"]) or "{}",
                     },
                 })
 
@@ -414,50 +671,65 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         return assistant_msg["content"], {}, assistant_msg
 
     async def _execute_tool_calls(self, tool_calls_by_id: dict) -> list:
-        """Execute MCP tool calls and return results."""
-        result_blocks = []
+        """
+        Execute MCP tool calls and return results.
+        
+        The calls of one turn are independent, so they run concurrently (at most
+        tool_concurrency at a time) and the turn costs about as long as the
+        slowest tool. Results keep the order of the calls.
+        """
+        semaphore = asyncio.Semaphore(self.tool_concurrency)
+        # Bound once for all calls of the turn
+        call_tool = self.session.call_tool
         
-        for call_id, call in tool_calls_by_id.items():
-            name = call["function"]["name"]
-            arg_str = call["function"]["arguments"] or "{}"
+        async def _run_one(call_id: str, call: dict) -> dict:
+            function = call["function"]
+            name = function["name"]
+            arg_str = function["arguments"] or "{}"
             
             try:
-                args = json.loads(arg_str) if arg_str.strip() else {}
-            except json.JSONDecodeError:
+                args = _loads(arg_str) if arg_str.strip() else {}
+            except ValueError:
+                # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
                 args = {"_raw": arg_str}
 
             try:
-                logging.info(f"Calling tool: {name} with args: {args}")
-                result = await self.session.call_tool(name, args)
+                logging.info("Calling tool: %s with args: %s", name, args)
+                async with semaphore:
+                    result = await call_tool(name, args)
                 payload = getattr(result, "content", result)
                 
-                # Handle different payload types safely
-                text_payload = ""
-                if isinstance(payload, list):
-                    if len(payload) > 0 and hasattr(payload[0], 'text'):
-                        text_payload = payload[0].text
-                    elif len(payload) > 0:
-                        text_payload = str(payload[0])
-                    else:
-                        text_payload = "No content returned"
-                elif isinstance(payload, dict):
-                    text_payload = payload.get('text', payload.get('content', str(payload)))
-                else:
-                    text_payload = str(payload)
-                
-                result_blocks.append({
+                return {
                     "type": "tool_result",
                     "tool_call_id": call_id,
-                    "content": text_payload[:100_000]  # Truncate large responses
-                })
+                    # Handle different payload types safely, truncating large responses
+                    "content": _to_text_limited(payload, MAX_TOOL_RESULT_CHARS)
+                }
                 
             except Exception as e:
                 logging.error("Tool '%s' failed: %s", name, e)
-                result_blocks.append({
+                return {
                     "type": "tool_result",
                     "tool_call_id": call_id,
                     "content": f"Error calling tool '{name}': {e}"
-                })
+                }
+        
+        results = await asyncio.gather(
+            *(_run_one(call_id, call) for call_id, call in tool_calls_by_id.items()),
+            return_exceptions=True
+        )
+        
+        result_blocks = []
+        for (call_id, call), result in zip(tool_calls_by_id.items(), results):
+            if isinstance(result, BaseException):
+                name = call["function"]["name"]
+                logging.error("Tool '%s' failed: %s", name, result)
+                result = {
+                    "type": "tool_result",
+                    "tool_call_id": call_id,
+                    "content": f"Error calling tool '{name}': {result}"
+                }
+            result_blocks.append(result)
         
         return result_blocks
 
@@ -470,19 +742,16 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             return "Error: MCP session not initialized."
 
         tools = await self._get_available_tools()
-        self.messages.append({"role": "user", "content": query})
+        self._append_message("user", query)
 
         while True:
             # Prepare input text from conversation history for responses API
-            conversation_context = "\n".join([
-                f"{msg['role']}: {msg['content']}" for msg in self.messages[-10:]  # Last 10 messages for context
-            ])
-            current_input = conversation_context
+            current_input = self._get_context_str()
 
             text, tool_calls, assistant_msg = await self._stream_assistant(current_input, tools)
             
             # Store assistant message in conversation history
-            self.messages.append({"role": "assistant", "content": text})
+            self._append_message("assistant", text)
 
             if not tool_calls:
                 print()
@@ -494,10 +763,7 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             
             # Add tool results as user messages (OpenAI conversation pattern)
             for result in result_blocks:
-                self.messages.append({
-                    "role": "user", 
-                    "content": f"Tool '{result['tool_call_id']}' result: {result['content']}"
-                })
+                self._append_message("user", f"Tool '{result['tool_call_id']}' result: {result['content']}")
 
     def _convert_memory_to_openai_messages(self, memory_messages: list) -> list:
         """Convert universal memory messages to OpenAI format."""
@@ -523,20 +789,117 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         
         return openai_messages
 
+    def _append_message(self, role: str, content: str) -> None:
+        """Append a message to the history and to the rendered context window."""
+        self.messages.append({"role": role, "content": content})
+        self._context_lines.append(f"{role}: {content}")
+        self._context_str = None
+    
+    def _reset_context_lines(self) -> None:
+        """Re-render the context window after self.messages was replaced."""
+        self._context_lines.clear()
+        start = max(0, len(self.messages) - self._context_lines.maxlen)
+        self._context_lines.extend(
+            f"{msg['role']}: {msg['content']}" for msg in islice(self.messages, start, None)
+        )
+        self._context_str = None
+    
+    def _get_context_str(self) -> str:
+        """
+        Return the last messages rendered as the responses API input.
+        
+        The lines are rendered once when a message is appended and the joined
+        string is reused until the next append, so tool-call iterations do not
+        re-render the whole window.
+        """
+        if self._context_str is None:
+            self._context_str = "\n".join(self._context_lines)
+        return self._context_str
+
     def _trim_history(self):
-        """Keep conversation history within reasonable bounds"""
-        if len(self.messages) > self.max_history_length:
-            self.messages = self.messages[-self.max_history_length:]
+        """
+        Keep conversation history within reasonable bounds.
+        
+        Kept for compatibility: self.messages is a deque bounded by
+        max_history_length, so appends already discard the oldest messages.
+        """
 
     async def ask_single_question(self, question: str) -> str:
         """
         Ask a single question without maintaining conversation history.
         Works with both persistent connections and creates temporary connections as needed.
         """
+        return await self._run_with_session(lambda: self._ask_single_question_with_session(question))
+    
+    async def ask_questions_batch(
+        self,
+        questions: List[str],
+        max_concurrency: int = 16,
+        use_memory: bool = False
+    ) -> List[str]:
+        """
+        Ask several independent questions concurrently.
+        
+        Every question is answered like ask_single_question, without conversation
+        history (maintain_history is not supported in batch mode). All questions
+        share one MCP session - the persistent one, or a single temporary
+        connection opened for the whole batch.
+        
+        Args:
+            questions: The questions to ask
+            max_concurrency: Maximum number of questions in flight at the same time
+            use_memory: Whether to save the questions and answers to memory (one bulk write)
+            
+        Returns:
+            The answers in question order; a failed question yields an "Error: ..." string
+        """
+        if not questions:
+            return []
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(question: str) -> str:
+            async with semaphore:
+                try:
+                    return await self._ask_single_question_with_session(question)
+                except Exception as e:
+                    logging.error("Error answering batch question: %s", e)
+                    return f"Error: {e}"
+        
+        async def _all() -> List[str]:
+            return list(await asyncio.gather(*map(_one, questions)))
+        
+        answers = await self._run_with_session(_all)
+        if isinstance(answers, str):
+            # The MCP connection could not be established
+            answers = [answers] * len(questions)
+        
+        if use_memory:
+            pending_saves = []
+            for question, answer in zip(questions, answers):
+                pending_saves.append(("user", question))
+                pending_saves.append(("assistant", answer))
+            await self.memory_save_messages(pending_saves)
+        
+        return answers
+    
+    async def _run_with_session(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run an operation that needs an MCP session.
+        
+        Uses the persistent connection when one is active; otherwise a temporary
+        connection is opened for the duration of the operation.
+        
+        Args:
+            operation: Coroutine function to run once the session is available
+            
+        Returns:
+            The operation's result, or an error string if no connection could be made
+        """
         # Check if we have a persistent connection
-        if hasattr(self, '_connection_active') and self._connection_active and self.session:
+        if self._connection_active and self.session:
             # Use existing persistent connection
-            return await self._ask_single_question_with_session(question)
+            return await operation()
         else:
             # Create temporary connection for this request
             async with self.connection_manager.connection_context() as (readstream, writestream, get_session_id):
@@ -547,10 +910,10 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
                     return "Error: Failed to establish MCP connection."
                 
                 try:
-                    return await self._ask_single_question_with_session(question)
+                    return await operation()
                 finally:
                     # Clean up temporary session
-                    if hasattr(self, '_exit_stack') and self._exit_stack:
+                    if self._exit_stack:
                         try:
                             await self._exit_stack.aclose()
                             self.session = None
@@ -562,14 +925,14 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         # Get available tools
         tools = await self._get_available_tools()
 
-        logging.info(f"Tools: {tools}")
+        logging.debug("Using %d cached tool definitions", len(tools))
         
         response_content = ""
         current_input = question
         
         while True:
             # Call OpenAI responses API (non-streaming for single questions)
-            response = await self.openai.responses.create(
+            response = await self._create_response(
                 model=self.model,
                 max_output_tokens=self.max_tokens,
                 input=current_input,
@@ -623,7 +986,11 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
             memory_messages = await self.memory_load_history()
             if memory_messages:
                 # Convert memory messages to OpenAI format
-                self.messages = self._convert_memory_to_openai_messages(memory_messages)
+                self.messages = deque(
+                    self._convert_memory_to_openai_messages(memory_messages),
+                    maxlen=self.max_history_length
+                )
+                self._reset_context_lines()
                 logging.debug(f"Loaded {len(memory_messages)} messages from memory")
         
         # Save user question to memory
@@ -632,64 +999,63 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
         
         if maintain_history:
             # Add to ongoing conversation
-            self.messages.append({"role": "user", "content": question})
+            self._append_message("user", question)
             
             tools = await self._get_available_tools()
             response_content = ""
             
-            while True:
-                # Prepare conversation context for responses API
-                conversation_context = "\n".join([
-                    f"{msg['role']}: {msg['content']}" for msg in self.messages[-10:]  # Last 10 messages
-                ])
+            # Messages of this turn, written to memory in one batch when the turn ends
+            pending_saves = []
+            
+            try:
+                while True:
+                    # Prepare conversation context for responses API
+                    conversation_context = self._get_context_str()
                 
-                logging.info(f"Tools: {tools[0] if tools else 'No tools available'}")
+                    logging.debug("Using %d cached tool definitions", len(tools))
                 
-                response = await self.openai.responses.create(
-                    model=self.model,
-                    max_output_tokens=self.max_tokens,
-                    input=conversation_context,
-                    instructions=self.system_prompt,
-                    tools=tools or None
-                )
+                    response = await self._create_response(
+                        model=self.model,
+                        max_output_tokens=self.max_tokens,
+                        input=conversation_context,
+                        instructions=self.system_prompt,
+                        tools=tools or None
+                    )
                 
-                # Extract content from responses API
-                assistant_content = ""
-                if hasattr(response, 'output') and response.output:
-                    if hasattr(response.output, 'content'):
-                        assistant_content = response.output.content
-                        response_content += assistant_content
+                    # Extract content from responses API
+                    assistant_content = ""
+                    if hasattr(response, 'output') and response.output:
+                        if hasattr(response.output, 'content'):
+                            assistant_content = response.output.content
+                            response_content += assistant_content
                 
-                self.messages.append({
-                    "role": "assistant", 
-                    "content": assistant_content
-                })
+                    self._append_message("assistant", assistant_content)
                 
-                # Save assistant response to memory
-                if use_memory:
-                    await self.memory_save_message("assistant", assistant_content)
+                    # Queue assistant response for memory
+                    if use_memory:
+                        pending_saves.append(("assistant", assistant_content))
                 
-                # Check for tool calls in responses API format
-                if not hasattr(response, 'tool_calls') or not response.tool_calls:
-                    break
+                    # Check for tool calls in responses API format
+                    if not hasattr(response, 'tool_calls') or not response.tool_calls:
+                        break
                 
-                # Execute tools
-                tool_calls_by_id = {tc.id: {
-                    "function": {"name": tc.function.name, "arguments": tc.function.arguments}
-                } for tc in response.tool_calls}
+                    # Execute tools
+                    tool_calls_by_id = {tc.id: {
+                        "function": {"name": tc.function.name, "arguments": tc.function.arguments}
+                    } for tc in response.tool_calls}
                 
-                result_blocks = await self._execute_tool_calls(tool_calls_by_id)
+                    result_blocks = await self._execute_tool_calls(tool_calls_by_id)
                 
-                # Add tool results to conversation
-                for result in result_blocks:
-                    self.messages.append({
-                        "role": "user",
-                        "content": f"Tool result: {result['content']}"
-                    })
+                    # Add tool results to conversation
+                    for result in result_blocks:
+                        self._append_message("user", f"Tool result: {result['content']}")
                     
-                    # Save tool results to memory
-                    if use_memory:
-                        await self.memory_save_message("user", result['content'], "tool_result")
+                        # Queue tool results for memory
+                        if use_memory:
+                            pending_saves.append(("user", result['content'], "tool_result"))
+            finally:
+                if pending_saves:
+                    await self.memory_save_messages(pending_saves)
             
             self._trim_history()
             return response_content.strip()
@@ -717,11 +1083,19 @@ class OpenAiClient(BaseLLMClient, EnhancedMCPClient, ConversationMemoryMixin):
     
     async def cleanup(self) -> None:
         """Clean up resources and close connections."""
-        if hasattr(self, '_exit_stack') and self._exit_stack:
+        if self._exit_stack:
             try:
                 await self._exit_stack.aclose()
             except Exception as e:
                 logging.error(f"Error closing session: {e}")
+        self.invalidate_tools_cache()
+        
+        # Release the pooled HTTP connections created from the http_pool option
+        if self._http_client is not None:
+            try:
+                await self._http_client.aclose()
+            except Exception as e:
+                logging.debug(f"Error closing OpenAI HTTP client: {e}")
     
     # provider_name, model_name and system_prompt are already implemented via memory mixin, base class and instance attribute
 
@@ -755,6 +1129,15 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
         self._mcp_session_id = None
         self._connection_task_group = None
         self._connection_task = None
+        # Open the persistent connection on the first single question instead of
+        # paying a fresh MCP handshake for every call
+        self._auto_persistent = config.get("auto_persistent_connection", True)
+        # Successful health checks are trusted for health_check_ttl seconds
+        self._last_health_check: float = 0.0
+        self._health_ttl: float = config.get("health_check_ttl", 5.0)
+        # Serializes establish_persistent_connection so concurrent callers
+        # share one reconnect instead of each opening a connection
+        self._reconnect_lock = asyncio.Lock()
         
         # For persistent clients, we can eagerly initialize the memory session
         # since they're typically used for longer-running conversations
@@ -786,7 +1169,7 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
         return self.memory_session_id
     
     async def _verify_connection_health(self) -> bool:
-        """Verify that the persistent connection is still healthy."""
+        """Probe the persistent connection with a round-trip to the server."""
         if not self._connection_active or not self._mcp_session_id:
             logging.debug("Connection not active or no MCP session ID")
             return False
@@ -796,77 +1179,96 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
             return False
         
         try:
-            # Try to list tools as a health check
-            await self.session.list_tools()
+            # Ping is the cheapest liveness probe; older sessions fall back to
+            # list_tools() and keep the result for the next tools lookup
+            if hasattr(self.session, 'send_ping'):
+                await self.session.send_ping()
+            else:
+                self._store_tools_cache(await self.session.list_tools())
+            self._last_health_check = time.monotonic()
             logging.debug("Connection health check passed")
             return True
         except Exception as e:
             logging.warning(f"Connection health check failed: {e}")
             # Mark connection as inactive
             self._connection_active = False
+            self._last_health_check = 0.0
+            self.invalidate_tools_cache()
             return False
     
+    async def _verify_connection_health_cached(self) -> bool:
+        """Verify the persistent connection, skipping the probe if it passed within health_check_ttl seconds."""
+        if (
+            self._connection_active
+            and self._mcp_session_id
+            and self.session
+            and time.monotonic() - self._last_health_check < self._health_ttl
+        ):
+            return True
+        return await self._verify_connection_health()
+    
     async def establish_persistent_connection(self) -> str:
         """Establish and maintain a persistent MCP connection."""
-        # First check if existing connection is still healthy
-        if self._connection_active and self._mcp_session_id:
-            if await self._verify_connection_health():
-                logging.debug(f"Reusing healthy persistent connection: {self._mcp_session_id}")
-                return self._mcp_session_id
-            else:
-                logging.info("Existing connection unhealthy, re-establishing...")
-                await self.close_persistent_connection()
-            
-        try:
-            # Ensure auth layer is set up first
-            if not await self.setup_connection():
-                raise RuntimeError("Failed to setup connection")
-            
-            # Set up the connection context that will stay open
-            self._connection_context = await self._persistent_exit_stack.enter_async_context(
-                self.connection_manager.connection_context()
-            )
-            
-            readstream, writestream, get_session_id = self._connection_context
-            
-            # Set the streams on the client
-            self.readstream = readstream
-            self.writestream = writestream
-            
-            # Connect to the MCP server
-            if not await self.connect_to_server():
-                raise RuntimeError("Failed to initialize MCP session")
-            
-            # Get the session ID from the connection
+        # Callers that waited for the lock find the connection another caller
+        # just established and reuse it through the health check below
+        async with self._reconnect_lock:
+            # First check if existing connection is still healthy
+            if self._connection_active and self._mcp_session_id:
+                if await self._verify_connection_health_cached():
+                    logging.debug("Reusing healthy persistent connection: %s", self._mcp_session_id)
+                    return self._mcp_session_id
+                else:
+                    logging.info("Existing connection unhealthy, re-establishing...")
+                    await self.close_persistent_connection()
+                
             try:
+                # Ensure auth layer is set up first
+                if not await self.setup_connection():
+                    raise RuntimeError("Failed to setup connection")
+                
+                # Set up the connection context that will stay open
+                self._connection_context = await self._persistent_exit_stack.enter_async_context(
+                    self.connection_manager.connection_context()
+                )
+                
+                readstream, writestream, get_session_id = self._connection_context
+                
+                # Set the streams on the client
+                self.readstream = readstream
+                self.writestream = writestream
+                
+                # Connect to the MCP server
+                if not await self.connect_to_server():
+                    raise RuntimeError("Failed to initialize MCP session")
+                
+                # Get the session ID from the connection
                 mcp_session_id = get_session_id() if get_session_id else None
                 if not mcp_session_id:
                     raise RuntimeError("Failed to get MCP session ID")
                 
                 self._mcp_session_id = str(mcp_session_id)
                 self._connection_active = True
-                logging.info(f"Established persistent MCP connection: {self._mcp_session_id}")
+                logging.info("Established persistent MCP connection: %s", self._mcp_session_id)
                 
                 return self._mcp_session_id
                 
             except Exception as e:
-                raise RuntimeError(f"Failed to get MCP session ID: {e}")
-                
-        except Exception as e:
-            logging.error(f"Error establishing persistent MCP connection: {e}")
-            await self.close_persistent_connection()
-            raise RuntimeError(f"Failed to establish persistent MCP connection: {e}")
+                logging.error(f"Error establishing persistent MCP connection: {e}")
+                await self.close_persistent_connection()
+                raise RuntimeError(f"Failed to establish persistent MCP connection: {e}")
     
     async def close_persistent_connection(self):
         """Close the persistent MCP connection."""
         try:
             if self._persistent_exit_stack:
                 # Try to close the exit stack gracefully
+                closed = False
                 try:
                     await self._persistent_exit_stack.aclose()
+                    closed = True
                     logging.debug("Successfully closed persistent exit stack")
                 except RuntimeError as e:
-                    if "different task" in str(e) or "cancel scope" in str(e):
+                    if _is_task_boundary_error(e):
                         # This is expected when closing across task boundaries
                         # The resources are likely already cleaned up by the connection context manager
                         logging.debug(f"Exit stack cleanup skipped due to task boundary: {e}")
@@ -875,8 +1277,10 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
                 except Exception as e:
                     logging.warning(f"Error closing exit stack: {e}")
                 
-                # Always create a fresh exit stack for future connections
-                self._persistent_exit_stack = AsyncExitStack()
+                # A cleanly closed stack is empty and can be reused for the next
+                # connection; only a failed close may leave callbacks behind
+                if not closed:
+                    self._persistent_exit_stack = AsyncExitStack()
             
             # Reset connection state
             self._connection_active = False
@@ -884,14 +1288,11 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
             self._connection_context = None
             self._connection_task_group = None
             self._connection_task = None
+            self._last_health_check = 0.0
+            self.invalidate_tools_cache()
             
-            # Force cleanup of any remaining session resources
-            if hasattr(self, 'session') and self.session:
-                try:
-                    # The session should be cleaned up by the exit stack, but just in case
-                    self.session = None
-                except Exception as e:
-                    logging.debug(f"Error clearing session reference: {e}")
+            # The session is cleaned up with the connection; drop the stale reference
+            self.session = None
             
             logging.info("Closed persistent MCP connection")
         except Exception as e:
@@ -905,9 +1306,7 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
     @property
     def is_connected(self) -> bool:
         """Check if the persistent connection is active."""
-        is_active = self._connection_active and self._mcp_session_id is not None
-        logging.debug(f"Connection status check: active={self._connection_active}, mcp_session_id={self._mcp_session_id}, result={is_active}")
-        return is_active
+        return self._connection_active and self._mcp_session_id is not None
     
     async def ask_with_persistent_session(
         self, 
@@ -928,25 +1327,22 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
         Returns:
             The response as a string
         """
-        # Check connection health and auto-establish if needed
-        logging.info(f"Auto-establish connection: {auto_establish_connection}")
+        # establish_persistent_connection checks health itself and reuses a healthy connection
+        logging.info("Auto-establish connection: %s", auto_establish_connection)
         if auto_establish_connection:
-            if not self.is_connected or not await self._verify_connection_health():
-                try:
-                    mcp_session_id = await self.establish_persistent_connection()
-                    logging.info(f"Established persistent MCP connection: {mcp_session_id}")
-                except Exception as e:
-                    logging.error(f"Failed to establish MCP connection: {e}")
-                    raise RuntimeError(f"Could not establish persistent MCP connection: {e}")
-        
-        if not self.is_connected:
+            try:
+                await self.establish_persistent_connection()
+            except Exception as e:
+                logging.error(f"Failed to establish MCP connection: {e}")
+                raise RuntimeError(f"Could not establish persistent MCP connection: {e}")
+        elif not self.is_connected:
             raise RuntimeError("No persistent MCP connection available. Call establish_persistent_connection() first or set auto_establish_connection=True")
         
         if not self.session:
             raise RuntimeError("MCP session not initialized")
         
         # Use the ask_question method which integrates with memory system
-        logging.info(f"Asking question: {question}")
+        logging.info("Asking question: %s", question)
         return await self.ask_question(
             question=question,
             maintain_history=maintain_history,
@@ -954,6 +1350,42 @@ class PersistentOpenAiClient(BasePersistentLLMClient, OpenAiClient):
             load_from_memory=use_memory
         )
     
+    async def ask_single_question(self, question: str) -> str:
+        """
+        Ask a single question without maintaining conversation history.
+        
+        Unless `auto_persistent_connection` is disabled in the config, the first
+        call establishes the persistent MCP connection and later calls reuse it,
+        rather than opening and tearing down a temporary connection each time.
+        If the connection cannot be established the question still runs over a
+        temporary connection.
+        """
+        if self._auto_persistent and not self.is_connected:
+            try:
+                await self.establish_persistent_connection()
+            except RuntimeError as e:
+                logging.warning("Could not auto-establish persistent connection, using a temporary one: %s", e)
+        return await super().ask_single_question(question)
+    
+    async def ask_questions_batch(
+        self,
+        questions: List[str],
+        max_concurrency: int = 16,
+        use_memory: bool = False
+    ) -> List[str]:
+        """
+        Ask several independent questions concurrently over the persistent connection.
+        
+        Like ask_single_question, the connection is established first unless
+        `auto_persistent_connection` is disabled.
+        """
+        if self._auto_persistent and not self.is_connected:
+            try:
+                await self.establish_persistent_connection()
+            except RuntimeError as e:
+                logging.warning("Could not auto-establish persistent connection, using a temporary one: %s", e)
+        return await super().ask_questions_batch(questions, max_concurrency=max_concurrency, use_memory=use_memory)
+    
     async def cleanup(self) -> None:
         """Clean up both persistent and base class resources."""
         await self.close_persistent_connection()
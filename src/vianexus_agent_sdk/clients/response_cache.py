@@ -0,0 +1,75 @@
+"""
+Response cache for deterministic LLM requests.
+
+Clients only consult the cache when sampling is deterministic (temperature 0),
+so a repeated request can be answered from the cache without a network call.
+Any object exposing async `get(key)` / `set(key, value)` can be used as a
+backend (e.g. a thin Redis wrapper); InMemoryResponseCache is the default.
+"""
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class InMemoryResponseCache:
+    """
+    Process-local LRU cache with per-entry TTL for final LLM text responses.
+
+    Only answers the model gave without calling tools should be stored here -
+    answers built from tool results depend on live data and must always reach
+    the model (and the tools) again.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept before the least recently used is evicted
+            ttl_seconds: Seconds a cached response stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key for the request
+
+        Returns:
+            The cached response text, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key for the request
+            value: Final response text
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,7 +4,11 @@ Debugging utilities for troubleshooting persistent session and memory issues.
 
 import asyncio
 import logging
+import random
+import secrets
+import sys
 import time
+from collections import deque
 from typing import Dict, Any, Optional
 from contextlib import asynccontextmanager
 
@@ -12,19 +16,72 @@ from contextlib import asynccontextmanager
 class PersistentSessionDebugger:
     """Comprehensive debugging utilities for persistent session issues."""
     
-    def __init__(self, client):
+    # Logging function for each debug level; unknown levels log as INFO
+    _LOG_FUNCS = {
+        "DEBUG": logging.debug,
+        "INFO": logging.info,
+        "WARNING": logging.warning,
+        "ERROR": logging.error,
+    }
+    
+    def __init__(self, client, max_logs: int = 10_000):
+        """
+        Initialize the debugger.
+        
+        Args:
+            client: Persistent LLM client to debug
+            max_logs: Maximum number of debug log entries kept; the oldest are
+                dropped first so long monitoring runs use bounded memory
+        """
         self.client = client
-        self.debug_logs = []
+        self.debug_logs = deque(maxlen=max_logs)
+        # Running totals kept by log_debug so reports don't rescan the logs
+        self._error_count = 0
+        self._warning_count = 0
+        self._recent_errors = deque(maxlen=5)
+        # Upper bound in seconds on the retry backoff in safe_ask_with_persistent_session
+        self._max_backoff = 10.0
     
     def log_debug(self, message: str, level: str = "INFO"):
         """Add debug message with timestamp."""
         timestamp = time.time()
-        self.debug_logs.append({
+        entry = {
             "timestamp": timestamp,
             "level": level,
             "message": message
-        })
-        getattr(logging, level.lower())(f"[DEBUG] {message}")
+        }
+        self.debug_logs.append(entry)
+        if level == "ERROR":
+            self._error_count += 1
+            self._recent_errors.append(entry)
+        elif level == "WARNING":
+            self._warning_count += 1
+        self._LOG_FUNCS.get(level, logging.info)("[DEBUG] %s", message)
+    
+    async def _check_memory_health(self) -> None:
+        """Run the memory health check and log the outcome."""
+        try:
+            health_status = await self.client.memory_health_check()
+            if not health_status["healthy"]:
+                self.log_debug(f"Memory health issues detected: {health_status['errors']}", "WARNING")
+                if health_status["errors"]:
+                    self.log_debug("Memory system has errors - consider disabling memory for this request", "ERROR")
+            else:
+                self.log_debug("Memory health check passed")
+        except Exception as e:
+            self.log_debug(f"Memory health check failed: {e}", "ERROR")
+    
+    async def _check_connection_health(self) -> None:
+        """Probe an open persistent connection and log the outcome."""
+        if not self.client.is_connected:
+            return
+        try:
+            if await self.client._verify_connection_health():
+                self.log_debug("Connection health check passed")
+            else:
+                self.log_debug("Connection health check failed - will re-establish", "WARNING")
+        except Exception as e:
+            self.log_debug(f"Connection health check failed: {e}", "ERROR")
     
     async def safe_ask_with_persistent_session(
         self, 
@@ -40,23 +97,16 @@ class PersistentSessionDebugger:
         # Pre-flight checks
         self.log_debug(f"Starting safe persistent session request - question length: {len(question)}")
         
-        # Memory health check if enabled
+        # Memory and connection probes are independent, so run them together
+        checks = [self._check_connection_health()]
         if use_memory:
-            try:
-                health_status = await self.client.memory_health_check()
-                if not health_status["healthy"]:
-                    self.log_debug(f"Memory health issues detected: {health_status['errors']}", "WARNING")
-                    if health_status["errors"]:
-                        self.log_debug("Memory system has errors - consider disabling memory for this request", "ERROR")
-                else:
-                    self.log_debug("Memory health check passed")
-            except Exception as e:
-                self.log_debug(f"Memory health check failed: {e}", "ERROR")
+            checks.append(self._check_memory_health())
+        await asyncio.gather(*checks)
         
         for attempt in range(max_retries):
             try:
                 self.log_debug(f"Attempt {attempt + 1}/{max_retries}: Processing question")
-                start_time = time.time()
+                start_time = time.monotonic()
                 
                 # Check connection before asking
                 if not self.client.is_connected:
@@ -81,7 +131,7 @@ class PersistentSessionDebugger:
                 if len(response.strip()) == 0:
                     raise ValueError("Received empty response")
                 
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 self.log_debug(f"Success: Received response of length {len(response)} in {elapsed:.2f}s")
                 return response
                 
@@ -106,9 +156,9 @@ class PersistentSessionDebugger:
                 self.log_debug("All retry attempts failed", "ERROR")
                 raise RuntimeError(f"Failed after {max_retries} attempts")
             
-            # Exponential backoff
-            wait_time = 2 ** attempt
-            self.log_debug(f"Waiting {wait_time}s before retry...")
+            # Capped exponential backoff with jitter so concurrent callers don't retry in lockstep
+            wait_time = min(self._max_backoff, 2 ** attempt) * (0.5 + random.random() * 0.5)
+            self.log_debug(f"Waiting {wait_time:.2f}s before retry...")
             await asyncio.sleep(wait_time)
         
         raise RuntimeError("Unexpected end of retry loop")
@@ -117,8 +167,12 @@ class PersistentSessionDebugger:
         """Monitor connection health periodically."""
         self.log_debug(f"Starting connection monitoring for {duration}s with {interval}s intervals")
         
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        # Ticks are scheduled against fixed target times so slow probes don't make the cadence drift
+        deadline = time.monotonic() + duration
+        next_tick = time.monotonic()
+        while next_tick < deadline:
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            next_tick += interval
             try:
                 is_connected = self.client.is_connected
                 mcp_session_id = self.client.mcp_session_id
@@ -126,17 +180,20 @@ class PersistentSessionDebugger:
                 self.log_debug(f"Connection status: connected={is_connected}, session_id={mcp_session_id}")
                 
                 if is_connected:
-                    # Test actual connectivity
-                    health_ok = await self.client._verify_connection_health()
+                    # Test actual connectivity; a stuck probe must not stall the monitor
+                    health_ok = await asyncio.wait_for(
+                        self.client._verify_connection_health(),
+                        timeout=interval / 2
+                    )
                     self.log_debug(f"Health check result: {health_ok}")
                     
                     if not health_ok:
                         self.log_debug("Health check failed - connection may be stale", "WARNING")
                 
+            except asyncio.TimeoutError:
+                self.log_debug(f"Health check timed out after {interval / 2}s - connection may be stale", "WARNING")
             except Exception as e:
                 self.log_debug(f"Connection monitoring error: {e}", "ERROR")
-            
-            await asyncio.sleep(interval)
         
         self.log_debug("Connection monitoring completed")
     
@@ -157,24 +214,22 @@ class PersistentSessionDebugger:
                 ("assistant", "Test assistant response 2")
             ]
             
-            # Save test messages
-            for role, content in test_data:
-                success = await self.client.memory_save_message(role, content)
-                self.log_debug(f"Save {role} message: {'SUCCESS' if success else 'FAILED'}")
+            # Save test messages in one ordered bulk write
+            success = await self.client.memory_save_messages(test_data)
+            self.log_debug(f"Save {len(test_data)} messages: {'SUCCESS' if success else 'FAILED'}")
             
             # Load messages back
             messages = await self.client.memory_load_history(limit=10)
             self.log_debug(f"Loaded {len(messages)} messages from memory")
             
-            # Test session isolation
+            # Test session isolation; always restore the original session, even on failure
             original_session = self.client.memory_session_id
-            self.client.memory_session_id = f"test_session_{int(time.time())}"
-            
-            isolated_messages = await self.client.memory_load_history(limit=10)
-            self.log_debug(f"Isolated session has {len(isolated_messages)} messages")
-            
-            # Restore original session
-            self.client.memory_session_id = original_session
+            self.client.memory_session_id = f"test_session_{secrets.token_hex(8)}"
+            try:
+                isolated_messages = await self.client.memory_load_history(limit=10)
+                self.log_debug(f"Isolated session has {len(isolated_messages)} messages")
+            finally:
+                self.client.memory_session_id = original_session
             
             self.log_debug("Memory operations test completed successfully")
             
@@ -193,36 +248,35 @@ class PersistentSessionDebugger:
                 "is_connected": self.client.is_connected,
                 "mcp_session_id": getattr(self.client, 'mcp_session_id', None)
             },
-            "debug_logs": self.debug_logs,
+            "debug_logs": list(self.debug_logs),
             "log_count": len(self.debug_logs),
-            "error_count": len([log for log in self.debug_logs if log["level"] == "ERROR"]),
-            "warning_count": len([log for log in self.debug_logs if log["level"] == "WARNING"])
+            "error_count": self._error_count,
+            "warning_count": self._warning_count
         }
     
     def print_debug_report(self):
         """Print formatted debug report."""
         report = self.get_debug_report()
         
-        print("\n" + "="*60)
-        print("PERSISTENT SESSION DEBUG REPORT")
-        print("="*60)
+        # Build the whole report first and write it to stdout in one call
+        lines = ["", "="*60, "PERSISTENT SESSION DEBUG REPORT", "="*60]
         
-        print("\nClient Information:")
+        lines.append("\nClient Information:")
         for key, value in report["client_info"].items():
-            print(f"  {key}: {value}")
+            lines.append(f"  {key}: {value}")
         
-        print(f"\nLog Summary:")
-        print(f"  Total logs: {report['log_count']}")
-        print(f"  Errors: {report['error_count']}")
-        print(f"  Warnings: {report['warning_count']}")
+        lines.append("\nLog Summary:")
+        lines.append(f"  Total logs: {report['log_count']}")
+        lines.append(f"  Errors: {report['error_count']}")
+        lines.append(f"  Warnings: {report['warning_count']}")
         
         if report["error_count"] > 0:
-            print(f"\nRecent Errors:")
-            error_logs = [log for log in self.debug_logs if log["level"] == "ERROR"][-5:]
-            for log in error_logs:
-                print(f"  [{log['timestamp']:.2f}] {log['message']}")
+            lines.append("\nRecent Errors:")
+            for log in self._recent_errors:
+                lines.append(f"  [{log['timestamp']:.2f}] {log['message']}")
         
-        print("\n" + "="*60)
+        lines.append("\n" + "="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 @asynccontextmanager
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
@@ -11,6 +12,7 @@ from vianexus_agent_sdk.providers.oauth import (
 from vianexus_agent_sdk.types.config import BaseConfig
 
 
+@functools.lru_cache(maxsize=128)
 def _normalize_server(server: str) -> str:
     # Ensure a scheme for URL composition
     if server.startswith("http://") or server.startswith("https://"):
@@ -29,6 +31,14 @@ class StreamableHttpSetup:
     software_statement: str
     auth_layer: Optional[ViaNexusOAuthClientProvider] = None
     client_context: Optional[Dict[str, Any]] = None
+    # Transport URL and headers depend only on the fields above, so they are
+    # built once here instead of on every connection
+    _url: str = field(init=False, repr=False)
+    _headers: Dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._url = f"{self.server_url}:{self.server_port}/mcp"
+        self._headers = self._get_tool_categories_header()
 
     @classmethod
     def from_config(cls, config, client_context: Optional[Dict[str, Any]] = None) -> "StreamableHttpSetup":
@@ -43,7 +53,14 @@ class StreamableHttpSetup:
     async def create_auth_layer(self) -> ViaNexusOAuthClientProvider:
         """
         Initialize the OAuth client and start the local callback server.
+
+        The auth layer is created once and reused on reconnects: it keeps the
+        registered client and tokens in its storage and refreshes expired
+        tokens itself, so a reconnect does not repeat the OAuth flow.
         """
+        if self.auth_layer is not None:
+            return self.auth_layer
+
         provider = ViaNexusOAuthProvider(
             server_url=self.server_url,
             server_port=self.server_port,
@@ -76,9 +93,6 @@ class StreamableHttpSetup:
         """
         if not self.auth_layer:
             raise RuntimeError("Auth not initialized. Call create_auth_layer() first.")
-        url = f"{self.server_url}:{self.server_port}/mcp"
 
         # Include tool category headers based on client context
-        headers = self._get_tool_categories_header()
-
-        return streamablehttp_client(url=url, auth=self.auth_layer, headers=headers)
+        return streamablehttp_client(url=self._url, auth=self.auth_layer, headers=self._headers)
@@ -12,7 +12,8 @@ from .base_memory import (
     MessageRole,
     MessageType,
     BaseMemoryStore,
-    MessageConverter
+    MessageConverter,
+    generate_message_ids
 )
 from .memory_mixin import ConversationMemoryMixin
 from .session_manager import SessionManager
@@ -24,6 +25,7 @@ __all__ = [
     "MessageType",
     "BaseMemoryStore",
     "MessageConverter",
+    "generate_message_ids",
     "ConversationMemoryMixin",
     "SessionManager"
 ]
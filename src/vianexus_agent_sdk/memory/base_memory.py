@@ -3,12 +3,77 @@ Core memory interfaces and data models for client-agnostic conversation storage.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Union, Protocol
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-import uuid
+import asyncio
+import copy
+import functools
+import hashlib
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+
+def _dumps(data: Any) -> str:
+    """Serialize to JSON, using orjson when installed (the optional `fast` extra)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str, ensure_ascii=False)
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when installed (the optional `fast` extra)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _init_field_names(cls: type) -> frozenset:
+    """Names of a dataclass's constructor fields, used to drop unknown keys from stored data."""
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
+def _drop_unknown_keys(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return data restricted to cls's constructor fields (data itself if nothing is dropped)."""
+    names = _init_field_names(cls)
+    if data.keys() <= names:
+        return data
+    return {key: value for key, value in data.items() if key in names}
+
+
+def _omit_unset(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop None-valued optional fields from a message dict before it is stored (content is always kept)."""
+    return {key: value for key, value in data.items() if value is not None or key == 'content'}
+
+
+def generate_message_ids(count: int) -> List[str]:
+    """
+    Generate random message IDs in bulk.
+    
+    One os.urandom call supplies the entropy for every ID, instead of one per
+    message.
+    
+    Args:
+        count: Number of IDs to generate
+        
+    Returns:
+        List of 32-character hex IDs
+    """
+    entropy = os.urandom(16 * count).hex()
+    return [entropy[i:i + 32] for i in range(0, 32 * count, 32)]
 
 
 class MessageRole(Enum):
@@ -31,7 +96,13 @@ class MessageType(Enum):
     MULTIMODAL = "multimodal"
 
 
-@dataclass
+# Value -> member tables; a dict lookup is much cheaper than calling the Enum class.
+# Unknown values fall back to the Enum call so they still raise ValueError.
+_ROLE_MAP: Dict[str, MessageRole] = {role.value: role for role in MessageRole}
+_MTYPE_MAP: Dict[str, MessageType] = {mtype.value: mtype for mtype in MessageType}
+
+
+@dataclass(slots=True)
 class UniversalMessage:
     """
     Provider-agnostic message format that works with any LLM client.
@@ -58,51 +129,97 @@ class UniversalMessage:
     context_tags: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
     
+    # (timestamp, ISO string) from the last serialization; not part of the message
+    _timestamp_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.utcnow()
         if self.message_id is None:
-            self.message_id = str(uuid.uuid4())
+            self.message_id = os.urandom(16).hex()
+    
+    def _timestamp_isoformat(self) -> Optional[str]:
+        """Return the timestamp as an ISO string, formatting it once per timestamp value."""
+        timestamp = self.timestamp
+        if not timestamp:
+            return None
+        cached = self._timestamp_iso
+        if cached is None or cached[0] is not timestamp:
+            cached = self._timestamp_iso = (timestamp, timestamp.isoformat())
+        return cached[1]
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage."""
-        data = asdict(self)
+    def to_dict(self, deep: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for storage.
         
-        # Convert enums to strings
-        data['role'] = self.role.value
-        data['message_type'] = self.message_type.value
+        By default nested values (content, raw_content, tool calls, metadata) are
+        deep-copied, so the result can be handed out and modified without
+        touching the message.
         
-        # Convert datetime to ISO string
-        if self.timestamp:
-            data['timestamp'] = self.timestamp.isoformat()
+        Args:
+            deep: Deep-copy nested values; serializers that encode the result
+                right away pass False to share them with the message instead
         
-        return data
+        Returns:
+            Dictionary of the message's fields
+        """
+        data = {
+            'role': self.role.value,
+            'content': self.content,
+            'message_type': self.message_type.value,
+            'timestamp': self._timestamp_isoformat(),
+            'message_id': self.message_id,
+            'session_id': self.session_id,
+            'provider': self.provider,
+            'raw_content': self.raw_content,
+            'token_count': self.token_count,
+            'tool_calls': self.tool_calls,
+            'tool_results': self.tool_results,
+            'user_id': self.user_id,
+            'context_tags': self.context_tags,
+            'metadata': self.metadata,
+        }
+        return copy.deepcopy(data) if deep else data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UniversalMessage":
         """Create from dictionary (loaded from storage)."""
         # Handle enum conversion
         if isinstance(data.get('role'), str):
-            data['role'] = MessageRole(data['role'])
+            data['role'] = _ROLE_MAP.get(data['role']) or MessageRole(data['role'])
         if isinstance(data.get('message_type'), str):
-            data['message_type'] = MessageType(data['message_type'])
+            data['message_type'] = _MTYPE_MAP.get(data['message_type']) or MessageType(data['message_type'])
         if isinstance(data.get('timestamp'), str):
             data['timestamp'] = datetime.fromisoformat(data['timestamp'])
         
-        return cls(**data)
+        return cls(**_drop_unknown_keys(cls, data))
     
     def to_json(self) -> str:
-        """Convert to JSON string for storage."""
-        return json.dumps(self.to_dict(), default=str, ensure_ascii=False)
+        """Convert to JSON string for storage (unset optional fields are omitted)."""
+        return _dumps(_omit_unset(self.to_dict(deep=False)))
     
     @classmethod
     def from_json(cls, json_str: str) -> "UniversalMessage":
         """Create from JSON string."""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+        return cls.from_dict(_loads(json_str))
+    
+    def to_msgpack(self) -> bytes:
+        """
+        Convert to msgpack bytes for binary-capable storage.
+        
+        Smaller and faster than JSON, and binary content is stored as-is rather
+        than needing an encoding. Unset optional fields are omitted. Requires the
+        optional `msgpack` extra (ormsgpack).
+        """
+        return ormsgpack.packb(_omit_unset(self.to_dict(deep=False)), default=str, option=ormsgpack.OPT_NON_STR_KEYS)
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "UniversalMessage":
+        """Create from msgpack bytes (requires the optional `msgpack` extra)."""
+        return cls.from_dict(ormsgpack.unpackb(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
     """Universal conversation session metadata."""
     session_id: str
@@ -128,17 +245,31 @@ class ConversationSession:
         if self.last_activity is None:
             self.last_activity = datetime.utcnow()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage."""
-        data = asdict(self)
+    def to_dict(self, deep: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for storage.
         
-        # Convert datetime to ISO string
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.last_activity:
-            data['last_activity'] = self.last_activity.isoformat()
+        Args:
+            deep: Deep-copy nested values (context tags, session metadata); pass
+                False when the result is serialized right away
         
-        return data
+        Returns:
+            Dictionary of the session's fields
+        """
+        data = {
+            'session_id': self.session_id,
+            'user_id': self.user_id,
+            'client_type': self.client_type,
+            'system_prompt': self.system_prompt,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'last_activity': self.last_activity.isoformat() if self.last_activity else None,
+            'message_count': self.message_count,
+            'max_context_length': self.max_context_length,
+            'memory_strategy': self.memory_strategy,
+            'context_tags': self.context_tags,
+            'session_metadata': self.session_metadata,
+        }
+        return copy.deepcopy(data) if deep else data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConversationSession":
@@ -148,7 +279,7 @@ class ConversationSession:
         if isinstance(data.get('last_activity'), str):
             data['last_activity'] = datetime.fromisoformat(data['last_activity'])
         
-        return cls(**data)
+        return cls(**_drop_unknown_keys(cls, data))
     
     def update_activity(self):
         """Update last activity timestamp."""
@@ -156,7 +287,13 @@ class ConversationSession:
 
 
 class MessageConverter(Protocol):
-    """Protocol for converting between provider formats and UniversalMessage."""
+    """
+    Protocol for converting between provider formats and UniversalMessage.
+    
+    Converters are selected by provider name (see ConverterRegistry) once, when
+    a client is created, and then called directly; the raw payload type can't
+    drive dispatch because every provider's messages are plain dicts.
+    """
     
     def to_universal(self, provider_message: Any) -> UniversalMessage:
         """Convert provider-specific message to UniversalMessage."""
@@ -178,11 +315,67 @@ class MessageConverter(Protocol):
 class BaseMemoryStore(ABC):
     """Client-agnostic conversation memory storage interface."""
     
+    # Binary-capable backends (Redis, SQLite BLOBs, ...) set this to store messages
+    # as msgpack instead of JSON through serialize_message/deserialize_message
+    prefers_binary: bool = False
+    
+    # Number of query embeddings _embed_query keeps before evicting the least recently used
+    embedding_cache_size: int = 1024
+    
+    def serialize_message(self, message: UniversalMessage) -> Union[str, bytes]:
+        """
+        Serialize a message in this store's preferred format.
+        
+        Args:
+            message: Message to serialize
+            
+        Returns:
+            msgpack bytes if the store prefers binary payloads, otherwise a JSON string
+        """
+        if self.prefers_binary:
+            if ormsgpack is None:
+                raise ImportError(
+                    "Binary message storage requires ormsgpack; install the 'msgpack' extra"
+                )
+            return message.to_msgpack()
+        return message.to_json()
+    
+    def deserialize_message(self, payload: Union[str, bytes]) -> UniversalMessage:
+        """
+        Restore a message written by serialize_message.
+        
+        Args:
+            payload: msgpack bytes or JSON string
+            
+        Returns:
+            The stored message
+        """
+        if self.prefers_binary:
+            if ormsgpack is None:
+                raise ImportError(
+                    "Binary message storage requires ormsgpack; install the 'msgpack' extra"
+                )
+            return UniversalMessage.from_msgpack(payload)
+        return UniversalMessage.from_json(payload)
+    
     @abstractmethod
     async def save_message(self, message: UniversalMessage) -> bool:
         """Save a universal message to storage."""
         pass
     
+    async def save_messages(self, messages: List[UniversalMessage]) -> bool:
+        """
+        Save several universal messages, in order.
+        
+        The default saves them one at a time. Stores that support a bulk write
+        should override this with a single round-trip (e.g. executemany or COPY
+        for SQL backends, a pipeline for Redis), keeping the messages in order.
+        """
+        success = True
+        for message in messages:
+            success = await self.save_message(message) and success
+        return success
+    
     @abstractmethod
     async def get_conversation_history(
         self, 
@@ -194,6 +387,30 @@ class BaseMemoryStore(ABC):
         """Retrieve conversation history with optional filtering."""
         pass
     
+    async def get_messages(
+        self,
+        session_ids: List[str],
+        limit: Optional[int] = None
+    ) -> Dict[str, List[UniversalMessage]]:
+        """
+        Retrieve the conversation history of several sessions.
+        
+        The default reads the sessions concurrently through
+        get_conversation_history; stores that can fetch several sessions in one
+        query should override this.
+        
+        Args:
+            session_ids: Sessions to read
+            limit: Maximum number of most recent messages per session
+            
+        Returns:
+            Mapping of session ID to its messages, oldest first
+        """
+        histories = await asyncio.gather(
+            *(self.get_conversation_history(session_id, limit=limit) for session_id in session_ids)
+        )
+        return dict(zip(session_ids, histories))
+    
     @abstractmethod
     async def save_session(self, session: ConversationSession) -> bool:
         """Save session metadata."""
@@ -225,6 +442,97 @@ class BaseMemoryStore(ABC):
         """Semantic search across messages."""
         pass
     
+    async def search_messages_by_terms(
+        self,
+        terms: List[str],
+        user_id: Optional[str] = None,
+        session_ids: Optional[List[str]] = None,
+        limit: int = 50
+    ) -> List[UniversalMessage]:
+        """
+        Lexical search: find messages containing every one of the given terms.
+    
+        A fast path for lookups like "which sessions mentioned X" that don't need
+        search_messages' semantic matching. Terms are normalized the same way as
+        message text (lowercased, punctuation stripped, stop-words dropped).
+    
+        The default scans the histories of the requested sessions (or the user's
+        sessions); stores should override it with an inverted term index.
+    
+        Args:
+            terms: Terms that must all appear in a message
+            user_id: Restrict the search to this user's sessions
+            session_ids: Restrict the search to these sessions
+            limit: Maximum number of messages to return
+    
+        Returns:
+            Matching messages, most recent first
+        """
+        from .converters.converter_registry import ANTHROPIC_CONVERTER
+        from .converters.anthropic_converter import _extract_terms
+    
+        wanted = set(_extract_terms(" ".join(terms)))
+        if not wanted:
+            return []
+    
+        if session_ids is None:
+            if user_id is None:
+                return []
+            session_ids = [session.session_id for session in await self.get_user_sessions(user_id)]
+    
+        histories = await self.get_messages(session_ids)
+        results = [
+            message
+            for history in histories.values()
+            for message in history
+            if wanted.issubset(ANTHROPIC_CONVERTER.extract_search_terms({"content": message.content}))
+        ]
+        results.sort(key=lambda x: x.timestamp or datetime.min, reverse=True)
+        return results[:limit]
+    
+    async def _compute_query_embedding(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a search query.
+        
+        Optional hook: stores with a semantic search_messages override this with
+        their embedding model and call _embed_query to get caching. The default
+        returns None, meaning the store does not embed queries.
+        """
+        return None
+    
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Return the embedding of a search query, computing it at most once per query.
+        
+        Embeddings are cached by a BLAKE2b hash of the query text in an LRU of
+        embedding_cache_size entries, so repeated searches skip the embedding call.
+        
+        Args:
+            query: Search query text
+            
+        Returns:
+            The query's embedding vector, or None if the store does not embed queries
+        """
+        try:
+            cache = self._embedding_cache
+        except AttributeError:
+            cache = self._embedding_cache = OrderedDict()
+        
+        key = hashlib.blake2b(query.encode(), digest_size=16).digest()
+        embedding = cache.get(key)
+        if embedding is not None:
+            cache.move_to_end(key)
+            return embedding
+        
+        embedding = await self._compute_query_embedding(query)
+        if embedding is None:
+            return None
+        
+        cache[key] = embedding
+        while len(cache) > self.embedding_cache_size:
+            cache.popitem(last=False)
+        return embedding
+    
     @abstractmethod
     async def cleanup_old_sessions(self, older_than_days: int) -> int:
         """Clean up sessions older than specified days."""
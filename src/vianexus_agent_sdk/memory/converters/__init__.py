@@ -3,9 +3,21 @@ Message converters for different LLM providers.
 """
 
 from .anthropic_converter import AnthropicMessageConverter
-from .converter_registry import ConverterRegistry
+from .converter_registry import (
+    ANTHROPIC_CONVERTER,
+    CONVERTERS,
+    ConverterRegistry,
+    find_converter,
+    get_converter,
+    register_converter,
+)
 
 __all__ = [
     "AnthropicMessageConverter",
-    "ConverterRegistry"
+    "ANTHROPIC_CONVERTER",
+    "CONVERTERS",
+    "ConverterRegistry",
+    "find_converter",
+    "get_converter",
+    "register_converter"
 ]
@@ -2,16 +2,63 @@
 Message converter for Anthropic Claude API format.
 """
 
-from typing import List, Any, Dict
-from ..base_memory import UniversalMessage, MessageRole, MessageType
+import re
+from datetime import datetime
+from itertools import repeat
+from typing import List, Any, Dict, Optional
+from ..base_memory import UniversalMessage, MessageRole, MessageType, _ROLE_MAP, generate_message_ids
+
+
+# Searchable text for each content block type; blocks of other types are skipped
+_BLOCK_TEXT = {
+    "text": lambda block: block.get("text", ""),
+    # Include tool name for searchability
+    "tool_use": lambda block: f"[Tool: {block.get('name', 'unknown_tool')}]",
+    # Include tool result summary
+    "tool_result": lambda block: "[Tool Result]",
+}
+
+# Runs of letters/digits; everything else (punctuation, whitespace) separates terms
+_TERM_PATTERN = re.compile(r"[^\W_]+")
+
+# Common English words left out of term searches
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "i", "in", "is", "it", "its", "of", "on", "or", "that", "the", "this", "to",
+    "was", "were", "what", "with", "you",
+})
+
+
+def _extract_terms(text: str) -> List[str]:
+    """
+    Split text into search terms.
+    
+    Lowercases, strips punctuation and drops stop-words; each term appears once,
+    in order of first occurrence.
+    """
+    terms = dict.fromkeys(_TERM_PATTERN.findall(text.lower()))
+    return [term for term in terms if term not in _STOP_WORDS]
 
 
 class AnthropicMessageConverter:
     """Converts between Anthropic messages and UniversalMessage format."""
     
-    def to_universal(self, anthropic_message: Dict[str, Any]) -> UniversalMessage:
-        """Convert Anthropic message format to UniversalMessage."""
-        role = MessageRole(anthropic_message["role"])
+    def to_universal(
+        self,
+        anthropic_message: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
+        message_id: Optional[str] = None
+    ) -> UniversalMessage:
+        """
+        Convert Anthropic message format to UniversalMessage.
+        
+        Args:
+            anthropic_message: Message in Anthropic format
+            timestamp: Timestamp for the message (defaults to now)
+            message_id: ID for the message (defaults to a new random ID)
+        """
+        role_value = anthropic_message["role"]
+        role = _ROLE_MAP.get(role_value) or MessageRole(role_value)
         content = anthropic_message["content"]
         
         # Determine message type based on content structure
@@ -20,33 +67,33 @@ class AnthropicMessageConverter:
         tool_results = None
         
         if isinstance(content, list):
-            # Check for tool usage in content blocks
-            has_tool_use = any(
-                isinstance(block, dict) and block.get("type") == "tool_use" 
-                for block in content
-            )
-            has_tool_result = any(
-                isinstance(block, dict) and block.get("type") == "tool_result" 
-                for block in content
-            )
+            # Collect tool usage blocks in a single pass over the content. This is
+            # cheaper than a content-keyed cache would be: serializing the blocks
+            # to build a key costs several times more than scanning them.
+            tool_use_blocks = []
+            tool_result_blocks = []
+            for block in content:
+                if isinstance(block, dict):
+                    block_type = block.get("type")
+                    if block_type == "tool_use":
+                        tool_use_blocks.append(block)
+                    elif block_type == "tool_result":
+                        tool_result_blocks.append(block)
             
-            if has_tool_use:
+            # Tool calls take precedence when a message carries both
+            if tool_use_blocks:
                 message_type = MessageType.TOOL_CALL
-                tool_calls = [
-                    block for block in content 
-                    if isinstance(block, dict) and block.get("type") == "tool_use"
-                ]
-            elif has_tool_result:
+                tool_calls = tool_use_blocks
+            elif tool_result_blocks:
                 message_type = MessageType.TOOL_RESULT
-                tool_results = [
-                    block for block in content 
-                    if isinstance(block, dict) and block.get("type") == "tool_result"
-                ]
+                tool_results = tool_result_blocks
         
         return UniversalMessage(
             role=role,
             content=content,
             message_type=message_type,
+            timestamp=timestamp,
+            message_id=message_id,
             provider="anthropic",
             raw_content=anthropic_message,
             tool_calls=tool_calls,
@@ -56,10 +103,9 @@ class AnthropicMessageConverter:
     def from_universal(self, universal_message: UniversalMessage) -> Dict[str, Any]:
         """Convert UniversalMessage back to Anthropic format."""
         # If we have the raw content and it's from Anthropic, use it
-        if (universal_message.raw_content and 
-            universal_message.provider == "anthropic" and
-            isinstance(universal_message.raw_content, dict)):
-            return universal_message.raw_content
+        raw_content = universal_message.raw_content
+        if raw_content and universal_message.provider == "anthropic" and isinstance(raw_content, dict):
+            return raw_content
         
         # Otherwise construct from universal format
         return {
@@ -68,12 +114,14 @@ class AnthropicMessageConverter:
         }
     
     def to_universal_batch(self, anthropic_messages: List[Dict]) -> List[UniversalMessage]:
-        """Convert batch of Anthropic messages."""
-        return [self.to_universal(msg) for msg in anthropic_messages]
+        """Convert batch of Anthropic messages (all stamped with the same time)."""
+        now = datetime.utcnow()
+        message_ids = generate_message_ids(len(anthropic_messages))
+        return list(map(self.to_universal, anthropic_messages, repeat(now), message_ids))
     
     def from_universal_batch(self, universal_messages: List[UniversalMessage]) -> List[Dict]:
         """Convert batch back to Anthropic format."""
-        return [self.from_universal(msg) for msg in universal_messages]
+        return list(map(self.from_universal, universal_messages))
     
     def extract_text_content(self, anthropic_message: Dict[str, Any]) -> str:
         """Extract text content from Anthropic message for search/display."""
@@ -86,18 +134,16 @@ class AnthropicMessageConverter:
             text_parts = []
             for block in content:
                 if isinstance(block, dict):
-                    if block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                    elif block.get("type") == "tool_use":
-                        # Include tool name for searchability
-                        tool_name = block.get("name", "unknown_tool")
-                        text_parts.append(f"[Tool: {tool_name}]")
-                    elif block.get("type") == "tool_result":
-                        # Include tool result summary
-                        text_parts.append("[Tool Result]")
+                    extract = _BLOCK_TEXT.get(block.get("type"))
+                    if extract is not None:
+                        text_parts.append(extract(block))
                 elif isinstance(block, str):
                     text_parts.append(block)
             
             return " ".join(text_parts)
         
         return str(content)
+    
+    def extract_search_terms(self, anthropic_message: Dict[str, Any]) -> List[str]:
+        """Extract the lexical search terms of an Anthropic message (see extract_text_content)."""
+        return _extract_terms(self.extract_text_content(anthropic_message))
@@ -2,36 +2,76 @@
 Registry for message converters by provider.
 """
 
-from typing import Dict
+import threading
+from types import MappingProxyType
+from typing import Dict, Optional
 from ..base_memory import MessageConverter
 from .anthropic_converter import AnthropicMessageConverter
 
+# Shared converter instance; call sites that always handle Anthropic messages can
+# use it directly instead of going through the registry
+ANTHROPIC_CONVERTER = AnthropicMessageConverter()
+
+# Registered converters by provider. Reads go straight to the dict; writes are
+# serialized by the lock so registrations from different threads don't race.
+_converters: Dict[str, MessageConverter] = {
+    "anthropic": ANTHROPIC_CONVERTER,
+}
+_converters_lock = threading.Lock()
+
+# Read-only view of the registered converters
+CONVERTERS = MappingProxyType(_converters)
+
+
+def get_converter(provider: str) -> MessageConverter:
+    """Get converter for a specific provider."""
+    converter = _converters.get(provider)
+    if converter is None:
+        raise ValueError(f"No converter found for provider: {provider}")
+    return converter
+
+
+def find_converter(provider: str) -> Optional[MessageConverter]:
+    """Get converter for a specific provider, or None if there is none."""
+    return _converters.get(provider)
+
+
+def register_converter(provider: str, converter: MessageConverter):
+    """Register a new converter."""
+    with _converters_lock:
+        _converters[provider] = converter
+
 
 class ConverterRegistry:
-    """Registry for message converters by provider."""
+    """
+    Registry for message converters by provider.
     
-    _converters: Dict[str, MessageConverter] = {
-        "anthropic": AnthropicMessageConverter(),
-    }
+    Class-based interface over the module-level registry functions.
+    """
+    
+    _converters = CONVERTERS
     
     @classmethod
     def get_converter(cls, provider: str) -> MessageConverter:
         """Get converter for a specific provider."""
-        if provider not in cls._converters:
-            raise ValueError(f"No converter found for provider: {provider}")
-        return cls._converters[provider]
+        return get_converter(provider)
+    
+    @classmethod
+    def find_converter(cls, provider: str) -> Optional[MessageConverter]:
+        """Get converter for a specific provider, or None if there is none."""
+        return _converters.get(provider)
     
     @classmethod
     def register_converter(cls, provider: str, converter: MessageConverter):
         """Register a new converter."""
-        cls._converters[provider] = converter
+        register_converter(provider, converter)
     
     @classmethod
     def list_providers(cls) -> list:
         """List all registered providers."""
-        return list(cls._converters.keys())
+        return list(_converters)
     
     @classmethod
     def has_converter(cls, provider: str) -> bool:
         """Check if converter exists for provider."""
-        return provider in cls._converters
+        return provider in _converters
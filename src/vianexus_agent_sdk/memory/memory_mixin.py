@@ -6,8 +6,11 @@ from typing import Optional, List, Dict, Any
 import logging
 import uuid
 
-from .base_memory import BaseMemoryStore, UniversalMessage, ConversationSession, MessageRole, MessageType
-from .converters import ConverterRegistry
+from .base_memory import (
+    BaseMemoryStore, UniversalMessage, ConversationSession, MessageRole, MessageType,
+    _ROLE_MAP, _MTYPE_MAP,
+)
+from .converters import find_converter
 from .session_manager import SessionManager
 
 
@@ -37,8 +40,8 @@ class ConversationMemoryMixin:
         
         # Get the appropriate converter if available
         self.message_converter = None
-        if provider_name != "unknown" and ConverterRegistry.has_converter(provider_name):
-            self.message_converter = ConverterRegistry.get_converter(provider_name)
+        if provider_name != "unknown":
+            self.message_converter = find_converter(provider_name)
         
         # Memory policies
         self.memory_config = {
@@ -130,24 +133,8 @@ class ConversationMemoryMixin:
             # Ensure session is initialized
             await self.memory_initialize_session()
             
-            # Determine message type
-            msg_type = MessageType.TEXT
-            if message_type:
-                try:
-                    msg_type = MessageType(message_type)
-                except ValueError:
-                    logging.warning(f"Unknown message type: {message_type}, using TEXT")
-            
             # Create universal message
-            universal_message = UniversalMessage(
-                role=MessageRole(role),
-                content=content,
-                message_type=msg_type,
-                session_id=self.memory_session_id,
-                user_id=self.user_id,
-                provider=self.provider_name,
-                metadata=metadata
-            )
+            universal_message = self._build_universal_message(role, content, message_type, metadata)
             
             # Save to storage
             success = await self.memory_store.save_message(universal_message)
@@ -163,6 +150,70 @@ class ConversationMemoryMixin:
             logging.error(f"Failed to save message to memory: {e}")
             return False
     
+    async def memory_save_messages(
+        self,
+        messages: List[tuple]
+    ) -> bool:
+        """
+        Save several messages to memory storage in one write.
+        
+        Clients use this to flush all messages of a turn at once, so the session
+        is touched once and stores with a bulk write (save_messages) need a
+        single round-trip instead of one per message.
+        
+        Args:
+            messages: (role, content) or (role, content, message_type) tuples, in order
+            
+        Returns:
+            True if every message was saved
+        """
+        if not self.memory_enabled or not messages:
+            return True
+        
+        try:
+            # Ensure session is initialized
+            await self.memory_initialize_session()
+            
+            universal_messages = [self._build_universal_message(*message) for message in messages]
+            
+            success = await self.memory_store.save_messages(universal_messages)
+            
+            if success:
+                await self.memory_store.update_session_activity(self.memory_session_id)
+                logging.debug(f"Saved {len(universal_messages)} messages to memory")
+            
+            return success
+            
+        except Exception as e:
+            logging.error(f"Failed to save messages to memory: {e}")
+            return False
+    
+    def _build_universal_message(
+        self,
+        role: str,
+        content: Any,
+        message_type: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> UniversalMessage:
+        """Create a UniversalMessage for the current memory session."""
+        # Determine message type
+        msg_type = MessageType.TEXT
+        if message_type:
+            msg_type = _MTYPE_MAP.get(message_type)
+            if msg_type is None:
+                logging.warning(f"Unknown message type: {message_type}, using TEXT")
+                msg_type = MessageType.TEXT
+        
+        return UniversalMessage(
+            role=_ROLE_MAP.get(role) or MessageRole(role),
+            content=content,
+            message_type=msg_type,
+            session_id=self.memory_session_id,
+            user_id=self.user_id,
+            provider=self.provider_name,
+            metadata=metadata
+        )
+    
     async def memory_load_history(
         self, 
         limit: Optional[int] = None,
@@ -229,6 +280,31 @@ class ConversationMemoryMixin:
             logging.error(f"Failed to search conversations: {e}")
             return []
     
+    async def memory_search_terms(
+        self,
+        terms: List[str],
+        limit: int = 20,
+        all_user_sessions: bool = False
+    ) -> List[UniversalMessage]:
+        """Find messages containing all of the given terms (lexical fast path)."""
+        if not self.memory_enabled:
+            return []
+        
+        try:
+            session_ids = None
+            if not all_user_sessions and self.memory_session_id:
+                session_ids = [self.memory_session_id]
+            
+            return await self.memory_store.search_messages_by_terms(
+                terms=terms,
+                user_id=self.user_id,
+                session_ids=session_ids,
+                limit=limit
+            )
+        except Exception as e:
+            logging.error(f"Failed to search conversations by terms: {e}")
+            return []
+    
     async def memory_clear_session(self) -> bool:
         """Clear current session from memory."""
         if not self.memory_enabled or not self.memory_session_id:
@@ -116,6 +116,32 @@ class FileMemoryStore(BaseMemoryStore):
             logging.error(f"Unexpected error saving message: {e}")
             return False
     
+    async def save_messages(self, messages: List[UniversalMessage]) -> bool:
+        """Save several messages to file with one append per session file, in order."""
+        try:
+            # Group the serialized lines by session, keeping message order
+            lines_by_session: Dict[str, List[str]] = {}
+            for message in messages:
+                if not message.session_id:
+                    logging.error("Message has no session_id")
+                    return False
+                lines_by_session.setdefault(message.session_id, []).append(message.to_json())
+            
+            for session_id, lines in lines_by_session.items():
+                messages_file = self._get_messages_file(session_id)
+                async with aiofiles.open(messages_file, mode='a', encoding='utf-8') as f:
+                    await f.write('\n'.join(lines) + '\n')
+            
+            logging.debug(f"Saved {len(messages)} messages to file")
+            return True
+            
+        except (OSError, IOError, PermissionError) as e:
+            logging.error(f"File system error saving messages: {e}")
+            return False
+        except Exception as e:
+            logging.error(f"Unexpected error saving messages: {e}")
+            return False
+    
     async def get_conversation_history(
         self, 
         session_id: str, 
@@ -180,7 +206,7 @@ class FileMemoryStore(BaseMemoryStore):
             session_file = self._get_session_file(session.session_id)
             
             async with aiofiles.open(session_file, mode='w', encoding='utf-8') as f:
-                await f.write(json.dumps(session.to_dict(), default=str, ensure_ascii=False))
+                await f.write(json.dumps(session.to_dict(deep=False), default=str, ensure_ascii=False))
             
             logging.debug(f"Saved session to file: {session.session_id}")
             return True
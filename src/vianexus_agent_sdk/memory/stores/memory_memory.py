@@ -2,11 +2,13 @@
 In-memory conversation storage for testing and development.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 from datetime import datetime, timedelta
 import logging
 
 from ..base_memory import BaseMemoryStore, UniversalMessage, ConversationSession, MessageType
+from ..converters.anthropic_converter import _extract_terms
+from ..converters.converter_registry import ANTHROPIC_CONVERTER
 
 
 class InMemoryStore(BaseMemoryStore):
@@ -16,6 +18,16 @@ class InMemoryStore(BaseMemoryStore):
         self.messages: Dict[str, List[UniversalMessage]] = {}  # session_id -> messages
         self.sessions: Dict[str, ConversationSession] = {}  # session_id -> session
         self.user_sessions: Dict[str, List[str]] = {}  # user_id -> session_ids
+        self.term_index: Dict[str, Dict[str, List[UniversalMessage]]] = {}  # term -> session_id -> messages
+        self._session_terms: Dict[str, Set[str]] = {}  # session_id -> indexed terms, for deletion
+    
+    def _index_message(self, message: UniversalMessage):
+        """Add a message to the term index."""
+        terms = ANTHROPIC_CONVERTER.extract_search_terms({"content": message.content})
+        session_id = message.session_id
+        for term in terms:
+            self.term_index.setdefault(term, {}).setdefault(session_id, []).append(message)
+        self._session_terms.setdefault(session_id, set()).update(terms)
         
     async def save_message(self, message: UniversalMessage) -> bool:
         """Save a message to in-memory storage."""
@@ -29,6 +41,7 @@ class InMemoryStore(BaseMemoryStore):
                 self.messages[session_id] = []
             
             self.messages[session_id].append(message)
+            self._index_message(message)
             
             # Update session message count
             if session_id in self.sessions:
@@ -41,6 +54,29 @@ class InMemoryStore(BaseMemoryStore):
             logging.error(f"Error saving message to memory: {e}")
             return False
     
+    async def save_messages(self, messages: List[UniversalMessage]) -> bool:
+        """Save several messages to in-memory storage, in order."""
+        try:
+            if any(not message.session_id for message in messages):
+                logging.error("Message has no session_id")
+                return False
+            
+            for message in messages:
+                self.messages.setdefault(message.session_id, []).append(message)
+                self._index_message(message)
+                
+                # Update session message count
+                session = self.sessions.get(message.session_id)
+                if session is not None:
+                    session.message_count += 1
+            
+            logging.debug(f"Saved {len(messages)} messages to in-memory store")
+            return True
+            
+        except Exception as e:
+            logging.error(f"Error saving messages to memory: {e}")
+            return False
+    
     async def get_conversation_history(
         self, 
         session_id: str, 
@@ -118,6 +154,14 @@ class InMemoryStore(BaseMemoryStore):
             if session_id in self.messages:
                 del self.messages[session_id]
             
+            # Remove indexed terms
+            for term in self._session_terms.pop(session_id, ()):
+                postings = self.term_index.get(term)
+                if postings is not None:
+                    postings.pop(session_id, None)
+                    if not postings:
+                        del self.term_index[term]
+            
             # Remove session
             session = self.sessions.pop(session_id, None)
             
@@ -178,6 +222,53 @@ class InMemoryStore(BaseMemoryStore):
             logging.error(f"Error searching messages: {e}")
             return []
     
+    async def search_messages_by_terms(
+        self,
+        terms: List[str],
+        user_id: Optional[str] = None,
+        session_ids: Optional[List[str]] = None,
+        limit: int = 50
+    ) -> List[UniversalMessage]:
+        """Find messages containing all of the given terms using the term index."""
+        try:
+            wanted = _extract_terms(" ".join(terms))
+            if not wanted:
+                return []
+            
+            postings = [self.term_index.get(term) for term in wanted]
+            if not all(postings):
+                return []
+            # Rarest term first, so it bounds the candidate sessions and messages
+            postings.sort(key=len)
+            
+            search_sessions = set(postings[0])
+            if session_ids is not None:
+                search_sessions.intersection_update(session_ids)
+            if user_id:
+                search_sessions.intersection_update(self.user_sessions.get(user_id, []))
+            
+            results = []
+            for session_id in search_sessions:
+                session_postings = [term_postings.get(session_id) for term_postings in postings]
+                if not all(session_postings):
+                    continue
+                session_postings.sort(key=len)
+                others = [{msg.message_id for msg in messages} for messages in session_postings[1:]]
+                results.extend(
+                    msg for msg in session_postings[0]
+                    if all(msg.message_id in ids for ids in others)
+                )
+            
+            # Sort by timestamp (most recent first)
+            results.sort(key=lambda x: x.timestamp or datetime.min, reverse=True)
+            
+            logging.debug("Term search found %d messages", len(results))
+            return results[:limit]
+            
+        except Exception as e:
+            logging.error(f"Error searching messages by terms: {e}")
+            return []
+    
     async def cleanup_old_sessions(self, older_than_days: int) -> int:
         """Clean up sessions older than specified days."""
         try:
@@ -226,5 +317,6 @@ class InMemoryStore(BaseMemoryStore):
         return {
             "total_sessions": len(self.sessions),
             "total_messages": total_messages,
-            "total_users": len(self.user_sessions)
+            "total_users": len(self.user_sessions),
+            "indexed_terms": len(self.term_index)
         }
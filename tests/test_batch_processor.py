@@ -0,0 +1,115 @@
+"""
+Tests for concurrent batch execution.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from vianexus_agent_sdk.clients.batch_processor import BatchProcessor
+
+
+class FakeClient:
+    """Persistent-client stand-in that records connections and question start times."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.is_connected = False
+        self.connects = 0
+        self.closes = 0
+        self.started = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def establish_persistent_connection(self):
+        self.connects += 1
+        self.is_connected = True
+
+    async def close_persistent_connection(self):
+        self.closes += 1
+        self.is_connected = False
+
+    async def ask_single_question(self, question: str) -> str:
+        self.started.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on and self.fail_on in question:
+                raise RuntimeError(f"failed: {question}")
+            return question.upper()
+        finally:
+            self.in_flight -= 1
+
+
+class TestBatchProcessor:
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            BatchProcessor(FakeClient(), max_concurrency=0)
+        with pytest.raises(ValueError):
+            BatchProcessor(FakeClient(), rate_limit=0)
+
+    def test_empty_batch(self):
+        client = FakeClient()
+        assert asyncio.run(BatchProcessor(client).run_batch("x", [])) == []
+        assert client.connects == 0
+
+    def test_results_keep_input_order(self):
+        client = FakeClient()
+
+        async def task(client, item):
+            # Later inputs finish first
+            await asyncio.sleep(0.01 * (5 - item))
+            return item * 10
+
+        results = asyncio.run(BatchProcessor(client).run_batch(task, [0, 1, 2, 3, 4]))
+        assert results == [0, 10, 20, 30, 40]
+
+    def test_string_task_is_prepended_to_each_input(self):
+        results = asyncio.run(BatchProcessor(FakeClient()).run_batch("say", ["a", "b"]))
+        assert results == ["SAY\n\nA", "SAY\n\nB"]
+
+    def test_failure_is_returned_in_its_slot(self):
+        results = asyncio.run(BatchProcessor(FakeClient(fail_on="bad")).run_batch("q", ["ok", "bad", "fine"]))
+        assert results[0] == "Q\n\nOK"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "Q\n\nFINE"
+
+    def test_concurrency_is_capped(self):
+        client = FakeClient(delay=0.01)
+        asyncio.run(BatchProcessor(client, max_concurrency=2).run_batch("q", list(range(8))))
+        assert client.max_in_flight == 2
+
+    def test_rate_limit_spaces_out_starts(self):
+        client = FakeClient()
+        # 600 per minute -> one start every 0.1s
+        asyncio.run(BatchProcessor(client, rate_limit=600).run_batch("q", list(range(4))))
+        gaps = [later - earlier for earlier, later in zip(client.started, client.started[1:])]
+        assert all(gap >= 0.09 for gap in gaps)
+
+    def test_progress_callback(self):
+        calls = []
+        processor = BatchProcessor(FakeClient())
+        asyncio.run(processor.run_batch("q", ["a", "b", "c"], on_progress=lambda done, total: calls.append((done, total))))
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_failing_progress_callback_does_not_fail_batch(self):
+        def on_progress(done, total):
+            raise ValueError("callback error")
+
+        results = asyncio.run(BatchProcessor(FakeClient()).run_batch("q", ["a"], on_progress=on_progress))
+        assert results == ["Q\n\nA"]
+
+    def test_opens_and_closes_connection_when_not_connected(self):
+        client = FakeClient()
+        asyncio.run(BatchProcessor(client).run_batch("q", ["a"]))
+        assert (client.connects, client.closes) == (1, 1)
+
+    def test_leaves_existing_connection_open(self):
+        client = FakeClient()
+        client.is_connected = True
+        asyncio.run(BatchProcessor(client).run_batch("q", ["a"]))
+        assert (client.connects, client.closes) == (0, 0)
+        assert client.is_connected
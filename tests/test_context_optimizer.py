@@ -0,0 +1,153 @@
+"""
+Tests for the Gemini context window optimizers.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, List, Optional
+
+from vianexus_agent_sdk.clients.context_optimizer import (
+    PruneToolsOptimizer,
+    SlidingWindowOptimizer,
+    estimate_tokens,
+)
+
+
+# Minimal stand-ins for google.genai Content / Part / FunctionCall / FunctionResponse,
+# exposing the attributes and model_copy the optimizers use
+
+class _Model:
+    def model_copy(self, update: Optional[dict] = None):
+        return replace(self, **(update or {}))
+
+
+@dataclass
+class FunctionCall(_Model):
+    name: str
+    args: Any = None
+
+
+@dataclass
+class FunctionResponse(_Model):
+    name: str
+    response: Any = None
+
+
+@dataclass
+class Part(_Model):
+    text: Optional[str] = None
+    function_call: Optional[FunctionCall] = None
+    function_response: Optional[FunctionResponse] = None
+
+
+@dataclass
+class Content(_Model):
+    role: str
+    parts: List[Part]
+
+
+def user(text: str) -> Content:
+    return Content("user", [Part(text=text)])
+
+
+def model(text: str) -> Content:
+    return Content("model", [Part(text=text)])
+
+
+def call(name: str = "lookup") -> Content:
+    return Content("model", [Part(function_call=FunctionCall(name, {"q": "x"}))])
+
+
+def response(payload: str, name: str = "lookup") -> Content:
+    return Content("user", [Part(function_response=FunctionResponse(name, {"result": payload}))])
+
+
+def assert_well_formed(messages: List[Content]):
+    """Every window must open on a user turn and keep each response after its call."""
+    assert messages[0].role == "user"
+    assert not messages[0].parts[0].function_response
+    for index, message in enumerate(messages):
+        if message.parts[0].function_response:
+            assert messages[index - 1].parts[0].function_call
+
+
+class TestEstimateTokens:
+    def test_counts_text_calls_and_responses(self):
+        history = [user("a" * 40), call(), response("b" * 400)]
+        assert estimate_tokens(history) > estimate_tokens(history[:2]) > estimate_tokens(history[:1]) == 10
+
+
+class TestSlidingWindowOptimizer:
+    def test_under_budget_is_untouched(self):
+        history = [user("hi"), model("hello")] * 10
+        optimized, stats = SlidingWindowOptimizer(keep_recent=4).optimize(history, target_tokens=10_000)
+        assert optimized is history
+        assert not stats["optimized"]
+
+    def test_keeps_recent_messages_when_over_budget(self):
+        history = [turn for i in range(10) for turn in (user(f"q{i}"), model(f"a{i}"))]
+        optimized, stats = SlidingWindowOptimizer(keep_recent=4).optimize(history, target_tokens=1)
+        assert optimized == history[-4:]
+        assert stats["optimized"]
+        assert stats["kept_messages"] == 4
+
+    def test_does_not_open_on_function_response(self):
+        history = [user("old"), model("old answer"), user("question"), call(), response("data"), model("answer")]
+        optimized, _ = SlidingWindowOptimizer(keep_recent=2).optimize(history)
+        assert optimized == history[2:]
+        assert_well_formed(optimized)
+
+    def test_does_not_open_on_function_call(self):
+        history = [user("old"), model("old answer"), user("question"), call(), response("data"), model("answer")]
+        optimized, _ = SlidingWindowOptimizer(keep_recent=3).optimize(history)
+        assert optimized == history[2:]
+        assert_well_formed(optimized)
+
+    def test_steps_back_over_chained_calls(self):
+        history = [
+            user("old"), model("old answer"),
+            user("question"), call("a"), response("1", "a"), call("b"), response("2", "b"), model("answer"),
+        ]
+        for keep_recent in range(1, 6):
+            optimized, _ = SlidingWindowOptimizer(keep_recent=keep_recent).optimize(history)
+            assert optimized == history[2:]
+            assert_well_formed(optimized)
+
+    def test_does_not_modify_input(self):
+        history = [user("q"), call(), response("data"), model("answer")] * 3
+        original = list(history)
+        SlidingWindowOptimizer(keep_recent=2).optimize(history)
+        assert history == original
+
+
+class TestPruneToolsOptimizer:
+    def test_under_budget_is_untouched(self):
+        history = [user("q"), call(), response("x" * 10_000), model("a")]
+        optimized, stats = PruneToolsOptimizer().optimize(history, target_tokens=1_000_000)
+        assert optimized is history
+        assert not stats["optimized"]
+
+    def test_truncates_old_responses_only(self):
+        big = "x" * 10_000
+        history = [user("q1"), call(), response(big), model("a1"), user("q2"), call(), response(big), model("a2")]
+        optimized, stats = PruneToolsOptimizer(protect_recent=4, max_output_tokens=10).optimize(history, target_tokens=1)
+
+        old = optimized[2].parts[0].function_response.response["result"]
+        assert old.endswith("... [truncated]")
+        assert len(old) < len(big)
+        assert optimized[6] is history[6]
+        assert stats["estimated_tokens"] < stats["original_tokens"]
+
+    def test_keeps_call_response_pairing(self):
+        big = "x" * 10_000
+        history = [user("q1"), call(), response(big), model("a1"), user("q2"), model("a2")]
+        optimized, _ = PruneToolsOptimizer(protect_recent=1, max_output_tokens=10).optimize(history)
+        assert len(optimized) == len(history)
+        assert [m.role for m in optimized] == [m.role for m in history]
+        assert optimized[2].parts[0].function_response.name == "lookup"
+        assert_well_formed(optimized)
+
+    def test_does_not_modify_input(self):
+        big = "x" * 10_000
+        history = [user("q"), call(), response(big), model("a"), user("q2"), model("a2")]
+        PruneToolsOptimizer(protect_recent=1, max_output_tokens=10).optimize(history)
+        assert history[2].parts[0].function_response.response == {"result": big}
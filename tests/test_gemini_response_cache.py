@@ -0,0 +1,186 @@
+"""
+Tests for GeminiClient's response cache integration.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("google.genai")
+
+from collections import deque
+from types import SimpleNamespace
+
+from vianexus_agent_sdk.clients import gemini_client
+from vianexus_agent_sdk.clients.gemini_client import GeminiClient
+from vianexus_agent_sdk.clients.response_cache import InMemoryResponseCache
+
+
+def make_client(temperature: float = 0, response_cache=True, **config) -> GeminiClient:
+    """Build a GeminiClient with only the attributes the response cache uses."""
+    client = GeminiClient.__new__(GeminiClient)
+    client._model_name = "gemini-2.5-flash"
+    client.system_prompt = "You are helpful."
+    client.temperature = temperature
+    client._response_cache = client._resolve_response_cache({"response_cache": response_cache, **config})
+    client.response_cache_stats = {"hits": 0, "misses": 0}
+    return client
+
+
+class TestResolveResponseCache:
+    def test_disabled_by_default(self):
+        assert make_client(response_cache=None)._response_cache is None
+
+    def test_bypassed_when_temperature_is_not_zero(self):
+        assert make_client(temperature=0.7)._response_cache is None
+
+    def test_in_memory_cache_uses_config_limits(self):
+        cache = make_client(response_cache_size=5, response_cache_ttl=30)._response_cache
+        assert isinstance(cache, InMemoryResponseCache)
+        assert (cache.max_entries, cache.ttl_seconds) == (5, 30)
+
+    def test_custom_backend_is_used_as_is(self):
+        backend = InMemoryResponseCache()
+        assert make_client(response_cache=backend)._response_cache is backend
+
+
+class TestResponseCacheKey:
+    messages = [{"role": "user", "parts": [{"text": "What is AAPL trading at?"}]}]
+
+    def test_no_key_when_cache_disabled(self):
+        assert make_client(temperature=0.7)._response_cache_key(self.messages, None) is None
+
+    def test_same_request_same_key(self):
+        client = make_client()
+        assert client._response_cache_key(self.messages, None) == client._response_cache_key(list(self.messages), None)
+
+    def test_key_covers_messages_and_system_prompt(self):
+        client = make_client()
+        key = client._response_cache_key(self.messages, None)
+
+        other_messages = [{"role": "user", "parts": [{"text": "What is MSFT trading at?"}]}]
+        assert client._response_cache_key(other_messages, None) != key
+
+        client.system_prompt = "You are terse."
+        assert client._response_cache_key(self.messages, None) != key
+
+
+class TestCachedResponses:
+    def test_miss_store_hit(self):
+        client = make_client()
+        key = client._response_cache_key([{"role": "user", "parts": [{"text": "hi"}]}], None)
+
+        async def run():
+            first = await client._get_cached_response(key)
+            await client._store_cached_response(key, "hello")
+            return first, await client._get_cached_response(key)
+
+        assert asyncio.run(run()) == (None, "hello")
+        assert client.response_cache_stats == {"hits": 1, "misses": 1}
+
+    def test_bypass_does_not_count(self):
+        client = make_client(temperature=0.7)
+
+        async def run():
+            await client._store_cached_response(None, "hello")
+            return await client._get_cached_response(None)
+
+        assert asyncio.run(run()) is None
+        assert client.response_cache_stats == {"hits": 0, "misses": 0}
+
+
+class ScriptedModel:
+    """Stand-in for client.aio.models that replays the same turns for every question."""
+
+    def __init__(self, turns):
+        # Each turn is (text, tool_calls); a turn with tool calls is followed by the next one
+        self.turns = turns
+        self.requests = 0
+        self.tool_runs = 0
+
+    def _next(self):
+        turn = self.turns[self.requests % len(self.turns)]
+        self.requests += 1
+        return SimpleNamespace(turn=turn, usage_metadata=None, candidates=None)
+
+    async def generate_content(self, **kwargs):
+        return self._next()
+
+    async def generate_content_stream(self, **kwargs):
+        async def chunks():
+            yield self._next()
+        return chunks()
+
+
+def parse_response(response):
+    text, tool_calls = response.turn
+    content = SimpleNamespace(parts=[SimpleNamespace(function_call=call) for call in tool_calls])
+    return content, text, tool_calls
+
+
+def make_answering_client(turns) -> GeminiClient:
+    """Client whose model, tools and cache key are scripted for the answer paths."""
+    gemini_client._load_genai()
+    client = make_client()
+    model = ScriptedModel(turns)
+    client.client = SimpleNamespace(aio=SimpleNamespace(models=model))
+    client.messages = deque(maxlen=50)
+    client.optimizer = None
+
+    async def no_tools():
+        return None
+
+    async def generation_config(tools):
+        return None
+
+    async def execute_tool_calls(tool_calls):
+        model.tool_runs += 1
+        return []
+
+    client._get_available_tools = no_tools
+    client._prepare_generation_config = generation_config
+    client._execute_tool_calls = execute_tool_calls
+    client._parse_response = parse_response
+    # Same question, same key, regardless of how the history objects serialize
+    client._response_cache_key = lambda contents, tools: "question-key"
+    return client
+
+
+TOOL_TURNS = [("", ["fetch quote"]), ("AAPL is at 200.", [])]
+TEXT_TURNS = [("Hello!", [])]
+
+
+class TestToolTurnsAreNotCached:
+    def test_single_question_without_tools_is_cached(self):
+        client = make_answering_client(TEXT_TURNS)
+
+        async def run():
+            return [await client._ask_single_question_with_session("hi") for _ in range(2)]
+
+        assert asyncio.run(run()) == ["Hello!", "Hello!"]
+        assert client.client.aio.models.requests == 1
+
+    def test_single_question_with_tool_calls_reaches_model_again(self):
+        client = make_answering_client(TOOL_TURNS)
+
+        async def run():
+            return [await client._ask_single_question_with_session("AAPL?") for _ in range(2)]
+
+        assert asyncio.run(run()) == ["AAPL is at 200.", "AAPL is at 200."]
+        assert client.client.aio.models.tool_runs == 2
+        assert client.response_cache_stats["hits"] == 0
+
+    def test_streamed_query_with_tool_calls_reaches_model_again(self):
+        client = make_answering_client(TOOL_TURNS)
+
+        async def run():
+            answers = []
+            for _ in range(2):
+                client.messages.clear()
+                answers.append("".join([chunk async for chunk in client._stream_query_with_session("AAPL?")]))
+            return answers
+
+        assert asyncio.run(run()) == ["AAPL is at 200.", "AAPL is at 200."]
+        assert client.client.aio.models.tool_runs == 2
+        assert client.response_cache_stats["hits"] == 0
@@ -0,0 +1,49 @@
+"""
+Tests for LLM provider detection.
+"""
+
+import logging
+
+import pytest
+
+from vianexus_agent_sdk.clients.llm_client_factory import LLMClientFactory, LLMProvider
+
+
+class TestDetectProvider:
+    def test_explicit_provider(self):
+        assert LLMClientFactory.detect_provider({"provider": "Gemini"}) is LLMProvider.GEMINI
+
+    def test_unknown_explicit_provider(self):
+        with pytest.raises(ValueError):
+            LLMClientFactory.detect_provider({"provider": "unknown"})
+
+    @pytest.mark.parametrize("model, provider", [
+        ("gpt-4o", LLMProvider.OPENAI),
+        ("claude-sonnet-4", LLMProvider.ANTHROPIC),
+        ("Gemini-2.5-flash", LLMProvider.GEMINI),
+    ])
+    def test_model_name(self, model, provider):
+        assert LLMClientFactory.detect_provider({"LLM_MODEL": model}) is provider
+
+    def test_none_api_key_falls_back_to_model(self):
+        # os.getenv() of an unset variable puts None in the config
+        config = {"LLM_MODEL": "gpt-4o", "LLM_API_KEY": None}
+        assert LLMClientFactory.detect_provider(config) is LLMProvider.OPENAI
+
+    def test_none_model_falls_back_to_api_key(self):
+        config = {"LLM_MODEL": None, "LLM_API_KEY": "AIzaSyExample"}
+        assert LLMClientFactory.detect_provider(config) is LLMProvider.GEMINI
+
+    def test_provider_hint_key(self):
+        assert LLMClientFactory.detect_provider({"client_type": "anthropic_client"}) is LLMProvider.ANTHROPIC
+
+    def test_undetectable(self):
+        with pytest.raises(ValueError):
+            LLMClientFactory.detect_provider({"LLM_MODEL": None, "LLM_API_KEY": None})
+
+    def test_logs_detection_on_cached_calls(self, caplog):
+        config = {"LLM_MODEL": "gpt-4o-mini"}
+        with caplog.at_level(logging.INFO):
+            for _ in range(3):
+                LLMClientFactory.detect_provider(config)
+        assert len([r for r in caplog.records if "Provider detected" in r.getMessage()]) == 3
@@ -0,0 +1,93 @@
+"""
+Tests for UniversalMessage serialization.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from vianexus_agent_sdk.memory import BaseMemoryStore, MessageRole, MessageType, UniversalMessage
+
+
+def make_message(**overrides) -> UniversalMessage:
+    fields = dict(
+        role=MessageRole.ASSISTANT,
+        content=[{"type": "text", "text": "AAPL closed at 200."}, {"type": "tool_use", "name": "fetch"}],
+        message_type=MessageType.TOOL_CALL,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5, 678901),
+        session_id="session-1",
+        provider="anthropic",
+        tool_calls=[{"name": "fetch", "input": {"symbols": "AAPL"}}],
+        metadata={"source": "test"},
+    )
+    fields.update(overrides)
+    return UniversalMessage(**fields)
+
+
+class _BinaryStore(BaseMemoryStore):
+    """Store that only exercises the serialization helpers."""
+
+    prefers_binary = True
+
+    save_message = get_conversation_history = save_session = get_session = None
+    update_session_activity = delete_session = search_messages = None
+    cleanup_old_sessions = get_user_sessions = None
+
+
+class TestJsonSerialization:
+    def test_round_trip(self):
+        message = make_message()
+        assert UniversalMessage.from_json(message.to_json()) == message
+
+    def test_omits_unset_fields(self):
+        message = make_message(metadata=None, tool_calls=None)
+        stored = message.to_json()
+        assert '"metadata"' not in stored
+        assert '"user_id"' not in stored
+        assert UniversalMessage.from_json(stored) == message
+
+    def test_keeps_none_content(self):
+        message = make_message(content=None)
+        assert '"content"' in message.to_json()
+        assert UniversalMessage.from_json(message.to_json()).content is None
+
+
+class TestToDict:
+    def test_includes_every_field(self):
+        data = make_message().to_dict()
+        assert data["user_id"] is None
+        assert data["role"] == "assistant"
+        assert data["timestamp"] == "2024-01-02T03:04:05.678901"
+
+    def test_is_deep_copy_by_default(self):
+        message = make_message()
+        data = message.to_dict()
+        data["content"][0]["text"] = "changed"
+        data["metadata"]["source"] = "changed"
+        assert message.content[0]["text"] == "AAPL closed at 200."
+        assert message.metadata == {"source": "test"}
+
+
+class TestMsgpackSerialization:
+    def test_round_trip(self):
+        pytest.importorskip("ormsgpack")
+        message = make_message()
+        payload = message.to_msgpack()
+        assert isinstance(payload, bytes)
+        assert UniversalMessage.from_msgpack(payload) == message
+
+    def test_binary_store_round_trip(self):
+        pytest.importorskip("ormsgpack")
+        store = _BinaryStore()
+        message = make_message()
+        payload = store.serialize_message(message)
+        assert isinstance(payload, bytes)
+        assert store.deserialize_message(payload) == message
+
+    def test_text_store_uses_json(self):
+        message = make_message()
+        store = _BinaryStore()
+        store.prefers_binary = False
+        payload = store.serialize_message(message)
+        assert isinstance(payload, str)
+        assert store.deserialize_message(payload) == message
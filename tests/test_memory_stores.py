@@ -0,0 +1,169 @@
+"""
+Tests for the bundled memory stores.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiofiles")
+
+from vianexus_agent_sdk.memory import ConversationSession, MessageRole, UniversalMessage
+from vianexus_agent_sdk.memory.stores import FileMemoryStore, InMemoryStore
+
+
+@pytest.fixture(params=["in_memory", "file"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileMemoryStore(str(tmp_path / "memory"))
+    return InMemoryStore()
+
+
+def message(session_id: str, text: str, minutes: int = 0, role: MessageRole = MessageRole.USER) -> UniversalMessage:
+    return UniversalMessage(
+        role=role,
+        content=text,
+        session_id=session_id,
+        timestamp=datetime(2024, 1, 1) + timedelta(minutes=minutes),
+    )
+
+
+class TestBulkMessages:
+    def test_save_messages_keeps_order(self, store):
+        messages = [message("s1", f"turn {i}", i) for i in range(5)]
+
+        async def run():
+            assert await store.save_messages(messages)
+            return await store.get_conversation_history("s1")
+
+        history = asyncio.run(run())
+        assert [m.content for m in history] == [f"turn {i}" for i in range(5)]
+        assert [m.message_id for m in history] == [m.message_id for m in messages]
+
+    def test_save_messages_across_sessions(self, store):
+        messages = [message("s1", "a", 0), message("s2", "b", 1), message("s1", "c", 2)]
+
+        async def run():
+            await store.save_session(ConversationSession(session_id="s1"))
+            assert await store.save_messages(messages)
+            return await store.get_messages(["s1", "s2"]), await store.get_session("s1")
+
+        histories, session = asyncio.run(run())
+        assert [m.content for m in histories["s1"]] == ["a", "c"]
+        assert [m.content for m in histories["s2"]] == ["b"]
+        if isinstance(store, InMemoryStore):
+            assert session.message_count == 2
+
+    def test_save_messages_rejects_missing_session_id(self, store):
+        assert not asyncio.run(store.save_messages([message("s1", "a"), message(None, "b")]))
+
+    def test_get_messages_limit_and_unknown_session(self, store):
+        async def run():
+            await store.save_messages([message("s1", f"turn {i}", i) for i in range(5)])
+            return await store.get_messages(["s1", "missing"], limit=2)
+
+        histories = asyncio.run(run())
+        assert list(histories) == ["s1", "missing"]
+        assert [m.content for m in histories["s1"]] == ["turn 3", "turn 4"]
+        assert histories["missing"] == []
+
+
+class TestTermSearch:
+    def populate(self, store):
+        async def run():
+            await store.save_session(ConversationSession(session_id="s1", user_id="alice"))
+            await store.save_session(ConversationSession(session_id="s2", user_id="bob"))
+            await store.save_messages([
+                message("s1", "What is AAPL's price today?", 0),
+                UniversalMessage(
+                    role=MessageRole.ASSISTANT,
+                    content=[{"type": "text", "text": "AAPL price is 200."}, {"type": "tool_use", "name": "fetch"}],
+                    session_id="s1",
+                    timestamp=datetime(2024, 1, 1, 0, 1),
+                ),
+                message("s1", "And MSFT?", 2),
+            ])
+            await store.save_message(message("s2", "aapl earnings news", 3))
+
+        asyncio.run(run())
+
+    def search(self, store, terms, **kwargs):
+        return asyncio.run(store.search_messages_by_terms(terms, **kwargs))
+
+    def test_requires_every_term(self, store):
+        self.populate(store)
+        results = self.search(store, ["AAPL", "price"], session_ids=["s1", "s2"])
+        assert [m.timestamp.minute for m in results] == [1, 0]
+
+    def test_terms_are_normalized(self, store):
+        self.populate(store)
+        assert len(self.search(store, ["Price!", "the", "aapl"], session_ids=["s1"])) == 2
+        assert self.search(store, ["the", "?"], session_ids=["s1"]) == []
+
+    def test_no_match(self, store):
+        self.populate(store)
+        assert self.search(store, ["tsla"], session_ids=["s1", "s2"]) == []
+
+    def test_scoped_to_user(self, store):
+        self.populate(store)
+        results = self.search(store, ["aapl"], user_id="bob")
+        assert [m.content for m in results] == ["aapl earnings news"]
+
+    def test_most_recent_first_and_limit(self, store):
+        self.populate(store)
+        results = self.search(store, ["aapl"], session_ids=["s1", "s2"], limit=2)
+        assert [m.timestamp.minute for m in results] == [3, 1]
+
+    def test_in_memory_index_searches_all_sessions(self):
+        store = InMemoryStore()
+        self.populate(store)
+        assert len(self.search(store, ["aapl"])) == 3
+
+    def test_in_memory_index_is_cleaned_up_on_delete(self):
+        store = InMemoryStore()
+        self.populate(store)
+        asyncio.run(store.delete_session("s1"))
+        assert self.search(store, ["price"]) == []
+        assert "price" not in store.term_index
+        assert [m.session_id for m in self.search(store, ["aapl"])] == ["s2"]
+
+
+class EmbeddingStore(InMemoryStore):
+    """InMemoryStore with a counting stand-in embedding model."""
+
+    embedding_cache_size = 2
+
+    def __init__(self):
+        super().__init__()
+        self.embedded = []
+
+    async def _compute_query_embedding(self, query):
+        self.embedded.append(query)
+        return [float(len(query)), 1.0]
+
+
+class TestQueryEmbeddingCache:
+    def embed(self, store, *queries):
+        async def run():
+            return [await store._embed_query(query) for query in queries]
+
+        return asyncio.run(run())
+
+    def test_store_without_embeddings_returns_none(self):
+        store = InMemoryStore()
+        assert self.embed(store, "aapl", "aapl") == [None, None]
+        assert len(store._embedding_cache) == 0
+
+    def test_repeated_query_is_embedded_once(self):
+        store = EmbeddingStore()
+        first, second = self.embed(store, "aapl price", "aapl price")
+        assert first == second == [10.0, 1.0]
+        assert store.embedded == ["aapl price"]
+
+    def test_least_recently_used_query_is_evicted(self):
+        store = EmbeddingStore()
+        # "a" is used again before "c" arrives, so "b" is evicted
+        self.embed(store, "a", "b", "a", "c", "a", "b")
+        assert store.embedded == ["a", "b", "c", "b"]
+        assert len(store._embedding_cache) == 2
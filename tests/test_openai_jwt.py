@@ -0,0 +1,50 @@
+"""
+Tests for extracting the system prompt from an OpenAI client's software statement JWT.
+"""
+
+import logging
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("openai")
+jwt = pytest.importorskip("jwt")
+
+from vianexus_agent_sdk.clients import openai_client
+from vianexus_agent_sdk.clients.openai_client import OpenAiClient
+
+
+def make_token(claims: dict) -> str:
+    return jwt.encode(claims, "test-signing-key-" + "x" * 32, algorithm="HS256")
+
+
+class TestExtractSystemPromptFromJwt:
+    def test_top_level_and_nested_prompts(self):
+        assert OpenAiClient._extract_system_prompt_from_jwt(make_token({"system_prompt": "top"})) == "top"
+        assert OpenAiClient._extract_system_prompt_from_jwt(make_token({"claims": {"systemPrompt": "nested"}})) == "nested"
+        assert OpenAiClient._extract_system_prompt_from_jwt(make_token({"sub": "no prompt"})) is None
+
+    def test_decode_is_cached_per_token(self, monkeypatch):
+        token = make_token({"system_prompt": "cached"})
+        calls = []
+        decode = jwt.decode
+        monkeypatch.setattr(openai_client.jwt_lib, "decode", lambda *args, **kwargs: calls.append(1) or decode(*args, **kwargs))
+        openai_client._decode_jwt_payload.cache_clear()
+
+        for _ in range(3):
+            assert OpenAiClient._extract_system_prompt_from_jwt(token) == "cached"
+        assert len(calls) == 1
+
+    def test_invalid_token_warns_every_time(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                assert OpenAiClient._extract_system_prompt_from_jwt("not-a-jwt") is None
+        assert len([r for r in caplog.records if "JWT" in r.getMessage()]) == 2
+
+    def test_missing_pyjwt_warns_every_time(self, monkeypatch, caplog):
+        monkeypatch.setattr(openai_client, "jwt_lib", None)
+        token = make_token({"system_prompt": "x"})
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                assert OpenAiClient._extract_system_prompt_from_jwt(token) is None
+        assert len([r for r in caplog.records if "PyJWT" in r.getMessage()]) == 2
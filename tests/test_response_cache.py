@@ -0,0 +1,74 @@
+"""
+Tests for the deterministic-response cache.
+"""
+
+import asyncio
+
+import pytest
+
+from vianexus_agent_sdk.clients import response_cache
+from vianexus_agent_sdk.clients.response_cache import InMemoryResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for TTL tests."""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestInMemoryResponseCache:
+    def test_miss_then_hit(self):
+        cache = InMemoryResponseCache()
+
+        async def run():
+            assert await cache.get("key") is None
+            await cache.set("key", "answer")
+            return await cache.get("key")
+
+        assert asyncio.run(run()) == "answer"
+        assert len(cache) == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = InMemoryResponseCache(ttl_seconds=10)
+        asyncio.run(cache.set("key", "answer"))
+
+        clock[0] += 9.9
+        assert asyncio.run(cache.get("key")) == "answer"
+
+        clock[0] += 0.1
+        assert asyncio.run(cache.get("key")) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryResponseCache(max_entries=2)
+
+        async def run():
+            await cache.set("a", "1")
+            await cache.set("b", "2")
+            # Reading "a" makes "b" the least recently used
+            await cache.get("a")
+            await cache.set("c", "3")
+            return [await cache.get(key) for key in ("a", "b", "c")]
+
+        assert asyncio.run(run()) == ["1", None, "3"]
+        assert len(cache) == 2
+
+    def test_overwrite_refreshes_value(self):
+        cache = InMemoryResponseCache()
+
+        async def run():
+            await cache.set("key", "old")
+            await cache.set("key", "new")
+            return await cache.get("key")
+
+        assert asyncio.run(run()) == "new"
+        assert len(cache) == 1
+
+    def test_clear(self):
+        cache = InMemoryResponseCache()
+        asyncio.run(cache.set("key", "answer"))
+        cache.clear()
+        assert len(cache) == 0
+        assert asyncio.run(cache.get("key")) is None